@@ -0,0 +1,41 @@
+"""Time the compiled extractor specs: full rows versus a narrow projection.
+
+Usage:
+    python benchmarks/extractors.py [N]
+
+Runs N synthetic athletes and games (default 20,000) through the same compiled row functions the
+client uses, once with every field and once with a small `fields=[...]` projection.
+"""
+import sys
+import time
+
+from espnpy.extractors import ATHLETE_SPEC, GAME_SPEC, iter_game_sources
+
+from records_memory import _raw_athlete, _raw_scoreboard
+
+
+def _best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n: int = 20_000):
+    games = list(iter_game_sources(_raw_scoreboard(n)))
+    athletes = [_raw_athlete(i) for i in range(n)]
+
+    print(f"{n:,} rows per shape")
+    for label, spec, sources, projection in (
+        ("athletes", ATHLETE_SPEC, athletes, ("id", "displayName", "jersey")),
+        ("games", GAME_SPEC, games, ("id", "status", "clock")),
+    ):
+        full = _best_of(lambda: list(spec.rows(sources)))
+        narrow = _best_of(lambda: list(spec.rows(sources, projection)))
+        print(f"  {label:<9} full: {full * 1e3:7.1f} ms   {', '.join(projection)}: {narrow * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
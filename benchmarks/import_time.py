@@ -0,0 +1,37 @@
+"""Measure the cold-start cost of `import espnpy` (what CLI tools and Lambda-style workers pay).
+
+Usage:
+    python benchmarks/import_time.py [RUNS]
+
+Every run starts a fresh interpreter, so nothing is cached between runs. Reports the best and median
+time for `import espnpy`, and for the first league access (which creates the default client).
+"""
+import statistics
+import subprocess
+import sys
+
+_SNIPPET = """
+import time
+start = time.perf_counter()
+import espnpy
+imported = time.perf_counter()
+espnpy.nba
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def main(runs: int = 10):
+    imports, first_access = [], []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _SNIPPET], capture_output=True, text=True, check=True).stdout
+        import_time, access_time = map(float, out.split())
+        imports.append(import_time)
+        first_access.append(access_time)
+
+    print(f"{runs} fresh interpreters")
+    for label, times in (("import espnpy", imports), ("first espnpy.nba", first_access)):
+        print(f"  {label:<17} best: {min(times) * 1e3:6.1f} ms   median: {statistics.median(times) * 1e3:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
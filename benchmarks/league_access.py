@@ -0,0 +1,24 @@
+"""Time league attribute resolution (`client.nba`, `client.eng_1`) as used in hot polling loops.
+
+Usage:
+    python benchmarks/league_access.py [N]
+"""
+import sys
+import timeit
+
+from espnpy import ESPNClient
+
+
+def main(n: int = 1_000_000):
+    client = ESPNClient()
+    print(f"{n:,} accesses")
+    for label, statement in (
+        ("client.nba (explicit)", "client.nba"),
+        ("client.eng_1 (dynamic)", "client.eng_1"),
+    ):
+        best = min(timeit.repeat(statement, globals={"client": client}, number=n, repeat=5))
+        print(f"  {label:<24} {best / n * 1e9:6.1f} ns per access")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
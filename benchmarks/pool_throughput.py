@@ -0,0 +1,156 @@
+"""Request throughput of ESPNClient against local mock servers at different pool settings.
+
+Usage:
+    python benchmarks/pool_throughput.py [REQUESTS]
+
+Each mock server runs in its own process (so it doesn't compete with the client for the CPU) and answers every
+GET with a small JSON body after a delay that stands in for ESPN's latency. The client fans REQUESTS (default
+2,000) URLs out through `get_url`, exactly like the athlete/team fan-outs do.
+
+* HTTP/2: the case `connections_per_host` is for. Like ESPN's hosts, the server allows at most 100 concurrent
+  streams per connection, and httpx multiplexes every request to a host over one connection per pool. With
+  `max_concurrency=400` and one pool, 300 of the 400 in-flight requests queue behind the stream cap, so at
+  200 ms per response one connection tops out at 500 req/s. Spreading the requests over several pools
+  (connections) lifts that ceiling, until the client's own CPU becomes the limit. Over a few runs: ~350-420 req/s
+  with 1 connection, ~490-510 with 2, ~550-660 with 4. (The mock speaks cleartext HTTP/2 with prior knowledge,
+  since ESPN's TLS can't be reproduced locally.)
+* HTTP/1.1: each connection carries one request at a time, so here the knobs are the pool size and the
+  concurrency limit. With a 5 ms server the client is CPU-bound long before 10 connections are saturated
+  (they could carry ~2,000 req/s), so bigger pools can't help, and they measurably hurt (~400-460 req/s at 10
+  connections, ~290-350 at 50-100). Whenever a request is queued or finishes, httpcore walks every pooled connection,
+  and checking whether an idle HTTP/1.1 connection has expired polls its socket. So the per-request overhead
+  grows with the number of open connections. That's why the defaults stay at httpx's own (100 connections,
+  20 kept alive, one pool): raise `max_connections`/`connections_per_host` only when the stream cap (HTTP/2)
+  or the connection count (HTTP/1.1) is what requests are actually waiting on.
+"""
+import asyncio
+import multiprocessing
+import sys
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+import httpx
+
+from espnpy import ESPNClient
+
+_BODY = b'{"ok": true}'
+_HTTP1_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(_BODY), _BODY)
+_HTTP1_LATENCY = 0.005
+_HTTP2_LATENCY = 0.2
+_MAX_STREAMS = 100
+
+HTTP1_SETTINGS = (
+    {"max_connections": 10},
+    {"max_connections": 10, "connections_per_host": 4},
+    {"max_connections": 50},
+    {"max_connections": 100, "max_keepalive_connections": 100},
+    {"max_connections": 100, "max_keepalive_connections": 100, "max_concurrency": 100},
+)
+
+HTTP2_SETTINGS = (
+    {"max_concurrency": 400, "connections_per_host": 1},
+    {"max_concurrency": 400, "connections_per_host": 2},
+    {"max_concurrency": 400, "connections_per_host": 4},
+)
+
+
+async def _handle_http1(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            # Read one request (headers only; the client only sends GETs)
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(_HTTP1_LATENCY)
+            writer.write(_HTTP1_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+class _HTTP2Server(asyncio.Protocol):
+    """A minimal HTTP/2 server: every stream gets the JSON body after `_HTTP2_LATENCY` seconds."""
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        self.conn.initiate_connection()
+        self.conn.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: _MAX_STREAMS})
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.get_running_loop().call_later(_HTTP2_LATENCY, self._respond, event.stream_id)
+        self.transport.write(self.conn.data_to_send())
+
+    def _respond(self, stream_id: int) -> None:
+        if self.transport.is_closing():
+            return
+        headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(_BODY)))]
+        self.conn.send_headers(stream_id, headers)
+        self.conn.send_data(stream_id, _BODY, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def _serve(protocol: str, ports: "multiprocessing.Queue[int]") -> None:
+    async def serve() -> None:
+        if protocol == "http2":
+            server = await asyncio.get_running_loop().create_server(_HTTP2Server, "127.0.0.1", 0)
+        else:
+            server = await asyncio.start_server(_handle_http1, "127.0.0.1", 0)
+        ports.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def _start_server(protocol: str) -> "tuple[multiprocessing.Process, int]":
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(protocol, ports), daemon=True)
+    process.start()
+    return process, ports.get(timeout=10)
+
+
+async def _run(port: int, requests: int, settings: dict, http2: bool) -> float:
+    client = ESPNClient(**settings)
+    if http2:
+        # Cleartext HTTP/2 needs prior knowledge (http1=False); ESPN's hosts negotiate it over TLS instead
+        client._new_session = lambda: httpx.AsyncClient(limits=client._limits, timeout=client._timeout, http1=False, http2=True)
+    async with client:
+        urls = [f"http://127.0.0.1:{port}/item/{i}" for i in range(requests)]
+        for _ in range(settings.get("connections_per_host", 1)):
+            await client.get_url(urls[0])  # Open a connection in every pool (requests round-robin) before timing
+        start = time.perf_counter()
+        await asyncio.gather(*(client.get_url(url) for url in urls))
+        return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int = 2_000) -> None:
+    for protocol, latency, all_settings in (
+        ("http2", _HTTP2_LATENCY, HTTP2_SETTINGS),
+        ("http1", _HTTP1_LATENCY, HTTP1_SETTINGS),
+    ):
+        process, port = _start_server(protocol)
+        try:
+            cap = f", {_MAX_STREAMS} streams per connection" if protocol == "http2" else ""
+            print(f"{protocol.upper()}: {requests:,} requests, {latency * 1e3:.0f} ms server latency{cap}")
+            for settings in all_settings:
+                throughput = await _run(port, requests, settings, http2=protocol == "http2")
+                label = ", ".join(f"{key}={value}" for key, value in settings.items())
+                print(f"  {label:<80} {throughput:8.0f} req/s")
+        finally:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000))
@@ -0,0 +1,70 @@
+"""Compare the memory used by the standardized dict output against the slotted record output.
+
+Usage:
+    python benchmarks/records_memory.py [N]
+
+Builds N synthetic athletes and games (default 100,000) through the same row producers the client
+uses, and reports the traced allocation size of each output form.
+"""
+import sys
+import tracemalloc
+
+from espnpy import ESPNClient
+from espnpy.columnar import ATHLETE_SCHEMA, GAME_SCHEMA, build_output
+
+
+def _raw_athlete(n):
+    return {
+        "id": str(n), "slug": f"player-{n}", "firstName": "First", "lastName": f"Last{n}",
+        "fullName": f"First Last{n}", "displayName": f"First Last{n}", "shortName": f"F. Last{n}",
+        "weight": 200.0, "displayWeight": "200 lbs", "height": 78.0, "displayHeight": "6' 6\"",
+        "age": 25, "dateOfBirth": "1999-01-01T08:00Z", "jersey": str(n % 99),
+        "position": {"name": "Guard", "abbreviation": "G"}, "active": True,
+        "headshot": {"href": f"https://a.espncdn.com/i/headshots/nba/players/full/{n}.png"},
+        "team": {"$ref": "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/teams/1?lang=en"},
+    }
+
+
+def _raw_scoreboard(n):
+    return {"events": [{
+        "id": str(n), "name": f"Away at Home {i}", "season": {"year": 2024, "type": 2, "slug": "regular-season"},
+        "competitions": [{
+            "id": str(i), "date": "2024-01-01T00:00Z", "venue": {"fullName": "Arena"},
+            "status": {"type": {"description": "Final"}, "displayClock": "0:00", "period": 4},
+            "broadcasts": [{"names": ["ESPN"]}],
+            "competitors": [
+                {"homeAway": "home", "score": "110", "team": {"id": "1", "displayName": "Home", "logo": "https://a.espncdn.com/home.png"}},
+                {"homeAway": "away", "score": "99", "team": {"id": "2", "displayName": "Away", "logo": "https://a.espncdn.com/away.png"}},
+            ],
+        }],
+    } for i in range(n)]}
+
+
+def _measure(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main(n: int = 100_000):
+    client = ESPNClient()
+    raw_athletes = [_raw_athlete(i) for i in range(n)]
+    raw_scoreboard = _raw_scoreboard(n)
+
+    print(f"{n:,} rows per shape")
+    for label, schema, rows in (
+        ("athletes", ATHLETE_SCHEMA, lambda: (client._athlete_row(a) for a in raw_athletes)),
+        ("games", GAME_SCHEMA, lambda: client._iter_scoreboard_rows(raw_scoreboard)),
+    ):
+        sizes = {}
+        for output in ("dict", "record"):
+            result, sizes[output] = _measure(lambda: build_output(schema, rows(), output))
+            del result
+        saved = 1 - sizes["record"] / sizes["dict"]
+        print(f"  {label:<9} dict: {sizes['dict'] / 1e6:8.1f} MB   record: {sizes['record'] / 1e6:8.1f} MB   ({saved:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
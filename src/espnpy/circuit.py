@@ -0,0 +1,169 @@
+"""Per-host circuit breakers, so one sick ESPN backend can't drag the healthy ones down with it.
+
+Every upstream host (sports.core.api, site.api, site.web.api...) gets its own breaker:
+
+* **closed**: requests flow normally while the recent outcomes are recorded. Too high a failure rate
+  (5xx responses, timeouts and connection errors; 4xx responses count as healthy), or a run of
+  consecutive timeouts, opens the circuit.
+* **open**: requests fail fast with `CircuitOpenError` (or are served a stale copy of their last good
+  response, if `stale_size` is set) instead of waiting out the full timeout and holding a pool slot.
+* **half-open**: once `reset_timeout` has passed, exactly one probe request is let through. Success
+  closes the circuit again, failure re-opens it.
+
+`allow()` hands every request it lets through a `Ticket`, which goes back with its outcome. That way only the
+probe decides the half-open verdict, and requests that were already in flight when the circuit opened can't
+close it, re-open it, or free the probe slot for a second probe when they finally complete.
+"""
+import copy
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class Ticket:
+    """What `allow()` hands out for a request it lets through; pass it back to `record()` or `release()`."""
+
+    __slots__ = ("epoch", "probe")
+
+    def __init__(self, epoch: int, probe: bool = False):
+        self.epoch = epoch  # How many times the circuit had opened when the request was let through
+        self.probe = probe
+
+
+class _Circuit:
+    """The breaker state of one host."""
+
+    __slots__ = ("state", "outcomes", "timeouts", "opened_at", "epoch", "probe")
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)  # True = failure
+        self.timeouts = 0
+        self.opened_at = 0.0
+        self.epoch = 0
+        self.probe: Optional[Ticket] = None  # The half-open probe in flight, if any
+
+
+class CircuitBreaker:
+    """The circuit breaker settings, plus the state of every host they've been applied to.
+
+    Args:
+        failure_rate: Open when at least this share of the recent requests failed. Defaults to 0.5.
+        window: How many recent requests per host the failure rate is computed over. Defaults to 20.
+        min_requests: The failure rate is only trusted after this many requests. Defaults to 10.
+        consecutive_timeouts: Open right away after this many timeouts in a row. Defaults to 3.
+        reset_timeout: Seconds to stay open before a half-open probe is allowed. Defaults to 30.0.
+        stale_size: How many last-good responses (by URL) to keep for serving while a circuit is open.
+                    Defaults to 0 (fail fast instead).
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        consecutive_timeouts: int = 3,
+        reset_timeout: float = 30.0,
+        stale_size: int = 0,
+    ):
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_requests = min_requests
+        self.consecutive_timeouts = consecutive_timeouts
+        self.reset_timeout = reset_timeout
+        self.stale_size = stale_size
+        self._circuits: Dict[str, _Circuit] = {}
+        self._stale: "OrderedDict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any]" = OrderedDict()
+
+    def _circuit(self, host: str) -> _Circuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _Circuit(self.window)
+        return circuit
+
+    def state(self, host: str) -> str:
+        """The current state of a host's circuit: 'closed', 'open' or 'half-open'."""
+        circuit = self._circuit(host)
+        if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return circuit.state
+
+    def retry_after(self, host: str) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        circuit = self._circuit(host)
+        return max(0.0, circuit.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self, host: str) -> Optional[Ticket]:
+        """A ticket if a request to `host` may go out now (claiming the single probe slot when half-open), else None."""
+        circuit = self._circuit(host)
+        if circuit.state == CLOSED:
+            return Ticket(circuit.epoch)
+        if circuit.state == OPEN:
+            if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                return None
+            circuit.state = HALF_OPEN
+        if circuit.probe is not None:
+            return None
+        circuit.probe = Ticket(circuit.epoch, probe=True)
+        return circuit.probe
+
+    def record(self, host: str, failure: bool, timeout: bool = False, ticket: Optional[Ticket] = None) -> None:
+        """Record the outcome of a request that `allow()` let through (with the ticket it got).
+
+        While the circuit is open or half-open, only the probe's outcome counts. Outcomes of requests let
+        through before the circuit last opened are ignored.
+        """
+        circuit = self._circuit(host)
+        if circuit.state != CLOSED:
+            if ticket is None or ticket is not circuit.probe:
+                return
+            circuit.probe = None
+            if failure:
+                self._open(circuit)
+            else:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+                circuit.timeouts = 0
+            return
+        if ticket is not None and ticket.epoch != circuit.epoch:
+            return
+
+        circuit.outcomes.append(failure)
+        circuit.timeouts = circuit.timeouts + 1 if timeout else 0
+        if circuit.state == CLOSED and (
+            circuit.timeouts >= self.consecutive_timeouts
+            or (len(circuit.outcomes) >= self.min_requests and sum(circuit.outcomes) / len(circuit.outcomes) >= self.failure_rate)
+        ):
+            self._open(circuit)
+
+    def release(self, host: str, ticket: Ticket) -> None:
+        """Give back a request's ticket without a verdict (e.g. it was cancelled), freeing the probe slot if it was the probe."""
+        circuit = self._circuit(host)
+        if ticket is circuit.probe:
+            circuit.probe = None
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.timeouts = 0
+        circuit.epoch += 1
+
+    def remember(self, url: str, params: Optional[Dict[str, Any]], data: Any) -> None:
+        """Keep (a copy of) a successful response for serving while the host's circuit is open."""
+        if self.stale_size <= 0:
+            return
+        key = (url, tuple(sorted((params or {}).items())))
+        # Callers are free to edit what they get back, so the kept copy must not share any of it
+        self._stale[key] = copy.deepcopy(data)
+        self._stale.move_to_end(key)
+        if len(self._stale) > self.stale_size:
+            self._stale.popitem(last=False)
+
+    def stale(self, url: str, params: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """A copy of the last good response for this exact request, if one was kept."""
+        if self.stale_size <= 0:
+            return None
+        data = self._stale.get((url, tuple(sorted((params or {}).items()))))
+        return None if data is None else copy.deepcopy(data)
@@ -1,7 +1,105 @@
 import httpx
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+import copy
+import time
+import weakref
+from contextlib import nullcontext
+from datetime import date as Date, datetime, timedelta
+from functools import cached_property
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from .constants import LEAGUE_TO_SPORT
+from .columnar import ATHLETE_SCHEMA, GAME_SCHEMA, NEWS_SCHEMA, PLAY_SCHEMA, STANDING_SCHEMA, TEAM_SCHEMA, build_output, check_output, field_names, project
+from .extractors import (
+    ATHLETE_SPEC, BOX_PLAYER_SPEC, BOX_TEAM_SPEC, GAME_SPEC, LEADERBOARD_SPEC, NEWS_SPEC, ODDS_SPEC, PLAY_SPEC,
+    SUMMARY_FIELDS, SUMMARY_ODDS_SPEC, TEAM_SPEC, Spec, iter_game_sources, iter_standing_sources, standing_sort_value,
+    team_id_from_ref,
+)
+from .circuit import CircuitBreaker
+from .deadlines import deadline
+from .exceptions import CircuitOpenError
+from .export import export_season_boxscores
+from .hedging import HedgePolicy
+from .metrics import MetricsRegistry, endpoint_family
+from .ratelimit import RateLimiter
+from .scheduling import PriorityScheduler, check_priority, current_priority
+from .stats import parse_stats, parse_table
+from .tracing import Tracer, current_span, record_request, span, traced
+from .usage import Usage, active_reports, record_cache_hit, record_done, record_json, record_retry, record_sent, usage
+from .views import LazyView, lazy_views
+
+# Stands in for the rate limit of a client that has none (reusable, and supports `async with`)
+_UNLIMITED = nullcontext()
+# Marks the end of an event ID iterator (None can't, since it's a value the caller may pass)
+_DONE = object()
+
+
+def _check_lazy(output: str, lazy: bool) -> None:
+    """Lazy views replace the dictionaries, so they can't be combined with the other output forms."""
+    if lazy and output != "dict":
+        raise ValueError(f"lazy=True returns views over the raw JSON; it cannot be combined with output='{output}'.")
+
+
+def _section(build: Callable[[], Any]) -> Callable[[Any, Dict[str, Any]], Any]:
+    """Adapt a zero-argument section builder to the `LazyView` getter signature."""
+    return lambda source, memo: build()
+
+
+def _to_date(value: Union[str, Date]) -> Date:
+    """Coerce a 'YYYYMMDD' / 'YYYY-MM-DD' string (or a date object) into a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, Date):
+        return value
+    return datetime.strptime(value.replace("-", ""), "%Y%m%d").date()
+
+
+def _league_aliases(slugs: Iterable[str]) -> Dict[str, str]:
+    """Map pythonic snake_case names to the API's league slugs.
+
+    Hyphenated slugs win over dotted ones (e.g. college_softball -> college-softball, eng_1 -> eng.1),
+    which is the order the names were always resolved in.
+    """
+    aliases: Dict[str, str] = {}
+    for slug in slugs:
+        if "_" not in slug and "." not in slug:
+            aliases[slug.replace("-", "_")] = slug
+    for slug in slugs:
+        if "_" not in slug and "-" not in slug:
+            aliases.setdefault(slug.replace(".", "_"), slug)
+    return aliases
+
+
+class _LoopState:
+    """The HTTP session(s) and concurrency limit (the request scheduler) that belong to one event loop."""
+
+    __slots__ = ("sessions", "session", "scheduler", "closer", "warming", "calendars", "_turn")
+
+    def __init__(self, sessions: List[httpx.AsyncClient], scheduler: PriorityScheduler):
+        self.sessions = sessions
+        self.session = sessions[0]
+        self.scheduler = scheduler
+        self.closer: Optional["asyncio.Task[None]"] = None
+        self.warming: Optional["asyncio.Task[Dict[str, bool]]"] = None
+        # Season calendar downloads in progress, so concurrent first calls for a season share one request
+        self.calendars: Dict[Tuple[str, Optional[str], Optional[Date]], "asyncio.Task[Dict[str, Any]]"] = {}
+        self._turn = 0
+
+    def next_session(self) -> httpx.AsyncClient:
+        """Round-robin over the sessions, so a fan-out spreads evenly across their connections."""
+        if len(self.sessions) == 1:
+            return self.session
+        self._turn = (self._turn + 1) % len(self.sessions)
+        return self.sessions[self._turn]
+
+
+async def _close_on_shutdown(sessions: List[httpx.AsyncClient]) -> None:
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for session in sessions:
+            if not session.is_closed:
+                await session.aclose()
+
 
 class LeagueProxy:
     """A proxy class that allows accessing league endpoints cleanly via dot-notation (e.g. client.nba.teams())."""
@@ -13,13 +111,17 @@ class LeagueProxy:
         """Fetch general information for this league."""
         return await self._client.get_league(self.league)
 
-    async def teams(self, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def teams(self, season: Optional[str] = None, output: str = "dict", fields: Optional[List[str]] = None, timeout_budget: Optional[float] = None) -> Any:
         """Fetch all teams for this league.
         
         Args:
             season: Optional historical season string (e.g. '2016').
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            fields: Optional list of field names to return; extraction for every other field is skipped.
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
         """
-        return await self._client.get_teams(self.league, season=season)
+        return await self._client.get_teams(self.league, season=season, output=output, fields=fields, timeout_budget=timeout_budget)
 
     async def team(self, team_id: str) -> Dict[str, Any]:
         """Fetch general information for a specific team in this league by their ID.
@@ -29,16 +131,18 @@ class LeagueProxy:
         """
         return await self._client.get_team(self.league, team_id)
 
-    async def schedule(self, team_id: str, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def schedule(self, team_id: str, season: Optional[str] = None, output: str = "dict") -> Any:
         """Fetch the full schedule of games for a specific team in this league.
         
         Args:
             team_id: The ID of the team.
             season: The explicit year string (e.g. '2023').
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
         """
-        return await self._client.get_team_schedule(self.league, team_id, season=season)
+        return await self._client.get_team_schedule(self.league, team_id, season=season, output=output)
 
-    async def athletes(self, active: Optional[bool] = None, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def athletes(self, active: Optional[bool] = None, season: Optional[str] = None, output: str = "dict", fields: Optional[List[str]] = None, timeout_budget: Optional[float] = None) -> Any:
         """Fetch all athletes/players for this league.
         
         Args:
@@ -46,8 +150,12 @@ class LeagueProxy:
                     If False, explicitly requests all historical athletes.
                     If None (default), returns whatever the API provides natively.
             season: Optional historical season string (e.g. '2016').
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            fields: Optional list of field names to return; extraction for every other field is skipped.
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
         """
-        return await self._client.get_athletes(self.league, active=active, season=season)
+        return await self._client.get_athletes(self.league, active=active, season=season, output=output, fields=fields, timeout_budget=timeout_budget)
 
     async def athlete(self, athlete_id: str) -> Dict[str, Any]:
         """Fetch details for a specific athlete in this league by their ID.
@@ -57,19 +165,28 @@ class LeagueProxy:
         """
         return await self._client.get_athlete(self.league, athlete_id)
 
-    async def athlete_stats(self, athlete_id: str) -> Dict[str, Any]:
-        """Fetch advanced statistical splits (Home vs Away, Season Totals) for a specific athlete."""
-        return await self._client.get_athlete_stats(self.league, athlete_id)
+    async def athlete_stats(self, athlete_id: str, numeric: bool = False) -> Dict[str, Any]:
+        """Fetch advanced statistical splits (Home vs Away, Season Totals) for a specific athlete.
+        Pass numeric=True to get numbers instead of display strings."""
+        return await self._client.get_athlete_stats(self.league, athlete_id, numeric=numeric)
+
+    async def find_athlete(self, name: str, timeout_budget: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Fuzzy search for an athlete by name (e.g., 'Stephen Curry'). Returns their full profile.
+
+        Args:
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
+        """
+        return await self._client.find_athlete(self.league, name, timeout_budget=timeout_budget)
 
-    async def find_athlete(self, name: str) -> Optional[Dict[str, Any]]:
-        """Fuzzy search for an athlete by name (e.g., 'Stephen Curry'). Returns their full profile."""
-        return await self._client.find_athlete(self.league, name)
+    async def find_team(self, name: str, timeout_budget: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Fuzzy search for a team by name (e.g., 'Falcons'). Returns their full profile.
 
-    async def find_team(self, name: str) -> Optional[Dict[str, Any]]:
-        """Fuzzy search for a team by name (e.g., 'Falcons'). Returns their full profile."""
-        return await self._client.find_team(self.league, name)
+        Args:
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
+        """
+        return await self._client.find_team(self.league, name, timeout_budget=timeout_budget)
 
-    async def scoreboard(self, date: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, limit: int = 1000, raw: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    async def scoreboard(self, date: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, limit: int = 1000, raw: bool = False, output: str = "dict", fields: Optional[List[str]] = None, lazy: bool = False) -> Any:
         """Fetch the scoreboard (schedule, live scores, odds) for a specific date.
         
         Args:
@@ -79,8 +196,50 @@ class LeagueProxy:
             limit: The maximum number of games to return (max 1000).
             raw: If True, returns the massive raw JSON from ESPN. If False (default), 
                  returns a standardized list of flattened game dictionaries.
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            fields: Optional list of field names to return (e.g. ['id', 'status', 'homeScore', 'awayScore']).
+            lazy: If True, returns read-only views that only extract a field when it is first read.
+        """
+        return await self._client.get_scoreboard(self.league, date=date, group=group, season_type=season_type, limit=limit, raw=raw, output=output, fields=fields, lazy=lazy)
+
+    async def scoreboard_range(self, start: Union[str, Date], end: Union[str, Date], group: Optional[str] = None, season_type: Optional[str] = None, chunk_days: int = 7, raw: bool = False, output: str = "dict", timeout_budget: Optional[float] = None) -> Any:
+        """Fetch every game between two dates (inclusive) with a handful of concurrent range requests.
+
+        Args:
+            start: The first date in 'YYYYMMDD' format (or a `datetime.date`).
+            end: The last date in 'YYYYMMDD' format (or a `datetime.date`).
+            group: Optional ESPN group ID filter (e.g. group="50" for full Men's College Basketball).
+            season_type: Optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+            chunk_days: How many days each underlying request covers. Defaults to 7.
+            raw: If True, returns the merged raw JSON events. If False (default), returns standardized games.
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
+        """
+        return await self._client.get_scoreboard_range(self.league, start, end, group=group, season_type=season_type, chunk_days=chunk_days, raw=raw, output=output, timeout_budget=timeout_budget)
+
+    async def calendar(self, season: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch the (cached) season calendar: every game day, or every week for weekly sports.
+        
+        Args:
+            season: Optional season year (e.g. '2024'). Defaults to the current season.
+        """
+        return await self._client.get_season_calendar(self.league, season=season)
+
+    async def season_scoreboard(self, season: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, raw: bool = False, output: str = "dict", timeout_budget: Optional[float] = None) -> Any:
+        """Fetch every game of a season, only querying the dates that actually have games.
+        
+        Args:
+            season: Optional season year (e.g. '2024'). Defaults to the current season.
+            group: Optional ESPN group ID filter (e.g. group="50" for full Men's College Basketball).
+            season_type: Optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+            raw: If True, returns the merged raw JSON events. If False (default), returns standardized games.
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
         """
-        return await self._client.get_scoreboard(self.league, date=date, group=group, season_type=season_type, limit=limit, raw=raw)
+        return await self._client.get_season_scoreboard(self.league, season=season, group=group, season_type=season_type, raw=raw, output=output, timeout_budget=timeout_budget)
 
     async def leaderboard(self, date: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch the live or final leaderboard for a massive-field event (like PGA Golf).
@@ -90,13 +249,42 @@ class LeagueProxy:
         """
         return await self._client.get_leaderboard(self.league, date=date)
 
-    async def game_summary(self, event_id: str) -> Dict[str, Any]:
+    async def game_summary(self, event_id: str, numeric: bool = False, output: str = "dict", fields: Optional[List[str]] = None, lazy: bool = False) -> Mapping[str, Any]:
         """Fetch the detailed game summary (boxscore, play-by-play, odds) for a specific event.
         
         Args:
             event_id: The ID of the game/event.
+            numeric: If True, boxscore stats are parsed into numbers (e.g. FG "5-12" becomes FGM 5 and FGA 12).
+            output: The form of the play-by-play list: 'dict' (default), 'record' (`Play` records), 'arrow' or 'numpy'.
+            fields: Optional list of summary sections to return (e.g. ['id', 'odds']). Defaults to all sections.
+            lazy: If True, returns a read-only view whose sections (and plays) are standardized on first access.
+        """
+        return await self._client.get_game_summary(self.league, event_id, numeric=numeric, output=output, fields=fields, lazy=lazy)
+
+    def game_summaries(self, event_ids: Iterable[str], retries: int = 2, sink: Optional[Callable[[Dict[str, Any]], Any]] = None, errors: Optional[Dict[str, Exception]] = None, numeric: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Concurrently fetch many game summaries, yielding each one as it completes.
+        
+        Example: `async for summary in client.nba.game_summaries(event_ids): ...`
+        
+        Args:
+            event_ids: The IDs of the games/events.
+            retries: How many times to retry a transient failure per event. Defaults to 2.
+            sink: Optional callable (sync or async) invoked with every summary, e.g. a file writer.
+            errors: Optional dictionary that collects `{event_id: exception}` for events that failed.
+            numeric: If True, boxscore stats are parsed into numbers.
+        """
+        return self._client.get_game_summaries(self.league, event_ids, retries=retries, sink=sink, errors=errors, numeric=numeric)
+
+    async def export_boxscores(self, path: str, season: Optional[str] = None, season_type: Optional[str] = None, file_format: str = "parquet") -> Dict[str, Any]:
+        """Export every completed game of a season to partitioned player-game and team-game Parquet files.
+        
+        Args:
+            path: The root output directory.
+            season: Optional season year (e.g. '2024'). Defaults to the current season.
+            season_type: Optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+            file_format: 'parquet' (default) or 'arrow'.
         """
-        return await self._client.get_game_summary(self.league, event_id)
+        return await self._client.export_boxscores(self.league, path, season=season, season_type=season_type, file_format=file_format)
 
     async def odds(self, event_id: str) -> List[Dict[str, Any]]:
         """Fetch betting lines across all sportsbook providers for a specific event.
@@ -106,31 +294,39 @@ class LeagueProxy:
         """
         return await self._client.get_odds(self.league, event_id)
 
-    async def news(self, team_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    async def news(self, team_id: Optional[str] = None, limit: int = 50, output: str = "dict") -> Any:
         """Fetch the latest news headlines for this league.
         
         Args:
             team_id: If provided, filters news down to only a specific team (e.g. '1').
             limit: The maximum number of articles to return (max 100).
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
         """
-        return await self._client.get_news(self.league, team_id=team_id, limit=limit)
+        return await self._client.get_news(self.league, team_id=team_id, limit=limit, output=output)
 
-    async def standings(self, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def standings(self, season: Optional[str] = None, output: str = "dict", fields: Optional[List[str]] = None) -> Any:
         """Fetch the current standings (wins, losses, win percentage) for the league.
         
         Args:
             season: Optional historical season string (e.g. '2016').
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            fields: Optional list of field names to return; extraction for every other field is skipped.
         """
-        return await self._client.get_standings(self.league, season=season)
+        return await self._client.get_standings(self.league, season=season, output=output, fields=fields)
 
-    async def roster(self, team_id: str) -> List[Dict[str, Any]]:
+    async def roster(self, team_id: str, output: str = "dict", timeout_budget: Optional[float] = None) -> Any:
         """Fetch the current roster for a specific team in this league.
         Note: Historical rosters are not supported by the API.
         
         Args:
             team_id: The ID of the team (e.g. '1' for Atlanta Hawks).
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
         """
-        return await self._client.get_team_roster(self.league, team_id)
+        return await self._client.get_team_roster(self.league, team_id, output=output, timeout_budget=timeout_budget)
 
 
 class ESPNClient:
@@ -142,27 +338,204 @@ class ESPNClient:
     SITE_BASE_URL = "https://site.api.espn.com/apis/site/v2"
     # The Fast Live Data (Action: Live Boxscores, Play-by-Play)
     CDN_BASE_URL = "https://cdn.espn.com/core"
-
-    def __init__(self, timeout: float = 10.0, lang: str = "en", region: str = "us"):
+    # Every host the endpoints talk to (search lives on the site host), opened ahead of time by `warmup()`
+    WARMUP_HOSTS = ("sports.core.api.espn.com", "site.api.espn.com", "site.web.api.espn.com")
+
+    _ATHLETE_FIELDS = field_names(ATHLETE_SCHEMA)
+    # Pythonic attribute name -> league slug for every known league, built once at import
+    _LEAGUE_ALIASES = _league_aliases(LEAGUE_TO_SPORT)
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        lang: str = "en",
+        region: str = "us",
+        max_concurrency: int = 50,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        connections_per_host: int = 1,
+        http2: bool = True,
+        warm: bool = False,
+        hedge: Union[bool, HedgePolicy] = False,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
+        rate_limit: Union[bool, float, RateLimiter] = False,
+        interactive_reserve: float = 0.2,
+        metrics: Union[bool, MetricsRegistry] = False,
+        tracer: Union[bool, Tracer] = False,
+    ):
         """Initialize the ESPN Client.
         
         Args:
             timeout (float): The maximum time to wait for a response before timing out. Defaults to 10.0.
             lang (str): The language code for the API response. Defaults to "en".
             region (str): The region code for the API response. Defaults to "us".
+            max_concurrency (int): The maximum number of requests in flight at once across the whole client. Defaults to 50.
+            connect_timeout (float): Separate timeout for establishing a connection (DNS, TCP, TLS). Defaults to `timeout`.
+            read_timeout (float): Separate timeout for waiting on response data. Defaults to `timeout`.
+            max_connections (int): The maximum number of open connections per connection pool (None for no limit). Defaults to 100.
+            max_keepalive_connections (int): How many idle connections each pool keeps alive for reuse. Defaults to 20.
+            keepalive_expiry (float): Seconds an idle connection is kept alive before it's closed. Defaults to 5.0.
+            connections_per_host (int): How many connection pools to spread requests across. With HTTP/2 every
+                request to a host is multiplexed over one connection (capped at ~100 concurrent streams by the
+                server), so wide fan-outs can use e.g. 2-4 to open that many connections per host. Defaults to 1.
+            http2 (bool): Whether to negotiate HTTP/2. Defaults to True.
+            warm (bool): If True, connections to every ESPN host are opened as soon as the client is used in an
+                event loop (and `async with` waits for them), so even the first request skips DNS/TCP/TLS setup.
+                See `warmup()`. Defaults to False.
+            hedge (bool | HedgePolicy): Opt-in hedging for SITE API calls (scoreboards, summaries, news...). A call
+                that is slower than the recent p90 latency gets a second identical request, and the first answer
+                wins. Pass a `HedgePolicy` to tune the percentile and the extra-load budget. Defaults to False.
+            circuit_breaker (bool | CircuitBreaker): Opt-in per-host circuit breakers. A host with a high failure
+                rate (or repeated timeouts) fails fast with `CircuitOpenError` until a single probe request
+                succeeds again, so one degraded ESPN backend doesn't tie up the others. Pass a `CircuitBreaker`
+                to tune the thresholds or to serve stale responses while open. Defaults to False.
+            rate_limit (bool | float | RateLimiter): Opt-in client-side rate limiting with a token bucket per host.
+                A number is the requests per second allowed to each host (True means 10/s); pass a `RateLimiter`
+                to set the burst size or per-host rates, or to share the budget between processes or machines
+                (`SQLiteBackend` / `RedisBackend`). Time spent waiting is recorded on the limiter
+                (`client.rate_limiter.stats()`). Defaults to False.
+            interactive_reserve (float): The share of `max_concurrency` that only interactive requests may use,
+                so a bulk crawl (see `espnpy.scheduling.priority`) can never take the whole pool and queued
+                interactive requests are always dispatched first. Defaults to 0.2.
+            metrics (bool | MetricsRegistry): Opt-in request metrics per endpoint family (counts, latency
+                histograms, bytes, status codes, retries, cache hits and rate limiter waits), available as
+                `client.metrics.to_dict()` or `client.metrics.to_prometheus()`. Pass a `MetricsRegistry` to share
+                one between clients. Defaults to False.
+            tracer (bool | Tracer): Opt-in request-tree tracing. Every call records a span tree (the call, its
+                stages such as pages and `$ref` fetches, and each request with its timing, bytes and cache status),
+                and `client.tracer.last.explain()` prints it with its critical path. Pass a `Tracer` to use your
+                own exporter. Defaults to False.
         """
+        if connections_per_host < 1:
+            raise ValueError("connections_per_host must be at least 1.")
+        if not 0 <= interactive_reserve < 1:
+            raise ValueError("interactive_reserve must be at least 0 and less than 1.")
         self.default_params = {
             "lang": lang,
             "region": region,
         }
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout if connect_timeout is not None else timeout, read=read_timeout if read_timeout is not None else timeout)
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections, keepalive_expiry=keepalive_expiry)
+        self._connections_per_host = connections_per_host
+        self._http2 = http2
+        self._warm = warm
+        self._hedge: Optional[HedgePolicy] = HedgePolicy() if hedge is True else (hedge or None)
+        self._circuit_breaker: Optional[CircuitBreaker] = CircuitBreaker() if circuit_breaker is True else (circuit_breaker or None)
+        if rate_limit is True:
+            rate_limit = RateLimiter()
+        elif rate_limit and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate=rate_limit)
+        self.rate_limiter: Optional[RateLimiter] = rate_limit or None
+        self.metrics: Optional[MetricsRegistry] = MetricsRegistry() if metrics is True else (metrics or None)
+        self.tracer: Optional[Tracer] = Tracer() if tracer is True else (tracer or None)
+        # A single client-wide semaphore so that concurrent fan-outs (teams, athletes, scoreboard ranges)
+        # share one budget instead of each opening 50 connections of their own.
+        self._max_concurrency = max_concurrency
+        self._interactive_reserve = int(max_concurrency * interactive_reserve)
+        # The HTTP session and semaphore are bound to the event loop that uses them, so every loop gets its
+        # own pair (see `_loop_state`). That way the same client (and the module-level `espnpy.nba`) keeps
+        # working, and keeps its pooled connections, across repeated `asyncio.run()` calls.
+        self._loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        # Season calendars per league, fetched once and reused by every multi-date scoreboard operation
+        # (keyed by league, then by each season's (start, end) dates, so re-fetching a season replaces it)
+        self._calendar_cache: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        # Every host this client has sent a request to (in first-use order), which is what `warmup()` opens
+        self._hosts_called: Dict[str, None] = {}
+
+    # ---------------------------------------------------------
+    # Per-Event-Loop Sessions
+    # ---------------------------------------------------------
+
+    def _new_session(self) -> httpx.AsyncClient:
         # Using AsyncClient for concurrent requests without a hardcoded base_url
         # HTTP/2 is often faster for many concurrent small requests
-        self._session = httpx.AsyncClient(
-            timeout=timeout,
+        return httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=self._limits,
             params=self.default_params,
-            http2=True
+            http2=self._http2
         )
 
+    def _loop_state(self) -> "_LoopState":
+        """Return the sessions and scheduler of the running event loop, creating them on first use."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            sessions = [self._new_session() for _ in range(self._connections_per_host)]
+            state = self._loop_states[loop] = _LoopState(sessions, PriorityScheduler(self._max_concurrency, self._interactive_reserve))
+            # Parked until the loop shuts down: asyncio.run() (and asyncio.Runner) cancel every pending task
+            # on exit, which gives the sessions a chance to close their connections inside their own loop.
+            state.closer = loop.create_task(_close_on_shutdown(sessions), name="espnpy-session-closer")
+            # The closer references its loop, so the entry would otherwise keep every dead loop (and its
+            # sessions) alive for as long as the client lives: drop it as soon as the loop has shut down.
+            state.closer.add_done_callback(lambda _task: self._forget_loop(loop, state))
+            if self._warm:
+                state.warming = loop.create_task(self.warmup(), name="espnpy-warmup")
+        return state
+
+    def _forget_loop(self, loop: asyncio.AbstractEventLoop, state: "_LoopState") -> None:
+        if self._loop_states.get(loop) is state:
+            del self._loop_states[loop]
+
+    async def warmup(self, hosts: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """Open pooled connections to ESPN's hosts ahead of the first real request.
+
+        The first request to each host otherwise pays for DNS, TCP, TLS and HTTP/2 setup. After a warmup the
+        connections sit in the pool (for `keepalive_expiry` seconds), so the first user-facing request is as fast
+        as the hundredth. Every one of the client's connection pools (`connections_per_host`) is warmed.
+
+        The warmup requests wait for a concurrency slot and go through the rate limiter (including any shared
+        `max_in_flight` cap) like every other request, so warming never pushes a host over its limits.
+
+        Args:
+            hosts: Optional hostnames to warm. Defaults to the hosts this client has already called (e.g. to
+                   warm a new event loop), or, before its first request, the hosts its endpoints call
+                   (`WARMUP_HOSTS`).
+
+        Returns:
+            `{host: True/False}`, whether a connection to each host could be opened. Failures never raise.
+        """
+        hosts = tuple(hosts or self._hosts_called or self.WARMUP_HOSTS)
+        state = self._loop_state()
+        sessions = state.sessions
+        priority = current_priority()
+
+        async def connect(session: httpx.AsyncClient, host: str) -> bool:
+            url = f"https://{host}/"
+            try:
+                async with state.scheduler.slot(priority), self._rate_limit(url):
+                    # Any response (even a 404) means the connection is up and back in the pool
+                    await session.head(url)
+                return True
+            except httpx.HTTPError:
+                return False
+
+        results = await asyncio.gather(*(connect(session, host) for host in hosts for session in sessions))
+        per_host = len(sessions)
+        return {host: all(results[i * per_host:(i + 1) * per_host]) for i, host in enumerate(hosts)}
+
+    async def report(self, call: Awaitable[Any]) -> Tuple[Any, Usage]:
+        """Await a call and return its result together with what it cost (see `espnpy.usage`).
+
+        Example:
+            athletes, usage = await client.report(client.nfl.athletes())
+            print(usage.requests, usage.bytes, usage.wall_time, usage.peak_concurrency)
+        """
+        with usage() as report:
+            result = await call
+        return result, report
+
+    @property
+    def _session(self) -> httpx.AsyncClient:
+        return self._loop_state().session
+
+    @property
+    def _scheduler(self) -> PriorityScheduler:
+        return self._loop_state().scheduler
+
     # ---------------------------------------------------------
     # Core API Methods
     # ---------------------------------------------------------
@@ -182,9 +555,7 @@ class ESPNClient:
         params = {"query": query, "limit": 15, "type": search_type}
         
         try:
-            response = await self._session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_json(url, params=params)
             
             # The structure returns an array of "type" blocks (like "player", "team")
             for result_block in data.get("results", []):
@@ -204,10 +575,17 @@ class ESPNClient:
         except httpx.HTTPError:
             return None
 
-    async def find_athlete(self, league: str, query: str, sport: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    @traced
+    async def find_athlete(self, league: str, query: str, sport: Optional[str] = None, timeout_budget: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """Fuzzy search for an athlete by name (e.g., 'Stephen Curry').
         Returns their full standardized profile dictionary, or None if not found.
+
+        Args:
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
         """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.find_athlete(league, query, sport=sport)
         athlete_id = await self._search_espn(query, search_type="player", league=league)
         if athlete_id:
             try:
@@ -216,10 +594,17 @@ class ESPNClient:
                 pass
         return None
 
-    async def find_team(self, league: str, query: str, sport: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    @traced
+    async def find_team(self, league: str, query: str, sport: Optional[str] = None, timeout_budget: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """Fuzzy search for a team by name (e.g., 'Falcons').
         Returns their full standardized profile dictionary, or None if not found.
+
+        Args:
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
         """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.find_team(league, query, sport=sport)
         team_id = await self._search_espn(query, search_type="team", league=league)
         if team_id:
             try:
@@ -241,13 +626,14 @@ class ESPNClient:
             )
         return inferred_sport
 
-    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, base_url: str = CORE_BASE_URL) -> Dict[str, Any]:
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, base_url: str = CORE_BASE_URL, priority: Optional[str] = None) -> Dict[str, Any]:
         """A helper method to make GET requests and handle errors across different ESPN domains.
         
         Args:
             endpoint: The API path (e.g. '/sports/football/leagues/nfl').
             params: Optional query parameters.
             base_url: The ESPN domain to hit. Defaults to the Core Entity API.
+            priority: 'interactive' or 'bulk'. Defaults to the surrounding `priority()` block (or 'interactive').
             
         Returns:
             The parsed JSON dictionary from the response.
@@ -256,44 +642,189 @@ class ESPNClient:
         if endpoint.startswith("/"):
             endpoint = endpoint[1:]
         url = f"{base_url}/{endpoint}"
-        
-        response = await self._session.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        # Every SITE call is an idempotent, latency-sensitive GET, so those are the ones worth hedging
+        return await self._fetch_json(url, params=params, hedge=base_url == self.SITE_BASE_URL, priority=priority)
 
-    async def get_url(self, url: str) -> Dict[str, Any]:
-        """Helper to fetch data directly from a full URL, useful for following $ref links."""
-        response = await self._session.get(url)
-        response.raise_for_status()
-        return response.json()
+    async def get_url(self, url: str, priority: Optional[str] = None) -> Dict[str, Any]:
+        """Helper to fetch data directly from a full URL, useful for following $ref links.
+        Pass priority='bulk' to let interactive requests on the same client go first."""
+        return await self._fetch_json(url, priority=priority)
 
+    async def _fetch_json(self, url: str, params: Optional[Dict[str, Any]] = None, hedge: bool = False, priority: Optional[str] = None) -> Dict[str, Any]:
+        """Perform a single GET under the client-wide concurrency limit and return the parsed JSON.
+
+        Every request the client makes goes through here, behind the host's circuit breaker (if enabled).
+        """
+        priority = current_priority() if priority is None else check_priority(priority)
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await self._request_json(url, params, hedge, priority)
+
+        host = url.split("/", 3)[2]
+        ticket = breaker.allow(host)
+        if ticket is None:
+            stale = breaker.stale(url, params)
+            if self.metrics is not None and breaker.stale_size > 0:
+                self.metrics.record_cache(endpoint_family(url), hit=stale is not None)
+            if stale is not None:
+                record_request(url, time.perf_counter(), None, cache="hit")
+                record_cache_hit()
+                return stale
+            raise CircuitOpenError(host, breaker.retry_after(host), request=httpx.Request("GET", url, params=params))
+        try:
+            data = await self._request_json(url, params, hedge, priority)
+        except httpx.HTTPStatusError as e:
+            # 4xx answers (e.g. an unknown ID) mean the host itself is healthy
+            breaker.record(host, failure=e.response.status_code >= 500, ticket=ticket)
+            raise
+        except httpx.TransportError as e:
+            breaker.record(host, failure=True, timeout=isinstance(e, httpx.TimeoutException), ticket=ticket)
+            raise
+        except BaseException:
+            # Cancelled (or a bad payload): no verdict on the host's health
+            breaker.release(host, ticket)
+            raise
+        breaker.record(host, failure=False, ticket=ticket)
+        breaker.remember(url, params, data)
+        return data
+
+    async def _request_json(self, url: str, params: Optional[Dict[str, Any]], hedge: bool, priority: str) -> Dict[str, Any]:
+        state = self._loop_state()
+        self._hosts_called.setdefault(url.split("/", 3)[2])
+        if hedge and self._hedge is not None:
+            response = await self._hedged_get(state, url, params, priority)
+        else:
+            response = await self._send(state, url, params, priority)
+        response.raise_for_status()
+        if not active_reports():
+            return response.json()
+        start = time.perf_counter()
+        data = response.json()
+        record_json(time.perf_counter() - start)
+        return data
+
+    def _rate_limit(self, url: str) -> AsyncContextManager[None]:
+        """The rate limit (if any) a request to `url` has to get through once it holds a concurrency slot.
+
+        The slot comes first, so a request queued in this process neither holds one of the limiter's shared
+        in-flight slots (starving other processes) nor spends a token it can't use yet (which would let a
+        burst above the rate out once local slots free up).
+        """
+        if self.rate_limiter is None:
+            return _UNLIMITED
+        return self.rate_limiter.slot(url.split("/", 3)[2])
+
+    async def _send(self, state: "_LoopState", url: str, params: Optional[Dict[str, Any]], priority: str, hedged: bool = False) -> httpx.Response:
+        """Send one GET (or one attempt of a hedged GET), and record how it went in the metrics, the current
+        trace, any open usage reports and the hedge policy."""
+        metrics = self.metrics
+        reports = active_reports()
+        if metrics is None and not hedged and not reports and current_span() is None:
+            async with state.scheduler.slot(priority), self._rate_limit(url):
+                return await state.next_session().get(url, params=params)
+
+        queued = time.perf_counter()
+        async with state.scheduler.slot(priority):
+            slotted = time.perf_counter()
+            async with self._rate_limit(url):
+                start = time.perf_counter()
+                record_sent(reports)
+                try:
+                    response = await state.next_session().get(url, params=params)
+                except asyncio.CancelledError:
+                    if hedged:
+                        # A cancelled loser took at least this long, which still tells the policy about slow responses
+                        self._hedge.record(time.perf_counter() - start)
+                    record_done(reports, start - queued, time.perf_counter() - start)
+                    record_request(str(httpx.URL(url, params=params)), queued, None, error="cancelled")
+                    raise
+                except Exception as e:
+                    if metrics is not None:
+                        self._record_request(metrics, url, time.perf_counter() - start, start - slotted, "error", 0)
+                    record_done(reports, start - queued, time.perf_counter() - start, error=True)
+                    record_request(str(httpx.URL(url, params=params)), queued, "error", error=type(e).__name__)
+                    raise
+        latency = time.perf_counter() - start
+        if hedged:
+            self._hedge.record(latency)
+        nbytes = len(response.content)
+        if metrics is not None:
+            self._record_request(metrics, url, latency, start - slotted, str(response.status_code), nbytes)
+        record_done(reports, start - queued, latency, nbytes, error=response.status_code >= 400)
+        record_request(str(httpx.URL(url, params=params)), queued, str(response.status_code), nbytes, wait=start - queued)
+        return response
+
+    def _record_request(self, metrics: MetricsRegistry, url: str, latency: float, limiter_wait: float, status: str, nbytes: int) -> None:
+        family = endpoint_family(url)
+        metrics.record_request(family, latency, status, nbytes)
+        if self.rate_limiter is not None:
+            metrics.record_limiter_wait(family, limiter_wait)
+
+    async def _hedged_get(self, state: "_LoopState", url: str, params: Optional[Dict[str, Any]], priority: str) -> httpx.Response:
+        """Send a second attempt if the first is slower than the hedge delay, and return whichever answers first."""
+        policy = self._hedge
+        policy.start()
+        first = asyncio.ensure_future(self._send(state, url, params, priority, hedged=True))
+        attempts = {first}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=policy.delay())
+            if done or not policy.try_hedge():
+                return await first
+            second = asyncio.ensure_future(self._send(state, url, params, priority, hedged=True))
+            attempts.add(second)
+            while True:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is second:
+                            policy.hedge_wins += 1
+                        return attempt.result()
+                if not attempts:
+                    # Both attempts failed: surface the error
+                    return done.pop().result()
+        finally:
+            # The loser (or both attempts, if the caller was cancelled) is cancelled
+            for attempt in attempts:
+                attempt.cancel()
+
+    @traced
     async def get_sports(self, limit: int = 1000) -> Dict[str, Any]:
         """Get the top-level list of all sports."""
         params = {"limit": limit}
         return await self._get("/sports", params=params)
 
+    @traced
     async def get_sport(self, sport: str) -> Dict[str, Any]:
         """Get details for a specific sport (e.g., 'football', 'basketball')."""
         return await self._get(f"/sports/{sport}")
 
-    async def get_leagues(self, sport: str, limit: int = 1000) -> List[Dict[str, Any]]:
+    @traced
+    async def get_leagues(self, sport: str, limit: int = 1000, timeout_budget: Optional[float] = None) -> List[Dict[str, Any]]:
         """Get all leagues for a specific sport and fetch their details concurrently.
         
+        Args:
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
+
         Returns:
             A list of dictionaries containing specific league details: id, name, displayName, 
             abbreviation, shortName, slug, and a single logo href.
         """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.get_leagues(sport, limit=limit)
         params = {"limit": limit}
-        # 1. Fetch the list of references
-        list_response = await self._get(f"/sports/{sport}/leagues", params=params)
-        items = list_response.get("items", [])
+        with span("list"):
+            # 1. Fetch the list of references
+            list_response = await self._get(f"/sports/{sport}/leagues", params=params)
+            items = list_response.get("items", [])
         
         # 2. Extract the $ref URLs
         urls_to_fetch = [item.get("$ref") for item in items if "$ref" in item]
         
-        # 3. Fetch all URLs concurrently using asyncio.gather
-        tasks = [self.get_url(url) for url in urls_to_fetch]
-        raw_leagues = await asyncio.gather(*tasks)
+        with span("refs"):
+            # 3. Fetch all URLs concurrently using asyncio.gather
+            tasks = [self.get_url(url) for url in urls_to_fetch]
+            raw_leagues = await asyncio.gather(*tasks)
         
         # 4. Filter and organize the returned data
         organized_leagues = []
@@ -314,6 +845,7 @@ class ESPNClient:
             
         return organized_leagues
 
+    @traced
     async def get_league(self, league: str, sport: Optional[str] = None) -> Dict[str, Any]:
         """Get details for a specific league within a sport (e.g., league='nfl').
         The sport is automatically inferred for common leagues.
@@ -321,102 +853,94 @@ class ESPNClient:
         resolved_sport = self._resolve_sport(league, sport)
         return await self._get(f"/sports/{resolved_sport}/leagues/{league}")
 
-    async def get_teams(self, league: str, sport: Optional[str] = None, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    @traced
+    async def get_teams(self, league: str, sport: Optional[str] = None, season: Optional[str] = None, output: str = "dict", fields: Optional[List[str]] = None, timeout_budget: Optional[float] = None) -> Any:
         """Get all teams for a specific league, handling pagination automatically.
         The sport is automatically inferred for common leagues.
         
         Args:
             season: Optional year string (e.g. '2016') to fetch historical teams.
+            output: 'dict' (default) for a list of dictionaries, 'record' for compact slotted records
+                    (see `espnpy.records`), 'arrow' for a pyarrow.Table, or 'numpy' for a dictionary of
+                    numpy arrays (one per field).
+            fields: Optional list of field names to return (e.g. ['id', 'displayName']). Extraction for
+                    every other field is skipped entirely. Defaults to all fields.
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
             
         Returns:
-            A standardized list of dictionaries containing team details.
+            A standardized list of dictionaries containing team details (or the requested columnar form).
         """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.get_teams(league, sport=sport, season=season, output=output, fields=fields)
+        check_output(output)
+        schema = project(TEAM_SCHEMA, fields)
         resolved_sport = self._resolve_sport(league, sport)
         
-        # 1. Fetch the first page of references with max limit
-        params = {"limit": 1000, "page": 1}
-        if season: params["season"] = season
+        with span("pages"):
+            # 1. Fetch the first page of references with max limit
+            params = {"limit": 1000, "page": 1}
+            if season: params["season"] = season
         
-        first_page = await self._get(f"/sports/{resolved_sport}/leagues/{league}/teams", params=params)
+            first_page = await self._get(f"/sports/{resolved_sport}/leagues/{league}/teams", params=params)
         
-        items = first_page.get("items", [])
-        page_count = first_page.get("pageCount", 1)
+            items = list(first_page.get("items", []))
+            page_count = first_page.get("pageCount", 1)
         
-        # 2. If there are multiple pages (e.g., > 1000 teams), fetch the remaining pages of URLs
-        if page_count > 1:
-            page_tasks = []
-            for page_idx in range(2, page_count + 1):
-                page_params = {"limit": 1000, "page": page_idx}
-                if season: page_params["season"] = season
-                page_tasks.append(self._get(f"/sports/{resolved_sport}/leagues/{league}/teams", params=page_params))
+            # 2. If there are multiple pages (e.g., > 1000 teams), fetch the remaining pages of URLs
+            if page_count > 1:
+                page_tasks = []
+                for page_idx in range(2, page_count + 1):
+                    page_params = {"limit": 1000, "page": page_idx}
+                    if season: page_params["season"] = season
+                    page_tasks.append(self._get(f"/sports/{resolved_sport}/leagues/{league}/teams", params=page_params))
                 
-            additional_pages = await asyncio.gather(*page_tasks)
-            for page in additional_pages:
-                items.extend(page.get("items", []))
+                additional_pages = await asyncio.gather(*page_tasks)
+                for page in additional_pages:
+                    items.extend(page.get("items", []))
                 
         # 3. Extract all $ref URLs
         urls_to_fetch = [item.get("$ref") for item in items if "$ref" in item]
         
-        # 4. Fetch all individual team URLs concurrently, but use a Semaphore to avoid connection pool timeouts.
-        #    ESPN and httpx.AsyncClient can be overwhelmed by 300+ simultaneous connection requests.
-        semaphore = asyncio.Semaphore(50)  # Limit to 50 concurrent requests at a time
+        with span("refs"):
+            # 4. Fetch all individual team URLs concurrently. The client-wide semaphore keeps us from
+            #    overwhelming ESPN and httpx.AsyncClient with 300+ simultaneous connection requests.
+            raw_teams = await asyncio.gather(*[self.get_url(url) for url in urls_to_fetch])
         
-        async def fetch_with_semaphore(url):
-            async with semaphore:
-                return await self.get_url(url)
-                
-        team_tasks = [fetch_with_semaphore(url) for url in urls_to_fetch]
-        raw_teams = await asyncio.gather(*team_tasks)
-        
-        # 5. Standardize the resulting team dictionaries
-        organized_teams = []
-        for team in raw_teams:
-            logos = team.get("logos", [])
-            logo_href = logos[0].get("href") if logos else None
-            
-            organized_teams.append({
-                "id": team.get("id"),
-                "slug": team.get("slug"),
-                "location": team.get("location"),
-                "name": team.get("name"),
-                "nickname": team.get("nickname"),  # Note: Some sports omit nickname
-                "abbreviation": team.get("abbreviation"),
-                "displayName": team.get("displayName"),
-                "shortDisplayName": team.get("shortDisplayName"),
-                "color": team.get("color"),
-                "alternateColor": team.get("alternateColor"),
-                "isActive": team.get("isActive", True),
-                "logo": logo_href
-            })
-            
-        return organized_teams
+        # 5. Standardize the resulting teams (only extracting the requested fields)
+        return build_output(schema, TEAM_SPEC.rows(raw_teams, field_names(schema)), output)
 
-    def _standardize_boxscore(self, box_data: Dict[str, Any], game_id: str) -> Dict[str, Any]:
-        """Flatten the nested ESPN boxscore JSON into cleanly organized team and player dictionaries."""
+    def _standardize_boxscore(self, box_data: Dict[str, Any], game_id: str, numeric: bool = False, sport: Optional[str] = None) -> Dict[str, Any]:
+        """Flatten the nested ESPN boxscore JSON into cleanly organized team and player dictionaries.
+        
+        If `numeric` is True, stat display strings are parsed into numbers column by column using
+        the sport's stat schema (e.g. FG "5-12" becomes FGM 5 and FGA 12).
+        """
         if not box_data:
             return {}
             
         # Standardize Teams
+        team_row = BOX_TEAM_SPEC.compile()
         teams_list = []
         for team_data in box_data.get("teams", []):
-            t_info = team_data.get("team", {})
             stats_dict = {}
             for s in team_data.get("statistics", []):
                 label = s.get("label") or s.get("name")
                 val = s.get("displayValue")
                 if label:
                     stats_dict[label] = val
+            if numeric:
+                stats_dict = parse_stats(stats_dict, sport)
                     
             teams_list.append({
                 "gameId": game_id,
-                "id": t_info.get("id"),
-                "name": t_info.get("displayName"),
-                "abbreviation": t_info.get("abbreviation"),
-                "logo": t_info.get("logo"),
+                **dict(zip(BOX_TEAM_SPEC.names, team_row(team_data))),
                 "stats": stats_dict
             })
             
         # Standardize Players
+        player_fields = BOX_PLAYER_SPEC.names[1:]  # Everything after the id
+        player_row = BOX_PLAYER_SPEC.compile(player_fields)
         players_dict = {}
         for team_roster in box_data.get("players", []):
             t_info = team_roster.get("team", {})
@@ -425,8 +949,15 @@ class ESPNClient:
             for category in team_roster.get("statistics", []):
                 cat_name = category.get("name")
                 labels = category.get("labels", [])
+                athletes = category.get("athletes", [])
+                
+                # Parse the whole category at once (one parser per label column) instead of value by value
+                if numeric:
+                    labels, stat_rows = parse_table(labels, [ath.get("stats", []) for ath in athletes], sport)
+                else:
+                    stat_rows = [ath.get("stats", []) for ath in athletes]
                 
-                for ath in category.get("athletes", []):
+                for ath, stat_values in zip(athletes, stat_rows):
                     a_info = ath.get("athlete", {})
                     a_id = a_info.get("id")
                     
@@ -438,17 +969,11 @@ class ESPNClient:
                             "gameId": game_id,
                             "id": a_id,
                             "teamId": team_id,
-                            "name": a_info.get("displayName"),
-                            "shortName": a_info.get("shortName"),
-                            "starter": ath.get("starter", False),
-                            "jersey": a_info.get("jersey"),
-                            "position": a_info.get("position", {}).get("abbreviation") or a_info.get("position", {}).get("name"),
-                            "headshot": a_info.get("headshot", {}).get("href"),
+                            **dict(zip(player_fields, player_row(ath))),
                             "stats": {}
                         }
                     
                     # Zip the labels and values
-                    stat_values = ath.get("stats", [])
                     zipped_stats = dict(zip(labels, stat_values))
                     
                     if cat_name:
@@ -462,6 +987,7 @@ class ESPNClient:
             "players": list(players_dict.values())
         }
 
+    @traced
     async def get_leaderboard(self, league: str, sport: Optional[str] = None, date: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch the live or final leaderboard for a massive-field event (like PGA Golf).
         
@@ -480,37 +1006,16 @@ class ESPNClient:
             
         raw_data = await self._get(f"sports/{resolved_sport}/{league}/scoreboard", params=params, base_url=self.SITE_BASE_URL)
         
-        leaderboard = []
+        golfers = []
         for event in raw_data.get("events", []):
-            tournament_name = event.get("name")
-            status = event.get("status", {}).get("type", {}).get("description")
-            
             comp = event.get("competitions", [])[0] if event.get("competitions") else {}
-            venue = comp.get("venue", {}).get("fullName")
-            
             for idx, golfer in enumerate(comp.get("competitors", []), 1):
-                athlete = golfer.get("athlete", {})
-                
-                # Round scores
-                linescores = golfer.get("linescores", [])
-                rounds = [str(int(r.get("value"))) for r in linescores if r.get("value")]
-                
-                leaderboard.append({
-                    "tournamentName": tournament_name,
-                    "status": status,
-                    "venue": venue,
-                    "id": athlete.get("id"),
-                    "name": athlete.get("displayName"),
-                    "flag": athlete.get("flag", {}).get("href"),
-                    "rank": str(idx),
-                    "scoreToPar": golfer.get("score") or "E",
-                    "rounds": rounds,
-                    "totalStrokes": golfer.get("statistics", [{}])[0].get("displayValue") if golfer.get("statistics") else sum([int(r) for r in rounds]) if rounds else 0
-                })
-                
-        return leaderboard
+                golfers.append({"event": event, "competition": comp, "golfer": golfer, "rank": idx})
+
+        return LEADERBOARD_SPEC.dicts(golfers)
 
-    async def get_scoreboard(self, league: str, date: Optional[str] = None, sport: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, limit: int = 1000, raw: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    @traced
+    async def get_scoreboard(self, league: str, date: Optional[str] = None, sport: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, limit: int = 1000, raw: bool = False, output: str = "dict", fields: Optional[List[str]] = None, lazy: bool = False) -> Any:
         """Fetch the scoreboard (schedule, live scores, odds) for a specific date.
         
         Args:
@@ -524,10 +1029,21 @@ class ESPNClient:
             limit: Maximum number of games to return. Defaults to 1000 to ensure full slates are captured.
             raw: If True, returns the massive raw JSON from ESPN. If False (default), 
                  returns a standardized list of flattened game dictionaries.
+            output: 'dict' (default) for a list of dictionaries, 'record' for compact slotted records
+                    (see `espnpy.records`), 'arrow' for a pyarrow.Table, or 'numpy' for a dictionary of
+                    numpy arrays (one per field). Ignored when raw=True.
+            fields: Optional list of field names to return (e.g. ['id', 'status', 'homeScore', 'awayScore', 'clock']).
+                    Extraction for every other field is skipped entirely. Defaults to all fields.
+            lazy: If True, returns read-only `LazyView` mappings over the raw JSON instead of dictionaries.
+                  Each field is only extracted when it is first read (then memoized), which is the cheapest
+                  option for pollers that look at a few fields per game. Use `view.materialize()` for a dict.
             
         Returns:
-            A list of standardized game dictionaries, or the raw JSON dictionary if raw=True.
+            A list of standardized game dictionaries (or the requested columnar form), or the raw JSON dictionary if raw=True.
         """
+        check_output(output)
+        _check_lazy(output, lazy)
+        project(GAME_SCHEMA, fields)  # Fail fast on unknown fields, before any request is made
         resolved_sport = self._resolve_sport(league, sport)
         params = {"limit": limit}
         if date:
@@ -543,192 +1059,426 @@ class ESPNClient:
         if raw:
             return raw_data
             
-        return self._standardize_scoreboard(raw_data)
+        if lazy:
+            # The eager path skips games it can't extract. Views only extract on access, so they skip games that
+            # aren't objects at all, and a field that can't be extracted from a malformed game reads as None.
+            games = (game for game in iter_game_sources(raw_data) if isinstance(game["competition"], dict))
+            return lazy_views(GAME_SPEC, games, fields, tolerant=True)
+        return self._standardize_scoreboard(raw_data, output, fields)
 
-    def _standardize_scoreboard(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Flatten the massive, nested ESPN scoreboard JSON into a clean list of games."""
-        games = []
-        for event in raw_data.get("events", []):
-            try:
-                # Team sports and Racing use "competitions" directly on the event
-                if "competitions" in event:
-                    competitions = event.get("competitions", [])
-                # Tennis uses "groupings" which contain the "competitions" (matches)
-                elif "groupings" in event:
-                    competitions = []
-                    for grouping in event.get("groupings", []):
-                        competitions.extend(grouping.get("competitions", []))
-                else:
-                    competitions = []
+    @traced
+    async def get_scoreboard_range(self, league: str, start: Union[str, Date], end: Union[str, Date], sport: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, chunk_days: int = 7, limit: int = 1000, skip_empty: bool = True, raw: bool = False, output: str = "dict", timeout_budget: Optional[float] = None) -> Any:
+        """Fetch every game between two dates (inclusive) using ESPN's `dates=YYYYMMDD-YYYYMMDD` range form.
 
-                for competition in competitions:
-                    status_obj = competition.get("status", {})
-                    season_obj = event.get("season", {})
-                    
-                    # Basic Info. Fallback to event name if competition doesn't have one (Tennis)
-                    game_id = competition.get("id") or event.get("id")
-                    date = competition.get("date") or event.get("date")
-                    name = competition.get("name") or event.get("name")
-                    tournament_name = event.get("name") # Usually the overall event/tournament
-                    short_name = competition.get("shortName") or event.get("shortName")
-                    
-                    # Season Info
-                    season_year = season_obj.get("year")
-                    season_type = season_obj.get("type")
-                    season_slug = season_obj.get("slug")
-                    
-                    # Status (e.g., "Scheduled", "Final", "3rd Quarter")
-                    status = status_obj.get("type", {}).get("description")
-                    clock = status_obj.get("displayClock")
-                    period = status_obj.get("period")
-                    
-                    # Venue and TV Networks
-                    venue = competition.get("venue", {}).get("fullName")
-                    broadcasts = [b.get("names", [])[0] for b in competition.get("broadcasts", []) if b.get("names")]
-                    
-                    # Teams and Scores
-                    home_team, home_team_id, home_score, home_logo = None, None, None, None
-                    away_team, away_team_id, away_score, away_logo = None, None, None, None
-                    home_linescores, away_linescores = [], []
-                    
-                    for idx, comp in enumerate(competition.get("competitors", [])):
-                        # Competitor can be a team or an athlete
-                        team_info = comp.get("team") or comp.get("athlete") or {}
-                        t_name = team_info.get("displayName")
-                        t_id = team_info.get("id")
-                        t_logo = team_info.get("logo") or team_info.get("headshot", {}).get("href") if isinstance(team_info.get("headshot"), dict) else team_info.get("flag", {}).get("href")
-                        
-                        # Set Scores / Linescores (e.g., [6.0, 6.0])
-                        linescores = comp.get("linescores", [])
-                        ls_values = [str(int(ls.get("value", 0))) for ls in linescores] if linescores else []
-                        
-                        # Main Score (Overall wins or sets won)
-                        # In Tennis, comp.get("score") is usually null, so we sum the 'winner: true' linescores
-                        score_raw = comp.get("score")
-                        if score_raw is None and linescores:
-                            score_raw = sum(1 for ls in linescores if ls.get("winner"))
-                            if not score_raw and status == "Final": # fallback if winner boolean isn't set perfectly
-                                score_raw = ls_values[-1] if ls_values else "0"
-                        
-                        if isinstance(score_raw, dict):
-                            score = score_raw.get("displayValue")
-                        else:
-                            score = str(score_raw) if score_raw is not None else None
-                        
-                        # For Team sports
-                        if comp.get("homeAway") == "home":
-                            home_team, home_team_id, home_score, home_logo, home_linescores = t_name, t_id, score, t_logo, ls_values
-                        elif comp.get("homeAway") == "away":
-                            away_team, away_team_id, away_score, away_logo, away_linescores = t_name, t_id, score, t_logo, ls_values
-                        # For Individual sports (Tennis/Racing) where home/away is null
-                        else:
-                            if idx == 0:
-                                home_team, home_team_id, home_score, home_logo, home_linescores = t_name, t_id, score, t_logo, ls_values
-                            elif idx == 1:
-                                away_team, away_team_id, away_score, away_logo, away_linescores = t_name, t_id, score, t_logo, ls_values
-
-                    # Format linescores into a readable string (e.g., "6-3, 6-4")
-                    set_scores = ""
-                    if home_linescores and away_linescores and len(home_linescores) == len(away_linescores):
-                        set_scores = ", ".join([f"{h}-{a}" for h, a in zip(home_linescores, away_linescores)])
-
-                    games.append({
-                        "id": game_id,
-                        "date": date,
-                        "name": name,
-                        "tournamentName": tournament_name, # Specifically added for Tennis/Golf
-                        "shortName": short_name,
-                        "seasonYear": season_year,
-                        "seasonType": season_type,
-                        "seasonSlug": season_slug,
-                        "status": status,
-                        "clock": clock,
-                        "period": period,
-                        "venue": venue,
-                        "broadcasts": broadcasts,
-                        "homeTeam": home_team,
-                        "homeTeamId": home_team_id,
-                        "homeScore": home_score,
-                        "homeLogo": home_logo,
-                        "awayTeam": away_team,
-                        "awayTeamId": away_team_id,
-                        "awayScore": away_score,
-                        "awayLogo": away_logo,
-                        "setScores": set_scores # Specificially added for Tennis/Volleyball
+        The range is split into chunks of `chunk_days` which are fetched concurrently. If a chunk comes back
+        with `limit` games (meaning ESPN may have truncated it), it is split in half and re-fetched.
+        Games that appear in more than one chunk are only returned once.
+
+        When `skip_empty` is True, the league's (cached) season calendar is used to only query the days or
+        weeks that actually have games, so off-days and the off-season cost nothing.
+
+        Args:
+            league: The league (e.g., 'nba').
+            start: The first date, as 'YYYYMMDD' or a `datetime.date`.
+            end: The last date (inclusive), as 'YYYYMMDD' or a `datetime.date`.
+            sport: Automatically inferred if not provided.
+            group: An optional ESPN group ID to filter the games (e.g., group="50" for all D1 basketball).
+            season_type: An optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+            chunk_days: How many game days each range request covers. Defaults to 7 (a full NBA season is ~25 requests).
+            limit: The maximum number of games ESPN returns per request. Defaults to 1000.
+            skip_empty: If True (default), skips dates the season calendar says have no games.
+            raw: If True, returns a raw-style dictionary with the merged `events` list. If False (default),
+                 returns a standardized list of flattened game dictionaries.
+            output: 'dict' (default), 'record' (`Game` records), 'arrow' or 'numpy'. Ignored when raw=True.
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
+
+        Returns:
+            A list of standardized game dictionaries, or a raw dictionary with `leagues` and `events` if raw=True.
+        """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.get_scoreboard_range(league, start, end, sport=sport, group=group, season_type=season_type, chunk_days=chunk_days, limit=limit, skip_empty=skip_empty, raw=raw, output=output)
+        check_output(output)
+        resolved_sport = self._resolve_sport(league, sport)
+        start_date, end_date = _to_date(start), _to_date(end)
+        if end_date < start_date:
+            raise ValueError(f"The end date ({end_date}) must not be before the start date ({start_date}).")
+        if chunk_days < 1:
+            raise ValueError("chunk_days must be at least 1.")
+
+        params: Dict[str, Any] = {"limit": limit}
+        if group:
+            params["groups"] = group
+        if season_type:
+            params["seasontype"] = season_type
+
+        # Only query the days/weeks that have games. If the calendar is unavailable, query every day.
+        spans = await self._game_spans(resolved_sport, league, start_date, end_date) if skip_empty else None
+        if spans is None:
+            spans = [(start_date, end_date)]
+        chunks = self._chunk_spans(spans, chunk_days)
+
+        chunk_results = await asyncio.gather(*[
+            self._fetch_scoreboard_chunk(resolved_sport, league, chunk_start, chunk_end, params, limit)
+            for chunk_start, chunk_end in chunks
+        ])
+
+        # Merge the chunks in date order, de-duplicating games that straddle a chunk boundary
+        leagues_block = []
+        events = []
+        seen_ids = set()
+        for chunk in chunk_results:
+            if not leagues_block:
+                leagues_block = chunk.get("leagues", [])
+            for event in chunk.get("events", []):
+                event_id = event.get("id")
+                if event_id is not None:
+                    if event_id in seen_ids:
+                        continue
+                    seen_ids.add(event_id)
+                events.append(event)
+
+        merged = {"leagues": leagues_block, "events": events}
+        if raw:
+            return merged
+
+        return self._standardize_scoreboard(merged, output)
+
+    async def _fetch_scoreboard_chunk(self, resolved_sport: str, league: str, start: Date, end: Date, params: Dict[str, Any], limit: int) -> Dict[str, Any]:
+        """Fetch one date-range chunk of a scoreboard, bisecting it if ESPN hit the `limit` cap."""
+        chunk_params = dict(params)
+        chunk_params["dates"] = f"{start:%Y%m%d}" if start == end else f"{start:%Y%m%d}-{end:%Y%m%d}"
+        raw_data = await self._get(f"sports/{resolved_sport}/{league}/scoreboard", params=chunk_params, base_url=self.SITE_BASE_URL)
+
+        # A full page means ESPN may have dropped games, so split the chunk and try again
+        if len(raw_data.get("events", [])) >= limit and start < end:
+            midpoint = start + (end - start) // 2
+            first_half, second_half = await asyncio.gather(
+                self._fetch_scoreboard_chunk(resolved_sport, league, start, midpoint, params, limit),
+                self._fetch_scoreboard_chunk(resolved_sport, league, midpoint + timedelta(days=1), end, params, limit),
+            )
+            return {
+                "leagues": first_half.get("leagues") or second_half.get("leagues", []),
+                "events": first_half.get("events", []) + second_half.get("events", []),
+            }
+
+        return raw_data
+
+    @staticmethod
+    def _chunk_spans(spans: List[Any], chunk_days: int) -> List[Any]:
+        """Group (start, end) date spans into request chunks covering at most `chunk_days` game days each.
+
+        Gaps between spans (off-days) are free, so a chunk can stretch over a long break without
+        adding requests.
+        """
+        chunks = []
+        chunk_start, chunk_end, weight = None, None, 0
+        for span_start, span_end in spans:
+            # Split spans that are longer than a single chunk (e.g. an unknown calendar)
+            piece_start = span_start
+            while piece_start <= span_end:
+                piece_end = min(piece_start + timedelta(days=chunk_days - 1), span_end)
+                piece_weight = (piece_end - piece_start).days + 1
+                if chunk_start is not None and weight + piece_weight > chunk_days:
+                    chunks.append((chunk_start, chunk_end))
+                    chunk_start, weight = None, 0
+                if chunk_start is None:
+                    chunk_start = piece_start
+                chunk_end = piece_end
+                weight += piece_weight
+                piece_start = piece_end + timedelta(days=1)
+        if chunk_start is not None:
+            chunks.append((chunk_start, chunk_end))
+        return chunks
+
+    @traced
+    async def get_season_calendar(self, league: str, season: Optional[str] = None, sport: Optional[str] = None, date: Optional[Union[str, Date]] = None) -> Dict[str, Any]:
+        """Fetch the season calendar (every game day, or every week for weekly sports) for a league.
+
+        Calendars are cached on the client, so each season is only downloaded once.
+
+        Args:
+            league: The league (e.g., 'nfl').
+            season: Optional season year (e.g. '2024'). Looked up via the CORE season document.
+            sport: Automatically inferred if not provided.
+            date: Optional date ('YYYYMMDD') whose season calendar should be returned. Ignored if `season` is given.
+
+        Returns:
+            A dictionary with the calendar type ('day' or 'list'), the season's start and end dates (as 'YYYYMMDD'),
+            a `dates` list of game days for daily sports, and a `weeks` list for weekly sports (like the NFL).
+        """
+        resolved_sport = self._resolve_sport(league, sport)
+        target_date = _to_date(date) if date and not season else None
+
+        # Serve from the cache if we already know this season (or a season covering this date)
+        lookup_date = target_date or (Date.today() if not season else None)
+        for calendar in self._calendar_cache.get(league, {}).values():
+            if (season and str(calendar.get("seasonYear")) == str(season)) or (
+                lookup_date and calendar["startDate"] <= f"{lookup_date:%Y%m%d}" <= calendar["endDate"]
+            ):
+                if self.metrics is not None:
+                    self.metrics.record_cache("scoreboard", hit=True)
+                record_request(f"{self.SITE_BASE_URL}/sports/{resolved_sport}/{league}/scoreboard", time.perf_counter(), None, cache="hit")
+                record_cache_hit()
+                # Callers get their own copy, so editing it can't corrupt the cache
+                return copy.deepcopy(calendar)
+        if self.metrics is not None:
+            self.metrics.record_cache("scoreboard", hit=False)
+
+        # Join a download of the same calendar that's already under way rather than sending a second one.
+        # The download runs as its own task, so one caller being cancelled doesn't fail the others.
+        state = self._loop_state()
+        key = (league, str(season) if season else None, target_date)
+        fetch = state.calendars.get(key)
+        if fetch is None:
+            fetch = state.calendars[key] = asyncio.ensure_future(self._fetch_season_calendar(league, resolved_sport, season, target_date))
+
+            def done(task: "asyncio.Task[Dict[str, Any]]") -> None:
+                del state.calendars[key]
+                if not task.cancelled():
+                    task.exception()  # Retrieved, even if every caller was cancelled before it finished
+
+            fetch.add_done_callback(done)
+        return copy.deepcopy(await asyncio.shield(fetch))
+
+    async def _fetch_season_calendar(self, league: str, resolved_sport: str, season: Optional[str], target_date: Optional[Date]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": 1}
+        if season:
+            # The CORE season document tells us when the season starts, so we can ask the scoreboard for that day
+            season_info = await self._get(f"/sports/{resolved_sport}/leagues/{league}/seasons/{season}")
+            season_start = season_info.get("startDate")
+            if season_start:
+                params["dates"] = season_start[:10].replace("-", "")
+        elif target_date:
+            params["dates"] = f"{target_date:%Y%m%d}"
+
+        raw_data = await self._get(f"sports/{resolved_sport}/{league}/scoreboard", params=params, base_url=self.SITE_BASE_URL)
+        leagues = raw_data.get("leagues", [])
+        calendar = self._standardize_calendar(league, leagues[0] if leagues else {})
+        if season and calendar.get("seasonYear") is None:
+            calendar["seasonYear"] = int(season) if str(season).isdigit() else season
+
+        if calendar["startDate"] and calendar["endDate"]:
+            self._calendar_cache.setdefault(league, {})[(calendar["startDate"], calendar["endDate"])] = calendar
+        return calendar
+
+    def _standardize_calendar(self, league: str, league_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten the `leagues[].calendar` block of a scoreboard response into game days or weeks."""
+        def to_ymd(value: Optional[str]) -> Optional[str]:
+            return value[:10].replace("-", "") if value else None
+
+        calendar_type = league_data.get("calendarType")
+        start_date = to_ymd(league_data.get("calendarStartDate"))
+        end_date = to_ymd(league_data.get("calendarEndDate"))
+        raw_calendar = league_data.get("calendar", [])
+
+        dates: List[str] = []
+        weeks: List[Dict[str, Any]] = []
+        if calendar_type == "list":
+            # Weekly sports (NFL, College Football) list season types, each with their weeks
+            for section in raw_calendar:
+                for entry in section.get("entries", []):
+                    weeks.append({
+                        "label": entry.get("label"),
+                        "seasonType": section.get("value"),
+                        "week": entry.get("value"),
+                        "startDate": to_ymd(entry.get("startDate")),
+                        "endDate": to_ymd(entry.get("endDate")),
                     })
+        elif calendar_type == "day":
+            listed = sorted({to_ymd(d) for d in raw_calendar if isinstance(d, str)})
+            if league_data.get("calendarIsWhitelist", True):
+                dates = listed
+            elif start_date and end_date:
+                # A blacklist calendar lists the days WITHOUT games
+                day, last = _to_date(start_date), _to_date(end_date)
+                blacklist = set(listed)
+                while day <= last:
+                    if f"{day:%Y%m%d}" not in blacklist:
+                        dates.append(f"{day:%Y%m%d}")
+                    day += timedelta(days=1)
+
+        return {
+            "league": league,
+            "seasonYear": league_data.get("season", {}).get("year"),
+            "calendarType": calendar_type,
+            "startDate": start_date,
+            "endDate": end_date,
+            "dates": dates,
+            "weeks": weeks,
+        }
+
+    async def _game_spans(self, resolved_sport: str, league: str, start: Date, end: Date) -> Optional[List[Any]]:
+        """Return the (start, end) spans within a date range that have games, according to the season calendars.
+
+        Returns None if no usable calendar is available, in which case callers should query every day.
+        """
+        spans = []
+        cursor = start
+        while cursor <= end:
+            calendar = await self.get_season_calendar(league, sport=resolved_sport, date=cursor)
+            if calendar.get("calendarType") not in ("day", "list") or not calendar["startDate"] or not calendar["endDate"]:
+                return None
+
+            calendar_start, calendar_end = _to_date(calendar["startDate"]), _to_date(calendar["endDate"])
+            if calendar_end < cursor:
+                # ESPN returned a calendar for an earlier season, so it can't tell us anything about this range
+                return None
+            if calendar_start > cursor:
+                # Nothing is scheduled between the cursor and the start of the next season
+                cursor = calendar_start
+                continue
+
+            window_end = min(end, calendar_end)
+            if calendar["calendarType"] == "day":
+                for day in calendar["dates"]:
+                    game_day = _to_date(day)
+                    if cursor <= game_day <= window_end:
+                        spans.append((game_day, game_day))
+            else:
+                for week in calendar["weeks"]:
+                    if not week["startDate"] or not week["endDate"]:
+                        continue
+                    week_start = max(_to_date(week["startDate"]), cursor)
+                    week_end = min(_to_date(week["endDate"]), window_end)
+                    if week_start <= week_end:
+                        spans.append((week_start, week_end))
+
+            cursor = calendar_end + timedelta(days=1)
+
+        spans.sort()
+        return spans
+
+    @traced
+    async def get_season_scoreboard(self, league: str, season: Optional[str] = None, sport: Optional[str] = None, group: Optional[str] = None, season_type: Optional[str] = None, chunk_days: int = 7, raw: bool = False, output: str = "dict", timeout_budget: Optional[float] = None) -> Any:
+        """Fetch every game of a season, only querying the days/weeks on the league's calendar.
+
+        Args:
+            league: The league (e.g., 'nfl').
+            season: Optional season year (e.g. '2024'). Defaults to the current season.
+            sport: Automatically inferred if not provided.
+            group: An optional ESPN group ID to filter the games.
+            season_type: An optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+            chunk_days: How many game days each range request covers. Defaults to 7.
+            raw: If True, returns a raw-style dictionary with the merged `events` list.
+            output: 'dict' (default), 'record' (`Game` records), 'arrow' or 'numpy'. Ignored when raw=True.
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
+
+        Returns:
+            A list of standardized game dictionaries, or a raw dictionary if raw=True.
+        """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.get_season_scoreboard(league, season=season, sport=sport, group=group, season_type=season_type, chunk_days=chunk_days, raw=raw, output=output)
+        check_output(output)
+        resolved_sport = self._resolve_sport(league, sport)
+        calendar = await self.get_season_calendar(league, season=season, sport=resolved_sport)
+        if not calendar["startDate"] or not calendar["endDate"]:
+            raise ValueError(f"Could not determine the season calendar for {league}.")
+
+        start, end = calendar["startDate"], calendar["endDate"]
+        if season_type and calendar["weeks"]:
+            # For weekly sports we can narrow the range down to the requested season type
+            phase_weeks = [w for w in calendar["weeks"] if str(w["seasonType"]) == str(season_type) and w["startDate"]]
+            if phase_weeks:
+                start = min(w["startDate"] for w in phase_weeks)
+                end = max(w["endDate"] for w in phase_weeks)
+
+        return await self.get_scoreboard_range(league, start, end, sport=resolved_sport, group=group, season_type=season_type, chunk_days=chunk_days, raw=raw, output=output)
+
+    def _standardize_scoreboard(self, raw_data: Dict[str, Any], output: str = "dict", fields: Optional[List[str]] = None) -> Any:
+        """Flatten the massive, nested ESPN scoreboard JSON into a clean list of games."""
+        schema = project(GAME_SCHEMA, fields)
+        return build_output(schema, self._iter_scoreboard_rows(raw_data, schema), output)
+
+    def _iter_scoreboard_rows(self, raw_data: Dict[str, Any], schema: Any = GAME_SCHEMA) -> Iterable[tuple]:
+        """Yield one value tuple (in schema order) per competition on the scoreboard.
+        Only the schema's fields are extracted, so e.g. broadcasts and linescores are skipped when not requested."""
+        make_row = GAME_SPEC.compile(field_names(schema))
+
+        for game in iter_game_sources(raw_data):
+            try:
+                row = make_row(game)
             except Exception:
                 # If a game's JSON is malformed, skip it rather than crashing the whole scoreboard
-                pass
-                
-        return games
+                continue
+            yield row
 
-    async def get_game_summary(self, league: str, event_id: str, sport: Optional[str] = None) -> Dict[str, Any]:
+    @traced
+    async def get_game_summary(self, league: str, event_id: str, sport: Optional[str] = None, numeric: bool = False, output: str = "dict", fields: Optional[List[str]] = None, lazy: bool = False) -> Mapping[str, Any]:
         """Fetch the detailed game summary (boxscore, play-by-play, odds) for a specific event.
         
         Args:
             league: The league (e.g., 'nba').
             event_id: The unique ID of the game/event.
             sport: Automatically inferred if not provided.
+            numeric: If True, boxscore stats are parsed into numbers (e.g. FG "5-12" becomes FGM 5 and FGA 12,
+                     MIN "38:21" becomes 38.35 and "--" becomes None) so they are ready for arithmetic.
+            output: The form of the play-by-play list: 'dict' (default), 'record' (`Play` records),
+                    'arrow' or 'numpy'.
+            fields: Optional list of summary sections to return (e.g. ['id', 'odds', 'plays']). Sections that
+                    are not requested (like the boxscore) are never standardized. Defaults to all sections.
+            lazy: If True, returns a read-only `LazyView` instead of a dictionary: each section is only
+                  standardized when it is first read, and `plays` is a list of lazy views (one per play).
+                  Use `summary.materialize()` for plain dictionaries.
             
         Returns:
-            A dictionary containing the standardized game summary data.
+            A dictionary containing the standardized game summary data. Its `id` is the requested event ID, so
+            that summaries from `get_game_summaries` can be matched to their events (earlier versions had no `id`).
         """
+        check_output(output)
+        _check_lazy(output, lazy)
+        unknown = [name for name in (fields or ()) if name not in SUMMARY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available fields: {', '.join(SUMMARY_FIELDS)}.")
         resolved_sport = self._resolve_sport(league, sport)
         params = {"event": event_id}
         
         # Game Summary lives on the SITE API
         raw_data = await self._get(f"sports/{resolved_sport}/{league}/summary", params=params, base_url=self.SITE_BASE_URL)
         
-        # Standardize the output
-        boxscore = self._standardize_boxscore(raw_data.get("boxscore", {}), event_id)
-        
-        # Extract betting odds safely
+        # Each section is only standardized if it was requested
+        sections = {
+            "id": lambda: event_id,
+            "gameInfo": lambda: raw_data.get("gameInfo", {}),
+            "boxscore": lambda: self._standardize_boxscore(raw_data.get("boxscore", {}), event_id, numeric=numeric, sport=resolved_sport),
+            "odds": lambda: self._summary_odds(raw_data),
+            "plays": lambda: lazy_views(PLAY_SPEC, raw_data.get("plays", [])) if lazy else self._summary_plays(raw_data, output),
+            "scoringPlays": lambda: raw_data.get("scoringPlays", []),
+            "keyEvents": lambda: self._summary_key_events(raw_data),
+            "rosters": lambda: self._summary_rosters(raw_data),
+            "videos": lambda: raw_data.get("videos", []),
+            "articles": lambda: raw_data.get("article", {}),
+        }
+        if lazy:
+            return LazyView(raw_data, {name: _section(sections[name]) for name in (fields or SUMMARY_FIELDS)})
+        return {name: sections[name]() for name in (fields or SUMMARY_FIELDS)}
+
+    def _summary_odds(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Extract the primary (consensus) betting odds safely
         pickcenter = raw_data.get("pickcenter", [])
-        odds = {}
-        if pickcenter:
-            primary_odds = pickcenter[0]
-            odds = {
-                "provider": primary_odds.get("provider", {}).get("name", "Unknown"),
-                "details": primary_odds.get("details"),
-                "overUnder": primary_odds.get("overUnder"),
-                "spread": primary_odds.get("spread")
-            }
-            
+        return SUMMARY_ODDS_SPEC.dicts(pickcenter[:1])[0] if pickcenter else {}
+
+    def _summary_plays(self, raw_data: Dict[str, Any], output: str = "dict") -> Any:
         # Standardize Play-by-Play
-        plays = []
-        for play in raw_data.get("plays", []):
-            plays.append({
-                "id": play.get("id"),
-                "text": play.get("text"),
-                "clock": play.get("clock", {}).get("displayValue"),
-                "period": play.get("period", {}).get("number"),
-                "scoringPlay": play.get("scoringPlay", False),
-                "scoreValue": play.get("scoreValue")
-            })
-            
-        summary_dict = {
-            "gameInfo": raw_data.get("gameInfo", {}),
-            "boxscore": boxscore,
-            "odds": odds,
-            "plays": plays,
-            "scoringPlays": raw_data.get("scoringPlays", []),
-            "keyEvents": [],
-            "rosters": [],
-            "videos": raw_data.get("videos", []),
-            "articles": raw_data.get("article", {})
-        }
-        
+        return build_output(PLAY_SCHEMA, PLAY_SPEC.rows(raw_data.get("plays", [])), output)
+
+    def _summary_key_events(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         # Standardize Soccer-specific / Hockey-specific blocks
-        for event in raw_data.get("keyEvents", []):
-            summary_dict["keyEvents"].append({
+        return [
+            {
                 "id": event.get("id"),
                 "text": event.get("text"),
                 "shortText": event.get("shortText"),
                 "type": event.get("type", {}).get("text"),
                 "clock": event.get("clock", {}).get("displayValue"),
                 "teamId": event.get("team", {}).get("id")
-            })
-            
+            }
+            for event in raw_data.get("keyEvents", [])
+        ]
+
+    def _summary_rosters(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rosters = []
         for roster_block in raw_data.get("rosters", []):
             team_info = roster_block.get("team", {})
             roster_list = []
@@ -745,16 +1495,121 @@ class ESPNClient:
                     "cards": p.get("cards", []) # Array of red/yellow card details
                 })
                 
-            summary_dict["rosters"].append({
+            rosters.append({
                 "teamId": team_info.get("id"),
                 "team": team_info.get("displayName"),
                 "formation": roster_block.get("formation"),
                 "players": roster_list
             })
+        return rosters
+
+    async def get_game_summaries(self, league: str, event_ids: Iterable[str], sport: Optional[str] = None, retries: int = 2, backoff: float = 0.5, sink: Optional[Callable[[Dict[str, Any]], Any]] = None, errors: Optional[Dict[str, Exception]] = None, numeric: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch many game summaries concurrently, yielding each standardized summary as soon as it completes.
+
+        Only a bounded window of events is in flight at any time (the client's `max_concurrency`), so it is
+        safe to pass thousands of event IDs. Summaries are yielded in completion order, so use each
+        summary's `id` to match it back to its event.
+
+        Example:
+            async for summary in client.get_game_summaries("nba", event_ids):
+                print(summary["id"], len(summary["plays"]))
+
+        Args:
+            league: The league (e.g., 'nba').
+            event_ids: Any iterable of event IDs (consumed lazily).
+            sport: Automatically inferred if not provided.
+            retries: How many times to retry an event after a timeout, connection error, 429 or 5xx. Defaults to 2.
+            backoff: The base delay in seconds between retries (doubled after every attempt). Defaults to 0.5.
+            sink: Optional callable invoked with every summary (e.g. a file or database writer). May be async.
+            errors: Optional dictionary that collects `{event_id: exception}` for events that still failed
+                    after all retries. Failed events are skipped so that the rest of the batch completes.
+            numeric: If True, boxscore stats are parsed into numbers (see `get_game_summary`).
+
+        Yields:
+            Standardized game summary dictionaries (identical to `get_game_summary()`).
+        """
+        resolved_sport = self._resolve_sport(league, sport)
+
+        async def fetch(event_id: str):
+            try:
+                summary = await self._with_retries(lambda: self.get_game_summary(league, event_id, sport=resolved_sport, numeric=numeric), retries, backoff, family="summary")
+                return event_id, summary, None
+            except (httpx.HTTPError, ValueError) as e:
+                return event_id, None, e
+
+        remaining = iter(event_ids)
+        pending = set()
+        try:
+            while True:
+                # Keep the window topped up without ever materializing thousands of tasks at once
+                while len(pending) < self._max_concurrency:
+                    event_id = next(remaining, _DONE)
+                    if event_id is _DONE:
+                        break
+                    pending.add(asyncio.ensure_future(fetch(str(event_id))))
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    event_id, summary, error = task.result()
+                    if error is not None:
+                        if errors is not None:
+                            errors[event_id] = error
+                        continue
+                    if sink is not None:
+                        result = sink(summary)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    yield summary
+        finally:
+            # If the caller stops iterating early (or something failed), don't leave orphaned requests running.
+            # Waiting for the cancellations to land releases their concurrency slots before we return.
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    @traced
+    async def export_boxscores(self, league: str, path: str, season: Optional[str] = None, season_type: Optional[str] = None, sport: Optional[str] = None, event_ids: Optional[Iterable[str]] = None, batch_size: int = 250, file_format: str = "parquet") -> Dict[str, Any]:
+        """Export every completed game of a season to partitioned player-game and team-game Parquet files.
+        Requires the optional `pyarrow` dependency (`pip install espnpy[arrow]`).
+        
+        Args:
+            league: The league (e.g., 'nba').
+            path: The root output directory.
+            season: Optional season year (e.g. '2024'). Defaults to the current season.
+            season_type: Optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+            sport: Automatically inferred if not provided.
+            event_ids: Optional explicit list of event IDs to export instead of walking the whole season.
+            batch_size: How many games to buffer in memory before writing a part file. Defaults to 250.
+            file_format: 'parquet' (default) or 'arrow' (Arrow IPC / Feather v2).
             
-        return summary_dict
+        Returns:
+            A dictionary with the number of games and rows written and the files created per table.
+        """
+        return await export_season_boxscores(self, league, path, season=season, season_type=season_type, sport=sport, event_ids=event_ids, batch_size=batch_size, file_format=file_format)
 
-    async def get_news(self, league: str, team_id: Optional[str] = None, sport: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    async def _with_retries(self, make_call: Callable[[], Awaitable[Any]], retries: int, backoff: float = 0.5, family: str = "other") -> Any:
+        """Run `make_call()`, retrying transient failures (timeouts, connection errors, 429s and 5xx) with exponential backoff.
+        Retries are counted under the endpoint `family` in the client's metrics."""
+        for attempt in range(retries + 1):
+            try:
+                return await make_call()
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if attempt >= retries or (status != 429 and status < 500):
+                    raise
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+            if self.metrics is not None:
+                self.metrics.record_retry(family)
+            record_retry()
+            await asyncio.sleep(backoff * (2 ** attempt))
+
+    @traced
+    async def get_news(self, league: str, team_id: Optional[str] = None, sport: Optional[str] = None, limit: int = 50, output: str = "dict") -> Any:
         """Fetch the latest news articles and headlines for a specific league or team.
         
         Args:
@@ -762,10 +1617,12 @@ class ESPNClient:
             team_id: Optional. The specific team ID to filter news for (e.g., '1' for Falcons).
             sport: Automatically inferred if not provided.
             limit: Maximum number of articles to return. Defaults to 50.
+            output: 'dict' (default), 'record' (`NewsArticle` records), 'arrow' or 'numpy'.
             
         Returns:
             A standardized list of dictionary objects representing news articles.
         """
+        check_output(output)
         resolved_sport = self._resolve_sport(league, sport)
         params = {"limit": limit}
         if team_id:
@@ -774,45 +1631,27 @@ class ESPNClient:
         # News lives on the SITE API
         raw_data = await self._get(f"sports/{resolved_sport}/{league}/news", params=params, base_url=self.SITE_BASE_URL)
         
-        organized_news = []
-        for article in raw_data.get("articles", []):
-            # Try to grab the largest image/thumbnail available
-            image_url = None
-            images = article.get("images", [])
-            if images:
-                image_url = images[0].get("url")
-                
-            # Safely grab the first web link
-            link_url = None
-            links = article.get("links", {}).get("web", {})
-            if links:
-                link_url = links.get("href") or links.get("short", {}).get("href")
-
-            organized_news.append({
-                "id": article.get("id", ""),
-                "headline": article.get("headline", ""),
-                "description": article.get("description", ""),
-                "published": article.get("published", ""),
-                "lastModified": article.get("lastModified", ""),
-                "author": article.get("byline", ""),
-                "premium": article.get("premium", False), # Is it an ESPN+ exclusive article?
-                "image": image_url,
-                "url": link_url
-            })
-            
-        return organized_news
+        return build_output(NEWS_SCHEMA, NEWS_SPEC.rows(raw_data.get("articles", [])), output)
 
-    async def get_standings(self, league: str, sport: Optional[str] = None, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    @traced
+    async def get_standings(self, league: str, sport: Optional[str] = None, season: Optional[str] = None, output: str = "dict", fields: Optional[List[str]] = None) -> Any:
         """Fetch the current standings (wins, losses, win percentage) for the league.
         
         Args:
             league: The league (e.g., 'nfl').
             sport: Automatically inferred if not provided.
             season: Optional historical season string (e.g. '2016').
+            output: 'dict' (default) for a list of dictionaries, 'record' for compact slotted records
+                    (see `espnpy.records`), 'arrow' for a pyarrow.Table, or 'numpy' for a dictionary of
+                    numpy arrays (one per field).
+            fields: Optional list of field names to return (e.g. ['name', 'wins', 'losses']). Extraction for
+                    every other field is skipped (the standings are still ordered by rank). Defaults to all fields.
             
         Returns:
-            A standardized list of dictionaries containing team standings, ordered by rank.
+            A standardized list of dictionaries containing team standings, ordered by rank (or the requested columnar form).
         """
+        check_output(output)
+        schema = project(STANDING_SCHEMA, fields)
         resolved_sport = self._resolve_sport(league, sport)
         params = {}
         if season:
@@ -822,117 +1661,34 @@ class ESPNClient:
         if resolved_sport in ["tennis", "golf", "mma"]:
             url = f"https://site.api.espn.com/apis/site/v2/sports/{resolved_sport}/{league}/rankings"
             try:
-                raw_data = await self._session.get(url, params=params)
-                raw_data.raise_for_status()
-                raw_data = raw_data.json()
+                raw_data = await self._fetch_json(url, params=params, hedge=True)
             except httpx.HTTPStatusError:
-                return []
+                return build_output(schema, (), output)
         else:
             url = f"https://site.api.espn.com/apis/v2/sports/{resolved_sport}/{league}/standings"
             try:
-                raw_data = await self._session.get(url, params=params)
-                raw_data.raise_for_status()
-                raw_data = raw_data.json()
+                raw_data = await self._fetch_json(url, params=params, hedge=True)
             except httpx.HTTPStatusError:
-                return []
-        
-        organized_standings = []
+                return build_output(schema, (), output)
         
-        # If we pulled Rankings (Tennis/Golf/MMA)
-        if "rankings" in raw_data:
-            for group in raw_data.get("rankings", []):
-                group_name = group.get("name", "Overall")
-                for rank_entry in group.get("ranks", []):
-                    athlete_info = rank_entry.get("athlete", {})
-                    
-                    organized_standings.append({
-                        "id": athlete_info.get("id", ""),
-                        "name": athlete_info.get("displayName", ""),
-                        "abbreviation": athlete_info.get("shortname", ""),
-                        "logo": athlete_info.get("headshot", "") or athlete_info.get("flag", ""),
-                        "group": group_name,
-                        "wins": "0", "losses": "0", "ties": "0", "winPercent": "0",
-                        "gamesBehind": "-",
-                        "points": str(rank_entry.get("points", 0)),
-                        "rank": str(rank_entry.get("current", 0)),
-                        "streak": rank_entry.get("trend", "-"),
-                        "pointsFor": "0", "pointsAgainst": "0", "differential": "0",
-                        "homeRecord": "-", "awayRecord": "-", "divisionRecord": "-",
-                        "conferenceRecord": "-", "lastTenRecord": "-", "playoffSeed": "-"
-                    })
-        else:
-            # Standings are usually grouped by conference/league (e.g., AFC, NFC or Eastern, Western)
-            for group in raw_data.get("children", []):
-                group_name = group.get("name", "Overall")
-                entries = group.get("standings", {}).get("entries", [])
-                
-                for entry in entries:
-                    # Team sports use "team", Racing/Tennis use "athlete" or "constructor"
-                    entity_info = entry.get("team") or entry.get("athlete") or entry.get("constructor") or {}
-                    
-                    # ESPN provides a list of stats (wins, losses, ties, pct). We flatten this into a dict.
-                    raw_stats = entry.get("stats", [])
-                    stats_dict = {s.get("name"): s.get("displayValue") for s in raw_stats if "name" in s and "displayValue" in s}
-                    
-                    organized_standings.append({
-                        "id": entity_info.get("id", ""),
-                        "name": entity_info.get("displayName", ""),
-                        "abbreviation": entity_info.get("abbreviation", ""),
-                        "logo": entity_info.get("logos", [{}])[0].get("href") if entity_info.get("logos") else (entity_info.get("flag", {}).get("href")),
-                        "group": group_name,
-                        "wins": stats_dict.get("wins", "0"),
-                        "losses": stats_dict.get("losses", "0"),
-                        "ties": stats_dict.get("ties", "0"),
-                        "winPercent": stats_dict.get("winPercent", "0"),
-                        "gamesBehind": stats_dict.get("gamesBehind", "-"),
-                        "points": stats_dict.get("championshipPts") or stats_dict.get("points") or "0", # For Racing/Tennis
-                        "rank": stats_dict.get("rank") or "-", # For Racing/Tennis
-                        "streak": stats_dict.get("streak", "-"),
-                        "pointsFor": stats_dict.get("pointsFor", "0"),
-                        "pointsAgainst": stats_dict.get("pointsAgainst", "0"),
-                        "differential": stats_dict.get("differential", "0"),
-                        "homeRecord": stats_dict.get("Home", "-"),
-                        "awayRecord": stats_dict.get("Road", "-"),
-                        "divisionRecord": stats_dict.get("vs. Div.", "-"),
-                        "conferenceRecord": stats_dict.get("vs. Conf.", "-"),
-                        "lastTenRecord": stats_dict.get("Last Ten Games", "-"),
-                        "playoffSeed": stats_dict.get("playoffSeed", "-")
-                    })
-                    
         # Sort standings: If win percentage is valid, sort by it. Otherwise, try to sort by rank or points (Racing/Tennis).
-        def parse_sort_val(entry: dict) -> float:
-            try:
-                # If there is a rank, we want the lowest rank (so we return a negative number to sort descending, or reverse the logic)
-                # But since we use reverse=True below, we need the "best" team to have the highest number.
-                # So Rank 1 = 1000, Rank 2 = 999.
-                rank = entry.get("rank")
-                if rank and rank != "-":
-                    return 10000 - float(rank)
-                    
-                # If there are points (like F1), sort by points
-                points = entry.get("points")
-                if points and points != "0" and points != "-":
-                    return float(points)
-
-                # Fallback to standard win percentage
-                pct_str = entry.get("winPercent")
-                if not pct_str or pct_str == "-":
-                    return 0.0
-                return float(pct_str)
-            except ValueError:
-                return 0.0
-
-        organized_standings.sort(key=lambda x: parse_sort_val(x), reverse=True)
-                
-        return organized_standings
+        # The sort key is computed from its own getters, so it works no matter which fields were requested.
+        entries = list(iter_standing_sources(raw_data))
+        entries.sort(key=lambda entry: standing_sort_value(*entry), reverse=True)
+
+        names = field_names(schema)
+        rows = (spec.compile(names)(source) for spec, source in entries)
+        return build_output(schema, rows, output)
 
-    async def get_athlete_stats(self, league: str, athlete_id: str, sport: Optional[str] = None) -> Dict[str, Any]:
+    @traced
+    async def get_athlete_stats(self, league: str, athlete_id: str, sport: Optional[str] = None, numeric: bool = False) -> Dict[str, Any]:
         """Fetch advanced statistical splits (Home vs Away, Wins vs Losses, Season Totals) for an athlete.
         
         Args:
             league: The league (e.g., 'nfl').
             athlete_id: The unique ID of the athlete.
             sport: Automatically inferred if not provided.
+            numeric: If True, the stat display strings (e.g. "3,587", "62.7", "--") are parsed into numbers.
             
         Returns:
             A standardized dictionary mapping categories (e.g. 'Wins/Ties', 'Home') to their specific stat totals.
@@ -951,18 +1707,28 @@ class ESPNClient:
         
         # ESPN then provides a massive array of "splits" (e.g., 'Home', 'Away', 'Wins', 'Losses', 'Last 4 Weeks')
         # Each split contains an array of string values that perfectly map 1-to-1 with the master labels list.
+        split_names = []
+        split_rows = []
         for category in raw_data.get("splitCategories", []):
             for split in category.get("splits", []):
                 split_name = split.get("displayName")
                 stat_values = split.get("stats", [])
                 
-                # Zip the master labels with this specific split's values into a clean dictionary
                 if split_name and len(labels) == len(stat_values):
-                    stats_dict = dict(zip(labels, stat_values))
-                    organized_stats[split_name] = stats_dict
+                    split_names.append(split_name)
+                    split_rows.append(stat_values)
+        
+        # Parse every split at once, one label column at a time
+        if numeric:
+            labels, split_rows = parse_table(labels, split_rows, resolved_sport)
+            
+        # Zip the master labels with each split's values into a clean dictionary
+        for split_name, stat_values in zip(split_names, split_rows):
+            organized_stats[split_name] = dict(zip(labels, stat_values))
                     
         return organized_stats
 
+    @traced
     async def get_odds(self, league: str, event_id: str, sport: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch betting lines across all sportsbook providers for a specific game/event.
         
@@ -987,47 +1753,9 @@ class ESPNClient:
                 return []
             raise e
             
-        organized_odds = []
-        for item in raw_data.get("items", []):
-            provider_name = item.get("provider", {}).get("name", "Unknown")
-            
-            # Extract generic details (NBA / MLB structure)
-            details = item.get("details")
-            over_under = item.get("overUnder")
-            spread = item.get("spread")
-            moneyline_away = item.get("awayTeamOdds", {}).get("moneyLine")
-            moneyline_home = item.get("homeTeamOdds", {}).get("moneyLine")
-            
-            # Fallback for complex nesting (NFL / Soccer structure)
-            if not details and "bettingOdds" in item:
-                team_odds = item["bettingOdds"].get("teamOdds", {})
-                
-                spread_val = team_odds.get("preMatchSpreadHandicapHome", {}).get("value")
-                if spread_val:
-                    try: spread = float(spread_val)
-                    except ValueError: pass
-                    
-                ou_val = team_odds.get("preMatchTotalHandicap", {}).get("value")
-                if ou_val:
-                    try: over_under = float(ou_val)
-                    except ValueError: pass
-                    
-                away_ml = team_odds.get("preMatchMoneyLineAway", {}).get("value")
-                home_ml = team_odds.get("preMatchMoneyLineHome", {}).get("value")
-                if away_ml: moneyline_away = away_ml
-                if home_ml: moneyline_home = home_ml
-                
-            organized_odds.append({
-                "provider": provider_name,
-                "details": details or (f"Home {spread}" if spread else None),
-                "overUnder": over_under,
-                "spread": spread,
-                "awayMoneyLine": moneyline_away,
-                "homeMoneyLine": moneyline_home
-            })
-            
-        return organized_odds
+        return ODDS_SPEC.dicts(raw_data.get("items", []))
 
+    @traced
     async def get_team(self, league: str, team_id: str, sport: Optional[str] = None) -> Dict[str, Any]:
         """Fetch general information for a specific team by their ID.
         
@@ -1062,7 +1790,8 @@ class ESPNClient:
             "standingSummary": team_info.get("standingSummary")
         }
 
-    async def get_team_schedule(self, league: str, team_id: str, season: Optional[str] = None, sport: Optional[str] = None) -> List[Dict[str, Any]]:
+    @traced
+    async def get_team_schedule(self, league: str, team_id: str, season: Optional[str] = None, sport: Optional[str] = None, output: str = "dict") -> Any:
         """Fetch the full schedule of games for a specific team.
         
         Args:
@@ -1070,10 +1799,12 @@ class ESPNClient:
             team_id: The unique ID of the team.
             season: The year string (e.g. '2023'). If omitted, fetches the current season.
             sport: Automatically inferred if not provided.
+            output: 'dict' (default), 'record' (`Game` records), 'arrow' or 'numpy'.
             
         Returns:
             A standardized list of flattened game dictionaries identical to the `scoreboard()` output.
         """
+        check_output(output)
         resolved_sport = self._resolve_sport(league, sport)
         params = {}
         if season:
@@ -1084,1163 +1815,1165 @@ class ESPNClient:
         
         # ESPN's team schedule returns an "events" array identical to the scoreboard endpoint!
         # We can magically reuse the exact same flattening function.
-        return self._standardize_scoreboard(raw_data)
+        return self._standardize_scoreboard(raw_data, output)
 
     # ---------------------------------------------------------
     # Syntactic Sugar / Dot-Notation Handlers
     # ---------------------------------------------------------
     
     # We define the most popular leagues explicitly so IDE Autocomplete (VSCode, PyCharm) works flawlessly.
-    @property
+    # They are cached properties, so each client builds one LeagueProxy per league and later accesses
+    # (`client.nba` in a hot loop) are a plain instance attribute lookup.
+    @cached_property
     def league_164205(self) -> "LeagueProxy": return LeagueProxy(self, "164205")
 
-    @property
+    @cached_property
     def league_180659(self) -> "LeagueProxy": return LeagueProxy(self, "180659")
 
-    @property
+    @cached_property
     def league_2009(self) -> "LeagueProxy": return LeagueProxy(self, "2009")
 
-    @property
+    @cached_property
     def league_236461(self) -> "LeagueProxy": return LeagueProxy(self, "236461")
 
-    @property
+    @cached_property
     def league_242041(self) -> "LeagueProxy": return LeagueProxy(self, "242041")
 
-    @property
+    @cached_property
     def league_244293(self) -> "LeagueProxy": return LeagueProxy(self, "244293")
 
-    @property
+    @cached_property
     def league_267979(self) -> "LeagueProxy": return LeagueProxy(self, "267979")
 
-    @property
+    @cached_property
     def league_268565(self) -> "LeagueProxy": return LeagueProxy(self, "268565")
 
-    @property
+    @cached_property
     def league_270555(self) -> "LeagueProxy": return LeagueProxy(self, "270555")
 
-    @property
+    @cached_property
     def league_270557(self) -> "LeagueProxy": return LeagueProxy(self, "270557")
 
-    @property
+    @cached_property
     def league_270559(self) -> "LeagueProxy": return LeagueProxy(self, "270559")
 
-    @property
+    @cached_property
     def league_270563(self) -> "LeagueProxy": return LeagueProxy(self, "270563")
 
-    @property
+    @cached_property
     def league_271937(self) -> "LeagueProxy": return LeagueProxy(self, "271937")
 
-    @property
+    @cached_property
     def league_272073(self) -> "LeagueProxy": return LeagueProxy(self, "272073")
 
-    @property
+    @cached_property
     def league_282(self) -> "LeagueProxy": return LeagueProxy(self, "282")
 
-    @property
+    @cached_property
     def league_283(self) -> "LeagueProxy": return LeagueProxy(self, "283")
 
-    @property
+    @cached_property
     def league_289234(self) -> "LeagueProxy": return LeagueProxy(self, "289234")
 
-    @property
+    @cached_property
     def league_289237(self) -> "LeagueProxy": return LeagueProxy(self, "289237")
 
-    @property
+    @cached_property
     def league_289262(self) -> "LeagueProxy": return LeagueProxy(self, "289262")
 
-    @property
+    @cached_property
     def league_289271(self) -> "LeagueProxy": return LeagueProxy(self, "289271")
 
-    @property
+    @cached_property
     def league_289272(self) -> "LeagueProxy": return LeagueProxy(self, "289272")
 
-    @property
+    @cached_property
     def league_289274(self) -> "LeagueProxy": return LeagueProxy(self, "289274")
 
-    @property
+    @cached_property
     def league_289277(self) -> "LeagueProxy": return LeagueProxy(self, "289277")
 
-    @property
+    @cached_property
     def league_289279(self) -> "LeagueProxy": return LeagueProxy(self, "289279")
 
-    @property
+    @cached_property
     def league_3(self) -> "LeagueProxy": return LeagueProxy(self, "3")
 
-    @property
+    @cached_property
     def absolute(self) -> "LeagueProxy": return LeagueProxy(self, "absolute")
 
-    @property
+    @cached_property
     def afc_asian_cup(self) -> "LeagueProxy": return LeagueProxy(self, "afc.asian.cup")
 
-    @property
+    @cached_property
     def afc_challenge_cup(self) -> "LeagueProxy": return LeagueProxy(self, "afc.challenge_cup")
 
-    @property
+    @cached_property
     def afc_champions(self) -> "LeagueProxy": return LeagueProxy(self, "afc.champions")
 
-    @property
+    @cached_property
     def afc_cup(self) -> "LeagueProxy": return LeagueProxy(self, "afc.cup")
 
-    @property
+    @cached_property
     def afc_cupq(self) -> "LeagueProxy": return LeagueProxy(self, "afc.cupq")
 
-    @property
+    @cached_property
     def afc_saff_championship(self) -> "LeagueProxy": return LeagueProxy(self, "afc.saff.championship")
 
-    @property
+    @cached_property
     def afc_w_asian_cup(self) -> "LeagueProxy": return LeagueProxy(self, "afc.w.asian.cup")
 
-    @property
+    @cached_property
     def aff_championship(self) -> "LeagueProxy": return LeagueProxy(self, "aff.championship")
 
-    @property
+    @cached_property
     def affliction(self) -> "LeagueProxy": return LeagueProxy(self, "affliction")
 
-    @property
+    @cached_property
     def afl(self) -> "LeagueProxy": return LeagueProxy(self, "afl")
 
-    @property
+    @cached_property
     def arg_1(self) -> "LeagueProxy": return LeagueProxy(self, "arg.1")
 
-    @property
+    @cached_property
     def arg_2(self) -> "LeagueProxy": return LeagueProxy(self, "arg.2")
 
-    @property
+    @cached_property
     def arg_3(self) -> "LeagueProxy": return LeagueProxy(self, "arg.3")
 
-    @property
+    @cached_property
     def arg_4(self) -> "LeagueProxy": return LeagueProxy(self, "arg.4")
 
-    @property
+    @cached_property
     def arg_copa(self) -> "LeagueProxy": return LeagueProxy(self, "arg.copa")
 
-    @property
+    @cached_property
     def arg_copa_de_la_superliga(self) -> "LeagueProxy": return LeagueProxy(self, "arg.copa_de_la_superliga")
 
-    @property
+    @cached_property
     def arg_supercopa(self) -> "LeagueProxy": return LeagueProxy(self, "arg.supercopa")
 
-    @property
+    @cached_property
     def arg_supercopa_internacional(self) -> "LeagueProxy": return LeagueProxy(self, "arg.supercopa.internacional")
 
-    @property
+    @cached_property
     def arg_trofeo_de_la_campeones(self) -> "LeagueProxy": return LeagueProxy(self, "arg.trofeo_de_la_campeones")
 
-    @property
+    @cached_property
     def atp(self) -> "LeagueProxy": return LeagueProxy(self, "atp")
 
-    @property
+    @cached_property
     def aus_1(self) -> "LeagueProxy": return LeagueProxy(self, "aus.1")
 
-    @property
+    @cached_property
     def aus_w_1(self) -> "LeagueProxy": return LeagueProxy(self, "aus.w.1")
 
-    @property
+    @cached_property
     def aut_1(self) -> "LeagueProxy": return LeagueProxy(self, "aut.1")
 
-    @property
+    @cached_property
     def bang_fighting(self) -> "LeagueProxy": return LeagueProxy(self, "bang-fighting")
 
-    @property
+    @cached_property
     def bangabandhu_cup(self) -> "LeagueProxy": return LeagueProxy(self, "bangabandhu.cup")
 
-    @property
+    @cached_property
     def banni_fight(self) -> "LeagueProxy": return LeagueProxy(self, "banni-fight")
 
-    @property
+    @cached_property
     def banzay(self) -> "LeagueProxy": return LeagueProxy(self, "banzay")
 
-    @property
+    @cached_property
     def barracao(self) -> "LeagueProxy": return LeagueProxy(self, "barracao")
 
-    @property
+    @cached_property
     def battlezone(self) -> "LeagueProxy": return LeagueProxy(self, "battlezone")
 
-    @property
+    @cached_property
     def bel_1(self) -> "LeagueProxy": return LeagueProxy(self, "bel.1")
 
-    @property
+    @cached_property
     def bel_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "bel.promotion.relegation")
 
-    @property
+    @cached_property
     def bellator(self) -> "LeagueProxy": return LeagueProxy(self, "bellator")
 
-    @property
+    @cached_property
     def benevides(self) -> "LeagueProxy": return LeagueProxy(self, "benevides")
 
-    @property
+    @cached_property
     def big_fight(self) -> "LeagueProxy": return LeagueProxy(self, "big-fight")
 
-    @property
+    @cached_property
     def blackout(self) -> "LeagueProxy": return LeagueProxy(self, "blackout")
 
-    @property
+    @cached_property
     def bol_1(self) -> "LeagueProxy": return LeagueProxy(self, "bol.1")
 
-    @property
+    @cached_property
     def bol_copa(self) -> "LeagueProxy": return LeagueProxy(self, "bol.copa")
 
-    @property
+    @cached_property
     def bol_ply_rel(self) -> "LeagueProxy": return LeagueProxy(self, "bol.ply.rel")
 
-    @property
+    @cached_property
     def bosnia(self) -> "LeagueProxy": return LeagueProxy(self, "bosnia")
 
-    @property
+    @cached_property
     def boxe(self) -> "LeagueProxy": return LeagueProxy(self, "boxe")
 
-    @property
+    @cached_property
     def bra_1(self) -> "LeagueProxy": return LeagueProxy(self, "bra.1")
 
-    @property
+    @cached_property
     def bra_2(self) -> "LeagueProxy": return LeagueProxy(self, "bra.2")
 
-    @property
+    @cached_property
     def bra_3(self) -> "LeagueProxy": return LeagueProxy(self, "bra.3")
 
-    @property
+    @cached_property
     def bra_camp_carioca(self) -> "LeagueProxy": return LeagueProxy(self, "bra.camp.carioca")
 
-    @property
+    @cached_property
     def bra_camp_gaucho(self) -> "LeagueProxy": return LeagueProxy(self, "bra.camp.gaucho")
 
-    @property
+    @cached_property
     def bra_camp_mineiro(self) -> "LeagueProxy": return LeagueProxy(self, "bra.camp.mineiro")
 
-    @property
+    @cached_property
     def bra_camp_paulista(self) -> "LeagueProxy": return LeagueProxy(self, "bra.camp.paulista")
 
-    @property
+    @cached_property
     def bra_carioca_groupa(self) -> "LeagueProxy": return LeagueProxy(self, "bra.carioca.groupa")
 
-    @property
+    @cached_property
     def bra_carioca_groupb(self) -> "LeagueProxy": return LeagueProxy(self, "bra.carioca.groupb")
 
-    @property
+    @cached_property
     def bra_copa_do_brazil(self) -> "LeagueProxy": return LeagueProxy(self, "bra.copa_do_brazil")
 
-    @property
+    @cached_property
     def bra_copa_do_nordeste(self) -> "LeagueProxy": return LeagueProxy(self, "bra.copa_do_nordeste")
 
-    @property
+    @cached_property
     def bra_supercopa_do_brazil(self) -> "LeagueProxy": return LeagueProxy(self, "bra.supercopa_do_brazil")
 
-    @property
+    @cached_property
     def brazilian_freestyle(self) -> "LeagueProxy": return LeagueProxy(self, "brazilian-freestyle")
 
-    @property
+    @cached_property
     def budo(self) -> "LeagueProxy": return LeagueProxy(self, "budo")
 
-    @property
+    @cached_property
     def caf_champions(self) -> "LeagueProxy": return LeagueProxy(self, "caf.champions")
 
-    @property
+    @cached_property
     def caf_championship(self) -> "LeagueProxy": return LeagueProxy(self, "caf.championship")
 
-    @property
+    @cached_property
     def caf_championship_qual(self) -> "LeagueProxy": return LeagueProxy(self, "caf.championship_qual")
 
-    @property
+    @cached_property
     def caf_confed(self) -> "LeagueProxy": return LeagueProxy(self, "caf.confed")
 
-    @property
+    @cached_property
     def caf_cosafa(self) -> "LeagueProxy": return LeagueProxy(self, "caf.cosafa")
 
-    @property
+    @cached_property
     def caf_nations(self) -> "LeagueProxy": return LeagueProxy(self, "caf.nations")
 
-    @property
+    @cached_property
     def caf_nations_qual(self) -> "LeagueProxy": return LeagueProxy(self, "caf.nations_qual")
 
-    @property
+    @cached_property
     def caf_w_nations(self) -> "LeagueProxy": return LeagueProxy(self, "caf.w.nations")
 
-    @property
+    @cached_property
     def cage_warriors(self) -> "LeagueProxy": return LeagueProxy(self, "cage-warriors")
 
-    @property
+    @cached_property
     def campeones_cup(self) -> "LeagueProxy": return LeagueProxy(self, "campeones.cup")
 
-    @property
+    @cached_property
     def can_w_nsl(self) -> "LeagueProxy": return LeagueProxy(self, "can.w.nsl")
 
-    @property
+    @cached_property
     def caribbean_series(self) -> "LeagueProxy": return LeagueProxy(self, "caribbean-series")
 
-    @property
+    @cached_property
     def cfl(self) -> "LeagueProxy": return LeagueProxy(self, "cfl")
 
-    @property
+    @cached_property
     def champions_tour(self) -> "LeagueProxy": return LeagueProxy(self, "champions-tour")
 
-    @property
+    @cached_property
     def chi_1(self) -> "LeagueProxy": return LeagueProxy(self, "chi.1")
 
-    @property
+    @cached_property
     def chi_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "chi.1.promotion.relegation")
 
-    @property
+    @cached_property
     def chi_2(self) -> "LeagueProxy": return LeagueProxy(self, "chi.2")
 
-    @property
+    @cached_property
     def chi_copa_chi(self) -> "LeagueProxy": return LeagueProxy(self, "chi.copa_chi")
 
-    @property
+    @cached_property
     def chi_super_cup(self) -> "LeagueProxy": return LeagueProxy(self, "chi.super_cup")
 
-    @property
+    @cached_property
     def chn_1(self) -> "LeagueProxy": return LeagueProxy(self, "chn.1")
 
-    @property
+    @cached_property
     def chn_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "chn.1.promotion.relegation")
 
-    @property
+    @cached_property
     def club_friendly(self) -> "LeagueProxy": return LeagueProxy(self, "club.friendly")
 
-    @property
+    @cached_property
     def col_1(self) -> "LeagueProxy": return LeagueProxy(self, "col.1")
 
-    @property
+    @cached_property
     def col_2(self) -> "LeagueProxy": return LeagueProxy(self, "col.2")
 
-    @property
+    @cached_property
     def col_copa(self) -> "LeagueProxy": return LeagueProxy(self, "col.copa")
 
-    @property
+    @cached_property
     def col_superliga(self) -> "LeagueProxy": return LeagueProxy(self, "col.superliga")
 
-    @property
+    @cached_property
     def college_baseball(self) -> "LeagueProxy": return LeagueProxy(self, "college-baseball")
 
-    @property
+    @cached_property
     def college_football(self) -> "LeagueProxy": return LeagueProxy(self, "college-football")
 
-    @property
+    @cached_property
     def college_softball(self) -> "LeagueProxy": return LeagueProxy(self, "college-softball")
 
-    @property
+    @cached_property
     def concacaf_central_american_cup(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.central.american.cup")
 
-    @property
+    @cached_property
     def concacaf_champions(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.champions")
 
-    @property
+    @cached_property
     def concacaf_champions_cup(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.champions_cup")
 
-    @property
+    @cached_property
     def concacaf_confederations_playoff(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.confederations_playoff")
 
-    @property
+    @cached_property
     def concacaf_gold(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.gold")
 
-    @property
+    @cached_property
     def concacaf_gold_qual(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.gold_qual")
 
-    @property
+    @cached_property
     def concacaf_leagues_cup(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.leagues.cup")
 
-    @property
+    @cached_property
     def concacaf_nations_league(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.nations.league")
 
-    @property
+    @cached_property
     def concacaf_u23(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.u23")
 
-    @property
+    @cached_property
     def concacaf_w_champions_cup(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.w.champions_cup")
 
-    @property
+    @cached_property
     def concacaf_w_gold(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.w.gold")
 
-    @property
+    @cached_property
     def concacaf_womens_championship(self) -> "LeagueProxy": return LeagueProxy(self, "concacaf.womens.championship")
 
-    @property
+    @cached_property
     def conmebol_america(self) -> "LeagueProxy": return LeagueProxy(self, "conmebol.america")
 
-    @property
+    @cached_property
     def conmebol_america_femenina(self) -> "LeagueProxy": return LeagueProxy(self, "conmebol.america.femenina")
 
-    @property
+    @cached_property
     def conmebol_libertadores(self) -> "LeagueProxy": return LeagueProxy(self, "conmebol.libertadores")
 
-    @property
+    @cached_property
     def conmebol_recopa(self) -> "LeagueProxy": return LeagueProxy(self, "conmebol.recopa")
 
-    @property
+    @cached_property
     def conmebol_sudamericana(self) -> "LeagueProxy": return LeagueProxy(self, "conmebol.sudamericana")
 
-    @property
+    @cached_property
     def crc_1(self) -> "LeagueProxy": return LeagueProxy(self, "crc.1")
 
-    @property
+    @cached_property
     def cyp_1(self) -> "LeagueProxy": return LeagueProxy(self, "cyp.1")
 
-    @property
+    @cached_property
     def den_1(self) -> "LeagueProxy": return LeagueProxy(self, "den.1")
 
-    @property
+    @cached_property
     def dominican_winter_league(self) -> "LeagueProxy": return LeagueProxy(self, "dominican-winter-league")
 
-    @property
+    @cached_property
     def dream(self) -> "LeagueProxy": return LeagueProxy(self, "dream")
 
-    @property
+    @cached_property
     def ecu_1(self) -> "LeagueProxy": return LeagueProxy(self, "ecu.1")
 
-    @property
+    @cached_property
     def eng_1(self) -> "LeagueProxy": return LeagueProxy(self, "eng.1")
 
-    @property
+    @cached_property
     def eng_2(self) -> "LeagueProxy": return LeagueProxy(self, "eng.2")
 
-    @property
+    @cached_property
     def eng_3(self) -> "LeagueProxy": return LeagueProxy(self, "eng.3")
 
-    @property
+    @cached_property
     def eng_4(self) -> "LeagueProxy": return LeagueProxy(self, "eng.4")
 
-    @property
+    @cached_property
     def eng_5(self) -> "LeagueProxy": return LeagueProxy(self, "eng.5")
 
-    @property
+    @cached_property
     def eng_charity(self) -> "LeagueProxy": return LeagueProxy(self, "eng.charity")
 
-    @property
+    @cached_property
     def eng_fa(self) -> "LeagueProxy": return LeagueProxy(self, "eng.fa")
 
-    @property
+    @cached_property
     def eng_league_cup(self) -> "LeagueProxy": return LeagueProxy(self, "eng.league_cup")
 
-    @property
+    @cached_property
     def eng_trophy(self) -> "LeagueProxy": return LeagueProxy(self, "eng.trophy")
 
-    @property
+    @cached_property
     def eng_w_1(self) -> "LeagueProxy": return LeagueProxy(self, "eng.w.1")
 
-    @property
+    @cached_property
     def eng_w_fa(self) -> "LeagueProxy": return LeagueProxy(self, "eng.w.fa")
 
-    @property
+    @cached_property
     def eng_w_league_cup(self) -> "LeagueProxy": return LeagueProxy(self, "eng.w.league_cup")
 
-    @property
+    @cached_property
     def esp_1(self) -> "LeagueProxy": return LeagueProxy(self, "esp.1")
 
-    @property
+    @cached_property
     def esp_2(self) -> "LeagueProxy": return LeagueProxy(self, "esp.2")
 
-    @property
+    @cached_property
     def esp_copa_de_la_reina(self) -> "LeagueProxy": return LeagueProxy(self, "esp.copa_de_la_reina")
 
-    @property
+    @cached_property
     def esp_copa_del_rey(self) -> "LeagueProxy": return LeagueProxy(self, "esp.copa_del_rey")
 
-    @property
+    @cached_property
     def esp_joan_gamper(self) -> "LeagueProxy": return LeagueProxy(self, "esp.joan_gamper")
 
-    @property
+    @cached_property
     def esp_super_cup(self) -> "LeagueProxy": return LeagueProxy(self, "esp.super_cup")
 
-    @property
+    @cached_property
     def esp_w_1(self) -> "LeagueProxy": return LeagueProxy(self, "esp.w.1")
 
-    @property
+    @cached_property
     def eur(self) -> "LeagueProxy": return LeagueProxy(self, "eur")
 
-    @property
+    @cached_property
     def euroamericana_supercopa(self) -> "LeagueProxy": return LeagueProxy(self, "euroamericana.supercopa")
 
-    @property
+    @cached_property
     def f1(self) -> "LeagueProxy": return LeagueProxy(self, "f1")
 
-    @property
+    @cached_property
     def fiba(self) -> "LeagueProxy": return LeagueProxy(self, "fiba")
 
-    @property
+    @cached_property
     def fifa_concacaf_olympicsq(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.concacaf.olympicsq")
 
-    @property
+    @cached_property
     def fifa_conmebol_olympicsq(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.conmebol.olympicsq")
 
-    @property
+    @cached_property
     def fifa_cwc(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.cwc")
 
-    @property
+    @cached_property
     def fifa_friendly(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.friendly")
 
-    @property
+    @cached_property
     def fifa_friendly_w(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.friendly.w")
 
-    @property
+    @cached_property
     def fifa_friendly_u21(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.friendly_u21")
 
-    @property
+    @cached_property
     def fifa_intercontinental_cup(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.intercontinental.cup")
 
-    @property
+    @cached_property
     def fifa_intercontinental_cup(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.intercontinental_cup")
 
-    @property
+    @cached_property
     def fifa_intercontinental_cup_not_used(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.intercontinental_cup_not_used")
 
-    @property
+    @cached_property
     def fifa_olympics(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.olympics")
 
-    @property
+    @cached_property
     def fifa_shebelieves(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.shebelieves")
 
-    @property
+    @cached_property
     def fifa_w_champions_cup(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.w.champions_cup")
 
-    @property
+    @cached_property
     def fifa_w_concacaf_olympicsq(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.w.concacaf.olympicsq")
 
-    @property
+    @cached_property
     def fifa_w_olympics(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.w.olympics")
 
-    @property
+    @cached_property
     def fifa_wcq_ply(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.wcq.ply")
 
-    @property
+    @cached_property
     def fifa_world(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.world")
 
-    @property
+    @cached_property
     def fifa_world_u17(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.world.u17")
 
-    @property
+    @cached_property
     def fifa_world_u20(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.world.u20")
 
-    @property
+    @cached_property
     def fifa_worldq_afc(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.afc")
 
-    @property
+    @cached_property
     def fifa_worldq_afc_conmebol(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.afc.conmebol")
 
-    @property
+    @cached_property
     def fifa_worldq_caf(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.caf")
 
-    @property
+    @cached_property
     def fifa_worldq_concacaf(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.concacaf")
 
-    @property
+    @cached_property
     def fifa_worldq_concacaf_ofc(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.concacaf.ofc")
 
-    @property
+    @cached_property
     def fifa_worldq_conmebol(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.conmebol")
 
-    @property
+    @cached_property
     def fifa_worldq_ofc(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.ofc")
 
-    @property
+    @cached_property
     def fifa_worldq_uefa(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.worldq.uefa")
 
-    @property
+    @cached_property
     def fifa_wwc(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.wwc")
 
-    @property
+    @cached_property
     def fifa_wwcq_ply(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.wwcq.ply")
 
-    @property
+    @cached_property
     def fifa_wworld_u17(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.wworld.u17")
 
-    @property
+    @cached_property
     def fifa_wworldq_uefa(self) -> "LeagueProxy": return LeagueProxy(self, "fifa.wworldq.uefa")
 
-    @property
+    @cached_property
     def fng(self) -> "LeagueProxy": return LeagueProxy(self, "fng")
 
-    @property
+    @cached_property
     def fra_1(self) -> "LeagueProxy": return LeagueProxy(self, "fra.1")
 
-    @property
+    @cached_property
     def fra_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "fra.1.promotion.relegation")
 
-    @property
+    @cached_property
     def fra_2(self) -> "LeagueProxy": return LeagueProxy(self, "fra.2")
 
-    @property
+    @cached_property
     def fra_coupe_de_france(self) -> "LeagueProxy": return LeagueProxy(self, "fra.coupe_de_france")
 
-    @property
+    @cached_property
     def fra_super_cup(self) -> "LeagueProxy": return LeagueProxy(self, "fra.super_cup")
 
-    @property
+    @cached_property
     def fra_w_1(self) -> "LeagueProxy": return LeagueProxy(self, "fra.w.1")
 
-    @property
+    @cached_property
     def friendly_emirates_cup(self) -> "LeagueProxy": return LeagueProxy(self, "friendly.emirates_cup")
 
-    @property
+    @cached_property
     def ger_1(self) -> "LeagueProxy": return LeagueProxy(self, "ger.1")
 
-    @property
+    @cached_property
     def ger_2(self) -> "LeagueProxy": return LeagueProxy(self, "ger.2")
 
-    @property
+    @cached_property
     def ger_2_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "ger.2.promotion.relegation")
 
-    @property
+    @cached_property
     def ger_a_bayernliganorth(self) -> "LeagueProxy": return LeagueProxy(self, "ger.a.bayernliganorth")
 
-    @property
+    @cached_property
     def ger_dfb_pokal(self) -> "LeagueProxy": return LeagueProxy(self, "ger.dfb_pokal")
 
-    @property
+    @cached_property
     def ger_playoff_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "ger.playoff.relegation")
 
-    @property
+    @cached_property
     def ger_super_cup(self) -> "LeagueProxy": return LeagueProxy(self, "ger.super_cup")
 
-    @property
+    @cached_property
     def gha_1(self) -> "LeagueProxy": return LeagueProxy(self, "gha.1")
 
-    @property
+    @cached_property
     def global_arnold_clark_cup(self) -> "LeagueProxy": return LeagueProxy(self, "global.arnold.clark_cup")
 
-    @property
+    @cached_property
     def global_champs_cup(self) -> "LeagueProxy": return LeagueProxy(self, "global.champs_cup")
 
-    @property
+    @cached_property
     def global_club_challenge(self) -> "LeagueProxy": return LeagueProxy(self, "global.club_challenge")
 
-    @property
+    @cached_property
     def global_finalissima(self) -> "LeagueProxy": return LeagueProxy(self, "global.finalissima")
 
-    @property
+    @cached_property
     def global_gulf_cup(self) -> "LeagueProxy": return LeagueProxy(self, "global.gulf_cup")
 
-    @property
+    @cached_property
     def global_pinatar_cup(self) -> "LeagueProxy": return LeagueProxy(self, "global.pinatar_cup")
 
-    @property
+    @cached_property
     def global_toulon(self) -> "LeagueProxy": return LeagueProxy(self, "global.toulon")
 
-    @property
+    @cached_property
     def global_u20_intercontinental_cup(self) -> "LeagueProxy": return LeagueProxy(self, "global.u20.intercontinental_cup")
 
-    @property
+    @cached_property
     def global_w_finalissima(self) -> "LeagueProxy": return LeagueProxy(self, "global.w.finalissima")
 
-    @property
+    @cached_property
     def global_wchamps_cup(self) -> "LeagueProxy": return LeagueProxy(self, "global.wchamps_cup")
 
-    @property
+    @cached_property
     def gre_1(self) -> "LeagueProxy": return LeagueProxy(self, "gre.1")
 
-    @property
+    @cached_property
     def gua_1(self) -> "LeagueProxy": return LeagueProxy(self, "gua.1")
 
-    @property
+    @cached_property
     def hockey_world_cup(self) -> "LeagueProxy": return LeagueProxy(self, "hockey-world-cup")
 
-    @property
+    @cached_property
     def hon_1(self) -> "LeagueProxy": return LeagueProxy(self, "hon.1")
 
-    @property
+    @cached_property
     def idn_1(self) -> "LeagueProxy": return LeagueProxy(self, "idn.1")
 
-    @property
+    @cached_property
     def ifc(self) -> "LeagueProxy": return LeagueProxy(self, "ifc")
 
-    @property
+    @cached_property
     def ifl(self) -> "LeagueProxy": return LeagueProxy(self, "ifl")
 
-    @property
+    @cached_property
     def ind_1(self) -> "LeagueProxy": return LeagueProxy(self, "ind.1")
 
-    @property
+    @cached_property
     def ind_2(self) -> "LeagueProxy": return LeagueProxy(self, "ind.2")
 
-    @property
+    @cached_property
     def ir1_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "ir1.1.promotion.relegation")
 
-    @property
+    @cached_property
     def irl(self) -> "LeagueProxy": return LeagueProxy(self, "irl")
 
-    @property
+    @cached_property
     def irl_1(self) -> "LeagueProxy": return LeagueProxy(self, "irl.1")
 
-    @property
+    @cached_property
     def ita_1(self) -> "LeagueProxy": return LeagueProxy(self, "ita.1")
 
-    @property
+    @cached_property
     def ita_2(self) -> "LeagueProxy": return LeagueProxy(self, "ita.2")
 
-    @property
+    @cached_property
     def ita_coppa_italia(self) -> "LeagueProxy": return LeagueProxy(self, "ita.coppa_italia")
 
-    @property
+    @cached_property
     def ita_super_cup(self) -> "LeagueProxy": return LeagueProxy(self, "ita.super_cup")
 
-    @property
+    @cached_property
     def jpn_1(self) -> "LeagueProxy": return LeagueProxy(self, "jpn.1")
 
-    @property
+    @cached_property
     def jpn_world_challenge(self) -> "LeagueProxy": return LeagueProxy(self, "jpn.world_challenge")
 
-    @property
+    @cached_property
     def k1(self) -> "LeagueProxy": return LeagueProxy(self, "k1")
 
-    @property
+    @cached_property
     def ken_1(self) -> "LeagueProxy": return LeagueProxy(self, "ken.1")
 
-    @property
+    @cached_property
     def ksa_1(self) -> "LeagueProxy": return LeagueProxy(self, "ksa.1")
 
-    @property
+    @cached_property
     def ksa_kings_cup(self) -> "LeagueProxy": return LeagueProxy(self, "ksa.kings.cup")
 
-    @property
+    @cached_property
     def ksw(self) -> "LeagueProxy": return LeagueProxy(self, "ksw")
 
-    @property
+    @cached_property
     def lfa(self) -> "LeagueProxy": return LeagueProxy(self, "lfa")
 
-    @property
+    @cached_property
     def lfc(self) -> "LeagueProxy": return LeagueProxy(self, "lfc")
 
-    @property
+    @cached_property
     def liv(self) -> "LeagueProxy": return LeagueProxy(self, "liv")
 
-    @property
+    @cached_property
     def llb(self) -> "LeagueProxy": return LeagueProxy(self, "llb")
 
-    @property
+    @cached_property
     def lls(self) -> "LeagueProxy": return LeagueProxy(self, "lls")
 
-    @property
+    @cached_property
     def lpga(self) -> "LeagueProxy": return LeagueProxy(self, "lpga")
 
-    @property
+    @cached_property
     def m1(self) -> "LeagueProxy": return LeagueProxy(self, "m1")
 
-    @property
+    @cached_property
     def mens_college_basketball(self) -> "LeagueProxy": return LeagueProxy(self, "mens-college-basketball")
 
-    @property
+    @cached_property
     def mens_college_hockey(self) -> "LeagueProxy": return LeagueProxy(self, "mens-college-hockey")
 
-    @property
+    @cached_property
     def mens_college_lacrosse(self) -> "LeagueProxy": return LeagueProxy(self, "mens-college-lacrosse")
 
-    @property
+    @cached_property
     def mens_college_volleyball(self) -> "LeagueProxy": return LeagueProxy(self, "mens-college-volleyball")
 
-    @property
+    @cached_property
     def mens_college_water_polo(self) -> "LeagueProxy": return LeagueProxy(self, "mens-college-water-polo")
 
-    @property
+    @cached_property
     def mens_olympics_basketball(self) -> "LeagueProxy": return LeagueProxy(self, "mens-olympics-basketball")
 
-    @property
+    @cached_property
     def mens_olympics_golf(self) -> "LeagueProxy": return LeagueProxy(self, "mens-olympics-golf")
 
-    @property
+    @cached_property
     def mex_1(self) -> "LeagueProxy": return LeagueProxy(self, "mex.1")
 
-    @property
+    @cached_property
     def mex_2(self) -> "LeagueProxy": return LeagueProxy(self, "mex.2")
 
-    @property
+    @cached_property
     def mex_campeon(self) -> "LeagueProxy": return LeagueProxy(self, "mex.campeon")
 
-    @property
+    @cached_property
     def mexican_winter_league(self) -> "LeagueProxy": return LeagueProxy(self, "mexican-winter-league")
 
-    @property
+    @cached_property
     def mfc(self) -> "LeagueProxy": return LeagueProxy(self, "mfc")
 
-    @property
+    @cached_property
     def mlb(self) -> "LeagueProxy": return LeagueProxy(self, "mlb")
 
-    @property
+    @cached_property
     def mys_1(self) -> "LeagueProxy": return LeagueProxy(self, "mys.1")
 
-    @property
+    @cached_property
     def nascar_premier(self) -> "LeagueProxy": return LeagueProxy(self, "nascar-premier")
 
-    @property
+    @cached_property
     def nascar_secondary(self) -> "LeagueProxy": return LeagueProxy(self, "nascar-secondary")
 
-    @property
+    @cached_property
     def nascar_truck(self) -> "LeagueProxy": return LeagueProxy(self, "nascar-truck")
 
-    @property
+    @cached_property
     def nba(self) -> "LeagueProxy": return LeagueProxy(self, "nba")
 
-    @property
+    @cached_property
     def nba_development(self) -> "LeagueProxy": return LeagueProxy(self, "nba-development")
 
-    @property
+    @cached_property
     def nba_summer_california(self) -> "LeagueProxy": return LeagueProxy(self, "nba-summer-california")
 
-    @property
+    @cached_property
     def nba_summer_golden_state(self) -> "LeagueProxy": return LeagueProxy(self, "nba-summer-golden-state")
 
-    @property
+    @cached_property
     def nba_summer_las_vegas(self) -> "LeagueProxy": return LeagueProxy(self, "nba-summer-las-vegas")
 
-    @property
+    @cached_property
     def nba_summer_orlando(self) -> "LeagueProxy": return LeagueProxy(self, "nba-summer-orlando")
 
-    @property
+    @cached_property
     def nba_summer_sacramento(self) -> "LeagueProxy": return LeagueProxy(self, "nba-summer-sacramento")
 
-    @property
+    @cached_property
     def nba_summer_utah(self) -> "LeagueProxy": return LeagueProxy(self, "nba-summer-utah")
 
-    @property
+    @cached_property
     def nbl(self) -> "LeagueProxy": return LeagueProxy(self, "nbl")
 
-    @property
+    @cached_property
     def ned_1(self) -> "LeagueProxy": return LeagueProxy(self, "ned.1")
 
-    @property
+    @cached_property
     def ned_2(self) -> "LeagueProxy": return LeagueProxy(self, "ned.2")
 
-    @property
+    @cached_property
     def ned_3(self) -> "LeagueProxy": return LeagueProxy(self, "ned.3")
 
-    @property
+    @cached_property
     def ned_3_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "ned.3.promotion.relegation")
 
-    @property
+    @cached_property
     def ned_cup(self) -> "LeagueProxy": return LeagueProxy(self, "ned.cup")
 
-    @property
+    @cached_property
     def ned_playoff_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "ned.playoff.relegation")
 
-    @property
+    @cached_property
     def ned_supercup(self) -> "LeagueProxy": return LeagueProxy(self, "ned.supercup")
 
-    @property
+    @cached_property
     def ned_w_1(self) -> "LeagueProxy": return LeagueProxy(self, "ned.w.1")
 
-    @property
+    @cached_property
     def ned_w_eredivisie_cup(self) -> "LeagueProxy": return LeagueProxy(self, "ned.w.eredivisie_cup")
 
-    @property
+    @cached_property
     def ned_w_knvb_cup(self) -> "LeagueProxy": return LeagueProxy(self, "ned.w.knvb_cup")
 
-    @property
+    @cached_property
     def nfl(self) -> "LeagueProxy": return LeagueProxy(self, "nfl")
 
-    @property
+    @cached_property
     def nga_1(self) -> "LeagueProxy": return LeagueProxy(self, "nga.1")
 
-    @property
+    @cached_property
     def nhl(self) -> "LeagueProxy": return LeagueProxy(self, "nhl")
 
-    @property
+    @cached_property
     def nll(self) -> "LeagueProxy": return LeagueProxy(self, "nll")
 
-    @property
+    @cached_property
     def nonfifa(self) -> "LeagueProxy": return LeagueProxy(self, "nonfifa")
 
-    @property
+    @cached_property
     def nor_1(self) -> "LeagueProxy": return LeagueProxy(self, "nor.1")
 
-    @property
+    @cached_property
     def nor_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "nor.1.promotion.relegation")
 
-    @property
+    @cached_property
     def ntw(self) -> "LeagueProxy": return LeagueProxy(self, "ntw")
 
-    @property
+    @cached_property
     def ofc(self) -> "LeagueProxy": return LeagueProxy(self, "ofc")
 
-    @property
+    @cached_property
     def olympics_baseball(self) -> "LeagueProxy": return LeagueProxy(self, "olympics-baseball")
 
-    @property
+    @cached_property
     def olympics_mens_ice_hockey(self) -> "LeagueProxy": return LeagueProxy(self, "olympics-mens-ice-hockey")
 
-    @property
+    @cached_property
     def olympics_womens_ice_hockey(self) -> "LeagueProxy": return LeagueProxy(self, "olympics-womens-ice-hockey")
 
-    @property
+    @cached_property
     def other(self) -> "LeagueProxy": return LeagueProxy(self, "other")
 
-    @property
+    @cached_property
     def pancrase(self) -> "LeagueProxy": return LeagueProxy(self, "pancrase")
 
-    @property
+    @cached_property
     def par_1(self) -> "LeagueProxy": return LeagueProxy(self, "par.1")
 
-    @property
+    @cached_property
     def par_1_supercopa(self) -> "LeagueProxy": return LeagueProxy(self, "par.1.supercopa")
 
-    @property
+    @cached_property
     def per_1(self) -> "LeagueProxy": return LeagueProxy(self, "per.1")
 
-    @property
+    @cached_property
     def pfl(self) -> "LeagueProxy": return LeagueProxy(self, "pfl")
 
-    @property
+    @cached_property
     def pga(self) -> "LeagueProxy": return LeagueProxy(self, "pga")
 
-    @property
+    @cached_property
     def pll(self) -> "LeagueProxy": return LeagueProxy(self, "pll")
 
-    @property
+    @cached_property
     def por_1(self) -> "LeagueProxy": return LeagueProxy(self, "por.1")
 
-    @property
+    @cached_property
     def por_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "por.1.promotion.relegation")
 
-    @property
+    @cached_property
     def por_taca_portugal(self) -> "LeagueProxy": return LeagueProxy(self, "por.taca.portugal")
 
-    @property
+    @cached_property
     def pride(self) -> "LeagueProxy": return LeagueProxy(self, "pride")
 
-    @property
+    @cached_property
     def proelite(self) -> "LeagueProxy": return LeagueProxy(self, "proelite")
 
-    @property
+    @cached_property
     def puerto_rican_winter_league(self) -> "LeagueProxy": return LeagueProxy(self, "puerto-rican-winter-league")
 
-    @property
+    @cached_property
     def rfa(self) -> "LeagueProxy": return LeagueProxy(self, "rfa")
 
-    @property
+    @cached_property
     def rizin(self) -> "LeagueProxy": return LeagueProxy(self, "rizin")
 
-    @property
+    @cached_property
     def roc(self) -> "LeagueProxy": return LeagueProxy(self, "roc")
 
-    @property
+    @cached_property
     def rsa_1(self) -> "LeagueProxy": return LeagueProxy(self, "rsa.1")
 
-    @property
+    @cached_property
     def rsa_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "rsa.1.promotion.relegation")
 
-    @property
+    @cached_property
     def rsa_2(self) -> "LeagueProxy": return LeagueProxy(self, "rsa.2")
 
-    @property
+    @cached_property
     def rsa_mtn8(self) -> "LeagueProxy": return LeagueProxy(self, "rsa.mtn8")
 
-    @property
+    @cached_property
     def rus_1(self) -> "LeagueProxy": return LeagueProxy(self, "rus.1")
 
-    @property
+    @cached_property
     def rus_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "rus.1.promotion.relegation")
 
-    @property
+    @cached_property
     def sco_1(self) -> "LeagueProxy": return LeagueProxy(self, "sco.1")
 
-    @property
+    @cached_property
     def sco_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "sco.1.promotion.relegation")
 
-    @property
+    @cached_property
     def sco_2(self) -> "LeagueProxy": return LeagueProxy(self, "sco.2")
 
-    @property
+    @cached_property
     def sco_2_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "sco.2.promotion.relegation")
 
-    @property
+    @cached_property
     def sco_challenge(self) -> "LeagueProxy": return LeagueProxy(self, "sco.challenge")
 
-    @property
+    @cached_property
     def sco_cis(self) -> "LeagueProxy": return LeagueProxy(self, "sco.cis")
 
-    @property
+    @cached_property
     def sco_tennents(self) -> "LeagueProxy": return LeagueProxy(self, "sco.tennents")
 
-    @property
+    @cached_property
     def sfl(self) -> "LeagueProxy": return LeagueProxy(self, "sfl")
 
-    @property
+    @cached_property
     def sgp_1(self) -> "LeagueProxy": return LeagueProxy(self, "sgp.1")
 
-    @property
+    @cached_property
     def shark_fights(self) -> "LeagueProxy": return LeagueProxy(self, "shark-fights")
 
-    @property
+    @cached_property
     def shooto_brazil(self) -> "LeagueProxy": return LeagueProxy(self, "shooto-brazil")
 
-    @property
+    @cached_property
     def shooto_japan(self) -> "LeagueProxy": return LeagueProxy(self, "shooto-japan")
 
-    @property
+    @cached_property
     def shoxc(self) -> "LeagueProxy": return LeagueProxy(self, "shoxc")
 
-    @property
+    @cached_property
     def slv_1(self) -> "LeagueProxy": return LeagueProxy(self, "slv.1")
 
-    @property
+    @cached_property
     def strikeforce(self) -> "LeagueProxy": return LeagueProxy(self, "strikeforce")
 
-    @property
+    @cached_property
     def swe_1(self) -> "LeagueProxy": return LeagueProxy(self, "swe.1")
 
-    @property
+    @cached_property
     def swe_1_promotion_relegation(self) -> "LeagueProxy": return LeagueProxy(self, "swe.1.promotion.relegation")
 
-    @property
+    @cached_property
     def tfc(self) -> "LeagueProxy": return LeagueProxy(self, "tfc")
 
-    @property
+    @cached_property
     def tgl(self) -> "LeagueProxy": return LeagueProxy(self, "tgl")
 
-    @property
+    @cached_property
     def tha_1(self) -> "LeagueProxy": return LeagueProxy(self, "tha.1")
 
-    @property
+    @cached_property
     def tpf(self) -> "LeagueProxy": return LeagueProxy(self, "tpf")
 
-    @property
+    @cached_property
     def tur_1(self) -> "LeagueProxy": return LeagueProxy(self, "tur.1")
 
-    @property
+    @cached_property
     def uefa_champions(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.champions")
 
-    @property
+    @cached_property
     def uefa_champions_qual(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.champions_qual")
 
-    @property
+    @cached_property
     def uefa_euro(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.euro")
 
-    @property
+    @cached_property
     def uefa_euro_u19(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.euro.u19")
 
-    @property
+    @cached_property
     def uefa_euro_u21(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.euro_u21")
 
-    @property
+    @cached_property
     def uefa_euro_u21_qual(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.euro_u21_qual")
 
-    @property
+    @cached_property
     def uefa_europa(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.europa")
 
-    @property
+    @cached_property
     def uefa_europa_conf(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.europa.conf")
 
-    @property
+    @cached_property
     def uefa_europa_conf_qual(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.europa.conf_qual")
 
-    @property
+    @cached_property
     def uefa_europa_qual(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.europa_qual")
 
-    @property
+    @cached_property
     def uefa_euroq(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.euroq")
 
-    @property
+    @cached_property
     def uefa_nations(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.nations")
 
-    @property
+    @cached_property
     def uefa_super_cup(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.super_cup")
 
-    @property
+    @cached_property
     def uefa_w_europa(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.w.europa")
 
-    @property
+    @cached_property
     def uefa_w_nations(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.w.nations")
 
-    @property
+    @cached_property
     def uefa_wchampions(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.wchampions")
 
-    @property
+    @cached_property
     def uefa_weuro(self) -> "LeagueProxy": return LeagueProxy(self, "uefa.weuro")
 
-    @property
+    @cached_property
     def ufc(self) -> "LeagueProxy": return LeagueProxy(self, "ufc")
 
-    @property
+    @cached_property
     def ufl(self) -> "LeagueProxy": return LeagueProxy(self, "ufl")
 
-    @property
+    @cached_property
     def uga_1(self) -> "LeagueProxy": return LeagueProxy(self, "uga.1")
 
-    @property
+    @cached_property
     def uru_1(self) -> "LeagueProxy": return LeagueProxy(self, "uru.1")
 
-    @property
+    @cached_property
     def uru_2(self) -> "LeagueProxy": return LeagueProxy(self, "uru.2")
 
-    @property
+    @cached_property
     def usa_1(self) -> "LeagueProxy": return LeagueProxy(self, "usa.1")
 
-    @property
+    @cached_property
     def usa_ncaa_m_1(self) -> "LeagueProxy": return LeagueProxy(self, "usa.ncaa.m.1")
 
-    @property
+    @cached_property
     def usa_ncaa_w_1(self) -> "LeagueProxy": return LeagueProxy(self, "usa.ncaa.w.1")
 
-    @property
+    @cached_property
     def usa_nwsl(self) -> "LeagueProxy": return LeagueProxy(self, "usa.nwsl")
 
-    @property
+    @cached_property
     def usa_nwsl_cup(self) -> "LeagueProxy": return LeagueProxy(self, "usa.nwsl.cup")
 
-    @property
+    @cached_property
     def usa_nwsl_summer_cup(self) -> "LeagueProxy": return LeagueProxy(self, "usa.nwsl.summer.cup")
 
-    @property
+    @cached_property
     def usa_open(self) -> "LeagueProxy": return LeagueProxy(self, "usa.open")
 
-    @property
+    @cached_property
     def usa_usl_1(self) -> "LeagueProxy": return LeagueProxy(self, "usa.usl.1")
 
-    @property
+    @cached_property
     def usa_usl_l1(self) -> "LeagueProxy": return LeagueProxy(self, "usa.usl.l1")
 
-    @property
+    @cached_property
     def usa_usl_l1_cup(self) -> "LeagueProxy": return LeagueProxy(self, "usa.usl.l1.cup")
 
-    @property
+    @cached_property
     def usa_w_usl_1(self) -> "LeagueProxy": return LeagueProxy(self, "usa.w.usl.1")
 
-    @property
+    @cached_property
     def ven_1(self) -> "LeagueProxy": return LeagueProxy(self, "ven.1")
 
-    @property
+    @cached_property
     def venezuelan_winter_league(self) -> "LeagueProxy": return LeagueProxy(self, "venezuelan-winter-league")
 
-    @property
+    @cached_property
     def vfc(self) -> "LeagueProxy": return LeagueProxy(self, "vfc")
 
-    @property
+    @cached_property
     def wec(self) -> "LeagueProxy": return LeagueProxy(self, "wec")
 
-    @property
+    @cached_property
     def wnba(self) -> "LeagueProxy": return LeagueProxy(self, "wnba")
 
-    @property
+    @cached_property
     def womens_college_basketball(self) -> "LeagueProxy": return LeagueProxy(self, "womens-college-basketball")
 
-    @property
+    @cached_property
     def womens_college_field_hockey(self) -> "LeagueProxy": return LeagueProxy(self, "womens-college-field-hockey")
 
-    @property
+    @cached_property
     def womens_college_hockey(self) -> "LeagueProxy": return LeagueProxy(self, "womens-college-hockey")
 
-    @property
+    @cached_property
     def womens_college_lacrosse(self) -> "LeagueProxy": return LeagueProxy(self, "womens-college-lacrosse")
 
-    @property
+    @cached_property
     def womens_college_volleyball(self) -> "LeagueProxy": return LeagueProxy(self, "womens-college-volleyball")
 
-    @property
+    @cached_property
     def womens_college_water_polo(self) -> "LeagueProxy": return LeagueProxy(self, "womens-college-water-polo")
 
-    @property
+    @cached_property
     def womens_olympics_basketball(self) -> "LeagueProxy": return LeagueProxy(self, "womens-olympics-basketball")
 
-    @property
+    @cached_property
     def womens_olympics_golf(self) -> "LeagueProxy": return LeagueProxy(self, "womens-olympics-golf")
 
-    @property
+    @cached_property
     def world_baseball_classic(self) -> "LeagueProxy": return LeagueProxy(self, "world-baseball-classic")
 
-    @property
+    @cached_property
     def wta(self) -> "LeagueProxy": return LeagueProxy(self, "wta")
 
-    @property
+    @cached_property
     def xfc(self) -> "LeagueProxy": return LeagueProxy(self, "xfc")
 
-    @property
+    @cached_property
     def xfl(self) -> "LeagueProxy": return LeagueProxy(self, "xfl")
 
     def __getattr__(self, name: str) -> LeagueProxy:
@@ -2248,15 +2981,11 @@ class ESPNClient:
         Dynamically fallback to intercepting ANY league if an explicit property wasn't defined above.
         This allows `client.eng_1.teams()` or `client.fiba.teams()` without defining 384 explicit properties!
         """
-        # Convert pythonic snake_case to the API's hyphenated-slug (e.g., college_softball -> college-softball)
-        hyphen_slug = name.replace("_", "-")
-        if hyphen_slug in LEAGUE_TO_SPORT:
-            return LeagueProxy(self, hyphen_slug)
-            
-        # Convert pythonic snake_case to dot notation (e.g. eng_1 -> eng.1) for soccer leagues
-        dot_slug = name.replace("_", ".")
-        if dot_slug in LEAGUE_TO_SPORT:
-            return LeagueProxy(self, dot_slug)
+        slug = self._LEAGUE_ALIASES.get(name)
+        if slug is not None:
+            # Cache the proxy on the instance, so this fallback only runs once per league
+            proxy = self.__dict__[name] = LeagueProxy(self, slug)
+            return proxy
             
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
@@ -2265,7 +2994,8 @@ class ESPNClient:
     # Session Management
     # ---------------------------------------------------------
 
-    async def get_athletes(self, league: str, sport: Optional[str] = None, active: Optional[bool] = None, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    @traced
+    async def get_athletes(self, league: str, sport: Optional[str] = None, active: Optional[bool] = None, season: Optional[str] = None, output: str = "dict", fields: Optional[List[str]] = None, timeout_budget: Optional[float] = None) -> Any:
         """Get all athletes/players for a specific league, handling pagination automatically.
         The sport is automatically inferred for common leagues.
         
@@ -2276,58 +3006,65 @@ class ESPNClient:
                     Warning: Some leagues (like WNBA) throw a 400 Bad Request if this flag is passed.
                     If None (default), returns whatever the API provides natively.
             season: Optional year string (e.g. '2016') to fetch historical players.
+            output: 'dict' (default) for a list of dictionaries, 'record' for compact slotted records
+                    (see `espnpy.records`), 'arrow' for a pyarrow.Table, or 'numpy' for a dictionary of
+                    numpy arrays (one per field).
+            fields: Optional list of field names to return (e.g. ['id', 'displayName']). Extraction for
+                    every other field is skipped entirely. Defaults to all fields.
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
                     
         Returns:
-            A standardized list of dictionaries containing athlete details.
+            A standardized list of dictionaries containing athlete details (or the requested columnar form).
         """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.get_athletes(league, sport=sport, active=active, season=season, output=output, fields=fields)
+        check_output(output)
+        schema = project(ATHLETE_SCHEMA, fields)
         resolved_sport = self._resolve_sport(league, sport)
         
-        # 1. Fetch the first page of references with max limit
-        params = {"limit": 1000, "page": 1}
-        if active is not None:
-            params["active"] = "true" if active else "false"
-        if season:
-            params["season"] = season
+        with span("pages"):
+            # 1. Fetch the first page of references with max limit
+            params = {"limit": 1000, "page": 1}
+            if active is not None:
+                params["active"] = "true" if active else "false"
+            if season:
+                params["season"] = season
             
-        first_page = await self._get(f"/sports/{resolved_sport}/leagues/{league}/athletes", params=params)
-        
-        items = first_page.get("items", [])
-        page_count = first_page.get("pageCount", 1)
-        
-        # 2. If there are multiple pages (e.g., > 1000 athletes), fetch the remaining pages of URLs
-        if page_count > 1:
-            page_tasks = []
-            for page_idx in range(2, page_count + 1):
-                page_params = {"limit": 1000, "page": page_idx}
-                if active is not None:
-                    page_params["active"] = "true" if active else "false"
-                if season:
-                    page_params["season"] = season
-                page_tasks.append(
-                    self._get(f"/sports/{resolved_sport}/leagues/{league}/athletes", params=page_params)
-                )
+            first_page = await self._get(f"/sports/{resolved_sport}/leagues/{league}/athletes", params=params)
+        
+            items = list(first_page.get("items", []))
+            page_count = first_page.get("pageCount", 1)
+        
+            # 2. If there are multiple pages (e.g., > 1000 athletes), fetch the remaining pages of URLs
+            if page_count > 1:
+                page_tasks = []
+                for page_idx in range(2, page_count + 1):
+                    page_params = {"limit": 1000, "page": page_idx}
+                    if active is not None:
+                        page_params["active"] = "true" if active else "false"
+                    if season:
+                        page_params["season"] = season
+                    page_tasks.append(
+                        self._get(f"/sports/{resolved_sport}/leagues/{league}/athletes", params=page_params)
+                    )
             
-            additional_pages = await asyncio.gather(*page_tasks)
-            for page in additional_pages:
-                items.extend(page.get("items", []))
+                additional_pages = await asyncio.gather(*page_tasks)
+                for page in additional_pages:
+                    items.extend(page.get("items", []))
                 
         # 3. Extract all $ref URLs
         urls_to_fetch = [item.get("$ref") for item in items if "$ref" in item]
         
-        # 4. Fetch all individual athlete URLs concurrently
-        semaphore = asyncio.Semaphore(50)  # Limit to 50 concurrent requests at a time
+        with span("refs"):
+            # 4. Fetch all individual athlete URLs concurrently (bounded by the client-wide semaphore)
+            raw_athletes = await asyncio.gather(*[self.get_url(url) for url in urls_to_fetch])
         
-        async def fetch_with_semaphore(url):
-            async with semaphore:
-                return await self.get_url(url)
-                
-        athlete_tasks = [fetch_with_semaphore(url) for url in urls_to_fetch]
-        raw_athletes = await asyncio.gather(*athlete_tasks)
-        
-        # 5. Standardize the resulting athlete dictionaries
-        return [self._standardize_athlete(athlete) for athlete in raw_athletes]
+        # 5. Standardize the resulting athletes (only extracting the requested fields)
+        return build_output(schema, ATHLETE_SPEC.rows(raw_athletes, field_names(schema)), output)
 
-    async def get_team_roster(self, league: str, team_id: str, sport: Optional[str] = None) -> List[Dict[str, Any]]:
+    @traced
+    async def get_team_roster(self, league: str, team_id: str, sport: Optional[str] = None, output: str = "dict", timeout_budget: Optional[float] = None) -> Any:
         """Get the current active roster for a specific team.
         Note: ESPN's hidden API only supports current rosters for this endpoint.
         
@@ -2335,99 +3072,67 @@ class ESPNClient:
             league: The league (e.g., 'nba').
             team_id: The unique ID of the team (e.g., '1' for Atlanta Hawks).
             sport: Automatically inferred if not provided.
+            output: 'dict' (default), 'record' (compact slotted records), 'arrow' (a pyarrow.Table)
+                    or 'numpy' (a dictionary of numpy arrays).
+            timeout_budget: Optional seconds for the whole call, across all of its requests (see `espnpy.deadlines`).
             
         Returns:
-            A standardized list of athlete dictionaries currently on the roster.
+            A standardized list of athlete dictionaries currently on the roster (or the requested columnar form).
         """
+        if timeout_budget is not None:
+            async with deadline(timeout_budget):
+                return await self.get_team_roster(league, team_id, sport=sport, output=output)
+        check_output(output)
         resolved_sport = self._resolve_sport(league, sport)
         
-        # Look up the league's current active season because the URL requires it
-        league_info = await self._get(f"/sports/{resolved_sport}/leagues/{league}")
-        season = str(league_info.get("season", {}).get("year"))
-        if not season or season == "None":
-            raise ValueError(f"Could not determine the current active season for {league}.")
+        with span("season"):
+            # Look up the league's current active season because the URL requires it
+            league_info = await self._get(f"/sports/{resolved_sport}/leagues/{league}")
+            season = str(league_info.get("season", {}).get("year"))
+            if not season or season == "None":
+                raise ValueError(f"Could not determine the current active season for {league}.")
                 
-        # 1. Fetch the first page of references with max limit
-        params = {"limit": 1000, "page": 1}
-        first_page = await self._get(f"/sports/{resolved_sport}/leagues/{league}/seasons/{season}/teams/{team_id}/athletes", params=params)
-        
-        items = first_page.get("items", [])
-        page_count = first_page.get("pageCount", 1)
-        
-        # 2. If there are multiple pages
-        if page_count > 1:
-            page_tasks = [
-                self._get(f"/sports/{resolved_sport}/leagues/{league}/seasons/{season}/teams/{team_id}/athletes", params={"limit": 1000, "page": page_idx})
-                for page_idx in range(2, page_count + 1)
-            ]
-            additional_pages = await asyncio.gather(*page_tasks)
-            for page in additional_pages:
-                items.extend(page.get("items", []))
+        with span("pages"):
+            # 1. Fetch the first page of references with max limit
+            params = {"limit": 1000, "page": 1}
+            first_page = await self._get(f"/sports/{resolved_sport}/leagues/{league}/seasons/{season}/teams/{team_id}/athletes", params=params)
+        
+            items = list(first_page.get("items", []))
+            page_count = first_page.get("pageCount", 1)
+        
+            # 2. If there are multiple pages
+            if page_count > 1:
+                page_tasks = [
+                    self._get(f"/sports/{resolved_sport}/leagues/{league}/seasons/{season}/teams/{team_id}/athletes", params={"limit": 1000, "page": page_idx})
+                    for page_idx in range(2, page_count + 1)
+                ]
+                additional_pages = await asyncio.gather(*page_tasks)
+                for page in additional_pages:
+                    items.extend(page.get("items", []))
                 
         # 3. Extract all $ref URLs
         urls_to_fetch = [item.get("$ref") for item in items if "$ref" in item]
         
-        # 4. Fetch all individual athlete URLs concurrently
-        semaphore = asyncio.Semaphore(50)
-        
-        async def fetch_with_semaphore(url):
-            async with semaphore:
-                return await self.get_url(url)
-                
-        athlete_tasks = [fetch_with_semaphore(url) for url in urls_to_fetch]
-        raw_athletes = await asyncio.gather(*athlete_tasks)
+        with span("refs"):
+            # 4. Fetch all individual athlete URLs concurrently (bounded by the client-wide semaphore)
+            raw_athletes = await asyncio.gather(*[self.get_url(url) for url in urls_to_fetch])
         
-        # 5. Standardize the resulting athlete dictionaries (same format as league-wide athletes)
-        return [self._standardize_athlete(athlete) for athlete in raw_athletes]
+        # 5. Standardize the resulting athletes (same format as league-wide athletes)
+        return build_output(ATHLETE_SCHEMA, ATHLETE_SPEC.rows(raw_athletes), output)
 
     def _extract_team_id(self, ref_url: str) -> Optional[str]:
         """Helper to extract a team ID from a team $ref URL (e.g., '.../teams/12?lang=en')."""
-        if not ref_url:
-            return None
-        # Split by '/teams/' and grab the next part, then remove any query parameters
-        try:
-            parts = ref_url.split("/teams/")
-            if len(parts) > 1:
-                return parts[1].split("?")[0]
-        except Exception:
-            pass
-        return None
+        return team_id_from_ref(ref_url)
 
     def _standardize_athlete(self, athlete: Dict[str, Any]) -> Dict[str, Any]:
         """Helper to standardize the raw athlete dictionary returned from ESPN."""
-        headshot = athlete.get("headshot", {}).get("href")
-        position = athlete.get("position", {})
-        position_name = position.get("displayName") or position.get("name")
-        position_abbr = position.get("abbreviation")
-        
-        # Extract the team ID if they are currently linked to a team
-        team_id = None
-        team_ref = athlete.get("team", {}).get("$ref")
-        if team_ref:
-            team_id = self._extract_team_id(team_ref)
+        return dict(zip(self._ATHLETE_FIELDS, self._athlete_row(athlete)))
 
-        return {
-            "id": athlete.get("id"),
-            "teamId": team_id,
-            "slug": athlete.get("slug"),
-            "firstName": athlete.get("firstName"),
-            "lastName": athlete.get("lastName"),
-            "fullName": athlete.get("fullName"),
-            "displayName": athlete.get("displayName"),
-            "shortName": athlete.get("shortName"),
-            "weight": athlete.get("weight"),
-            "displayWeight": athlete.get("displayWeight"),
-            "height": athlete.get("height"),
-            "displayHeight": athlete.get("displayHeight"),
-            "age": athlete.get("age"),
-            "dateOfBirth": athlete.get("dateOfBirth"),
-            "jersey": athlete.get("jersey"),
-            "position": position_name,
-            "positionAbbreviation": position_abbr,
-            "active": athlete.get("active", False),
-            "headshot": headshot
-        }
+    def _athlete_row(self, athlete: Dict[str, Any]) -> tuple:
+        """Extract a raw athlete into a value tuple in `ATHLETE_SCHEMA` order."""
+        return ATHLETE_SPEC.compile()(athlete)
 
+    @traced
     async def get_athlete(self, league: str, athlete_id: str, sport: Optional[str] = None) -> Dict[str, Any]:
         """Get details for a specific athlete by their ID.
         
@@ -2444,11 +3149,29 @@ class ESPNClient:
         return self._standardize_athlete(athlete)
 
     async def close(self):
-        """Close the underlying HTTP session."""
-        await self._session.aclose()
+        """Close the HTTP session of the running event loop.
+
+        The client stays usable: a fresh session is created the next time it makes a request.
+        """
+        state = self._loop_states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            # A warmup or calendar download still running would otherwise go on to use the closed sessions.
+            # Wait for every cancellation to land, so a loop shut down right after (the sync client's) has nothing pending.
+            current = asyncio.current_task()
+            background = [task for task in (state.closer, state.warming, *state.calendars.values()) if task is not None and task is not current and not task.done()]
+            for task in background:
+                task.cancel()
+            if background:
+                await asyncio.gather(*background, return_exceptions=True)
+            for session in state.sessions:
+                await session.aclose()
 
     # Async context manager support (async with ESPNClient() as client:)
     async def __aenter__(self):
+        if self._warm:
+            warming = self._loop_state().warming
+            if warming is not None:
+                await warming
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,252 @@
+"""Columnar (Arrow / NumPy) output for the standardized endpoints.
+
+Every standardized shape has a fixed schema of (field name, type name). The standardizers in
+`ESPNClient` produce plain value tuples in schema order, and `ColumnBuffer` appends them straight into
+one list per column, so no per-row dictionaries are built when a columnar output is requested.
+
+Type names: 'string', 'int64', 'float64', 'bool' and 'list<string>'.
+
+`output="record"` returns the slotted record types from `espnpy.records`, `output="arrow"` requires the
+optional `pyarrow` dependency and `output="numpy"` requires `numpy`.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .records import Athlete, Game, NewsArticle, Play, StandingEntry, Team
+
+Schema = Tuple[Tuple[str, str], ...]
+
+OUTPUTS = ("dict", "record", "arrow", "numpy")
+
+ATHLETE_SCHEMA: Schema = (
+    ("id", "string"),
+    ("teamId", "string"),
+    ("slug", "string"),
+    ("firstName", "string"),
+    ("lastName", "string"),
+    ("fullName", "string"),
+    ("displayName", "string"),
+    ("shortName", "string"),
+    ("weight", "float64"),
+    ("displayWeight", "string"),
+    ("height", "float64"),
+    ("displayHeight", "string"),
+    ("age", "int64"),
+    ("dateOfBirth", "string"),
+    ("jersey", "string"),
+    ("position", "string"),
+    ("positionAbbreviation", "string"),
+    ("active", "bool"),
+    ("headshot", "string"),
+)
+
+TEAM_SCHEMA: Schema = (
+    ("id", "string"),
+    ("slug", "string"),
+    ("location", "string"),
+    ("name", "string"),
+    ("nickname", "string"),
+    ("abbreviation", "string"),
+    ("displayName", "string"),
+    ("shortDisplayName", "string"),
+    ("color", "string"),
+    ("alternateColor", "string"),
+    ("isActive", "bool"),
+    ("logo", "string"),
+)
+
+GAME_SCHEMA: Schema = (
+    ("id", "string"),
+    ("date", "string"),
+    ("name", "string"),
+    ("tournamentName", "string"),
+    ("shortName", "string"),
+    ("seasonYear", "int64"),
+    ("seasonType", "int64"),
+    ("seasonSlug", "string"),
+    ("status", "string"),
+    ("clock", "string"),
+    ("period", "int64"),
+    ("venue", "string"),
+    ("broadcasts", "list<string>"),
+    ("homeTeam", "string"),
+    ("homeTeamId", "string"),
+    ("homeScore", "string"),
+    ("homeLogo", "string"),
+    ("awayTeam", "string"),
+    ("awayTeamId", "string"),
+    ("awayScore", "string"),
+    ("awayLogo", "string"),
+    ("setScores", "string"),
+)
+
+STANDING_SCHEMA: Schema = tuple((name, "string") for name in (
+    "id", "name", "abbreviation", "logo", "group",
+    "wins", "losses", "ties", "winPercent", "gamesBehind",
+    "points", "rank", "streak", "pointsFor", "pointsAgainst", "differential",
+    "homeRecord", "awayRecord", "divisionRecord", "conferenceRecord", "lastTenRecord", "playoffSeed",
+))
+
+PLAY_SCHEMA: Schema = (
+    ("id", "string"),
+    ("text", "string"),
+    ("clock", "string"),
+    ("period", "int64"),
+    ("scoringPlay", "bool"),
+    ("scoreValue", "int64"),
+)
+
+NEWS_SCHEMA: Schema = (
+    ("id", "string"),
+    ("headline", "string"),
+    ("description", "string"),
+    ("published", "string"),
+    ("lastModified", "string"),
+    ("author", "string"),
+    ("premium", "bool"),
+    ("image", "string"),
+    ("url", "string"),
+)
+
+# The compact record class for each schema (`output="record"`)
+RECORD_TYPES: Dict[Schema, type] = {
+    ATHLETE_SCHEMA: Athlete,
+    TEAM_SCHEMA: Team,
+    GAME_SCHEMA: Game,
+    STANDING_SCHEMA: StandingEntry,
+    PLAY_SCHEMA: Play,
+    NEWS_SCHEMA: NewsArticle,
+}
+
+
+def field_names(schema: Schema) -> Tuple[str, ...]:
+    """Return just the field names of a schema, in order."""
+    return tuple(name for name, _ in schema)
+
+
+def project(schema: Schema, fields: Optional[Sequence[str]] = None) -> Schema:
+    """Narrow a schema down to the requested fields (in the requested order). None keeps every field."""
+    if fields is None:
+        return schema
+    types = dict(schema)
+    unknown = [name for name in fields if name not in types]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available fields: {', '.join(types)}.")
+    return tuple((name, types[name]) for name in fields)
+
+
+def check_output(output: str) -> None:
+    """Raise a ValueError for an unsupported `output=` value."""
+    if output not in OUTPUTS:
+        raise ValueError(f"Unsupported output '{output}'. Use one of: {', '.join(OUTPUTS)}.")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow output (output='arrow', boxscore exports) requires the optional 'pyarrow' dependency. "
+            "Install it with: pip install espnpy[arrow]"
+        ) from e
+    return pyarrow
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("output='numpy' requires numpy. Install it with: pip install numpy") from e
+    return numpy
+
+
+def arrow_type(pa: Any, type_name: str) -> Any:
+    """Map one of our schema type names to a pyarrow DataType."""
+    if type_name == "list<string>":
+        return pa.list_(pa.string())
+    return {"string": pa.string(), "int64": pa.int64(), "float64": pa.float64(), "bool": pa.bool_()}[type_name]
+
+
+def _arrow_array(pa: Any, column: List[Any], arrow_type: Any) -> Any:
+    try:
+        return pa.array(column, type=arrow_type)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # ESPN is not always consistent (e.g. news IDs come back as ints), so stringify string columns
+        if arrow_type != pa.string():
+            raise
+        return pa.array([None if v is None else str(v) for v in column], type=arrow_type)
+
+
+class ColumnBuffer:
+    """Accumulates value tuples straight into one list per schema column."""
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self.columns: List[List[Any]] = [[] for _ in schema]
+
+    def append(self, *values: Any) -> None:
+        for column, value in zip(self.columns, values):
+            column.append(value)
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> "ColumnBuffer":
+        columns = self.columns
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+        return self
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def clear(self) -> None:
+        self.columns = [[] for _ in self.schema]
+
+    def to_arrow(self) -> Any:
+        """Build a `pyarrow.Table` with the buffer's fixed schema."""
+        pa = _require_pyarrow()
+        arrow_schema = pa.schema([(name, arrow_type(pa, type_name)) for name, type_name in self.schema])
+        return pa.Table.from_arrays(
+            [_arrow_array(pa, column, field.type) for column, field in zip(self.columns, arrow_schema)],
+            schema=arrow_schema,
+        )
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Build a `{field: numpy.ndarray}` dictionary. Numeric columns with missing values become float64 with NaN."""
+        np = _require_numpy()
+        arrays = {}
+        for (name, type_name), column in zip(self.schema, self.columns):
+            if type_name in ("int64", "float64"):
+                has_missing = any(v is None for v in column)
+                if type_name == "int64" and not has_missing:
+                    arrays[name] = np.array(column, dtype=np.int64)
+                else:
+                    arrays[name] = np.array([np.nan if v is None else v for v in column], dtype=np.float64)
+            elif type_name == "bool" and not any(v is None for v in column):
+                arrays[name] = np.array(column, dtype=bool)
+            else:
+                array = np.empty(len(column), dtype=object)
+                array[:] = column
+                arrays[name] = array
+        return arrays
+
+
+def build_output(schema: Schema, rows: Iterable[Sequence[Any]], output: str = "dict") -> Any:
+    """Turn an iterable of value tuples (in schema order) into the requested output form.
+
+    Args:
+        schema: The fixed (name, type) schema the tuples follow.
+        rows: The value tuples, usually a generator from one of the standardizers.
+        output: 'dict' (a list of dictionaries), 'record' (a list of slotted records),
+                'arrow' (a pyarrow.Table) or 'numpy' (a dict of arrays).
+    """
+    check_output(output)
+    if output == "dict":
+        names = field_names(schema)
+        return [dict(zip(names, row)) for row in rows]
+    if output == "record":
+        record = RECORD_TYPES.get(schema)
+        if record is None:
+            raise ValueError("output='record' needs every field; it cannot be combined with fields=[...].")
+        return [record(*row) for row in rows]
+
+    buffer = ColumnBuffer(schema).extend(rows)
+    return buffer.to_arrow() if output == "arrow" else buffer.to_numpy()
@@ -0,0 +1,54 @@
+"""Deadlines that cover every sub-request of a composite call.
+
+Composite operations make many requests (`get_team_roster`: a league lookup, pages and one request per
+athlete; `find_athlete`: a search and then a fetch), and each request has its own timeout, so the whole
+call has no upper bound. A deadline bounds the whole thing instead:
+
+    async with deadline(2.0):
+        roster = await client.nba.roster("13")
+
+    # Or per call, on the composite methods
+    roster = await client.nba.roster("13", timeout_budget=2.0)
+
+When the budget runs out, every outstanding sub-request is cancelled and `DeadlineExceeded` is raised.
+Deadlines nest: an inner deadline can only shorten the outer one, never extend it. The deadline is stored
+in a context variable, so it follows the call into every task it spawns.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+from .exceptions import DeadlineExceeded
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("espnpy_deadline", default=None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (None when no deadline is set)."""
+    current = _DEADLINE.get()
+    return None if current is None else current - time.monotonic()
+
+
+@asynccontextmanager
+async def deadline(seconds: Optional[float]) -> AsyncIterator[None]:
+    """Bound everything awaited inside the block to `seconds` in total. None means no deadline."""
+    if seconds is None:
+        yield
+        return
+
+    current = _DEADLINE.get()
+    until = time.monotonic() + seconds
+    if current is not None and current < until:
+        until = current
+    token = _DEADLINE.set(until)
+    try:
+        async with asyncio.timeout(until - time.monotonic()) as scope:
+            yield
+    except TimeoutError as e:
+        if not scope.expired():
+            raise  # Someone else's timeout (e.g. a nested deadline), not ours
+        raise DeadlineExceeded(seconds) from e
+    finally:
+        _DEADLINE.reset(token)
@@ -0,0 +1,28 @@
+"""Exceptions raised by espnpy (on top of the `httpx` errors that surface from failed requests)."""
+from typing import Optional
+
+import httpx
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised, without touching the network, while the circuit breaker of a host is open.
+
+    It is an `httpx.TransportError`, so code that already handles connection failures (and the built-in
+    retries) treats it the same way.
+    """
+
+    def __init__(self, host: str, retry_after: float, request: Optional[httpx.Request] = None):
+        super().__init__(f"The circuit breaker for {host} is open; failing fast (next probe in {retry_after:.1f}s).", request=request)
+        self.host = host
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call's `timeout_budget` (or an enclosing `deadline()`) runs out.
+
+    Every request that was still outstanding has been cancelled by then.
+    """
+
+    def __init__(self, budget: float):
+        super().__init__(f"The {budget:g}s time budget was exhausted before the call completed.")
+        self.budget = budget
@@ -0,0 +1,197 @@
+"""Season-wide boxscore export to columnar Parquet / Arrow files.
+
+Walks every completed game of a league season, fetches the game summaries concurrently and flattens
+the standardized boxscores into two long-format tables:
+
+* ``player_game``: one row per (game, player, stat category, stat label)
+* ``team_game``: one row per (game, team, stat label)
+
+Rows are buffered straight into column lists and flushed to disk every ``batch_size`` games, so memory
+stays bounded no matter how many thousands of games a season has.
+
+Requires the optional ``pyarrow`` dependency (``pip install espnpy[arrow]``).
+"""
+import glob
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .columnar import ColumnBuffer, _require_pyarrow
+from .stats import parse_columns
+
+if TYPE_CHECKING:
+    from .client import ESPNClient
+
+
+# (column name, arrow type name) for each output table. The order is the order values are appended in.
+PLAYER_GAME_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("gameId", "string"),
+    ("teamId", "string"),
+    ("athleteId", "string"),
+    ("athleteName", "string"),
+    ("position", "string"),
+    ("starter", "bool"),
+    ("category", "string"),
+    ("stat", "string"),
+    ("value", "float64"),
+    ("displayValue", "string"),
+)
+
+TEAM_GAME_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("gameId", "string"),
+    ("teamId", "string"),
+    ("teamName", "string"),
+    ("abbreviation", "string"),
+    ("stat", "string"),
+    ("value", "float64"),
+    ("displayValue", "string"),
+)
+
+
+class _PartitionBuffer(ColumnBuffer):
+    """A ColumnBuffer that flushes its rows to disk as numbered part files."""
+
+    def __init__(self, schema: Tuple[Tuple[str, str], ...], directory: str, file_format: str):
+        super().__init__(schema)
+        self.directory = directory
+        self.file_format = file_format
+        self.rows_written = 0
+        self.files: List[str] = []
+
+    def flush(self) -> None:
+        if not len(self):
+            return
+        pa = _require_pyarrow()
+        import pyarrow.feather
+        import pyarrow.parquet
+        table = self.to_arrow()
+
+        os.makedirs(self.directory, exist_ok=True)
+        extension = "parquet" if self.file_format == "parquet" else "arrow"
+        if not self.files:
+            # Part files left over from an earlier export of the same partition would be read back as part of this one
+            for stale in glob.glob(os.path.join(glob.escape(self.directory), "part-*")):
+                os.remove(stale)
+        file_path = os.path.join(self.directory, f"part-{len(self.files):05d}.{extension}")
+        if self.file_format == "parquet":
+            pa.parquet.write_table(table, file_path)
+        else:
+            pa.feather.write_feather(table, file_path)
+
+        self.files.append(file_path)
+        self.rows_written += len(self)
+        self.clear()
+
+
+def _append_table(buffer: _PartitionBuffer, entities: List[Tuple[Tuple[Any, ...], Dict[str, Any]]], sport: Optional[str]) -> None:
+    """Parse the stats of several entities (one {label: display value} dict each) column by column into `buffer`.
+
+    Each label is parsed as one column across all the entities, so its parser is resolved once per table. An
+    entity that lacks a label gets no rows for it.
+    """
+    labels = list(dict.fromkeys(label for _, stats in entities for label in stats))
+    rows = [[stats.get(label) for label in labels] for _, stats in entities]
+    for index, (label, names, columns) in enumerate(parse_columns(labels, rows, sport)):
+        for row, (prefix, stats) in enumerate(entities):
+            if label not in stats:
+                continue
+            for name, column in zip(names, columns):
+                buffer.append(*prefix, name, column[row], rows[row][index])
+
+
+def _append_boxscore(boxscore: Dict[str, Any], players: _PartitionBuffer, teams: _PartitionBuffer, sport: Optional[str] = None) -> None:
+    """Flatten one standardized boxscore (from `_standardize_boxscore`) into the long-format buffers.
+
+    Every stat goes through the stat schema, so pairs like FG "10-21" become two rows (FGM, FGA)
+    that both keep the original display string.
+    """
+    _append_table(teams, [
+        ((team.get("gameId"), team.get("id"), team.get("name"), team.get("abbreviation")), team.get("stats", {}))
+        for team in boxscore.get("teams", [])
+    ], sport)
+
+    # Football/Baseball nest stats by category (passing, rushing...), Basketball keeps them flat
+    categories: Dict[Optional[str], List[Tuple[Tuple[Any, ...], Dict[str, Any]]]] = {}
+    for player in boxscore.get("players", []):
+        base = (
+            player.get("gameId"), player.get("teamId"), player.get("id"), player.get("name"),
+            player.get("position"), bool(player.get("starter")),
+        )
+        flat: Dict[str, Any] = {}
+        for key, value in player.get("stats", {}).items():
+            if isinstance(value, dict):
+                categories.setdefault(key, []).append((base + (key,), value))
+            else:
+                flat[key] = value
+        if flat:
+            categories.setdefault(None, []).append((base + (None,), flat))
+    for entities in categories.values():
+        _append_table(players, entities, sport)
+
+
+async def export_season_boxscores(
+    client: "ESPNClient",
+    league: str,
+    path: str,
+    season: Optional[str] = None,
+    season_type: Optional[str] = None,
+    sport: Optional[str] = None,
+    event_ids: Optional[Iterable[str]] = None,
+    batch_size: int = 250,
+    file_format: str = "parquet",
+) -> Dict[str, Any]:
+    """Export every completed game of a season as long-format player-game and team-game tables.
+
+    Files are written Hive-style as `{path}/{table}/league={league}/season={season}/part-NNNNN.parquet`,
+    so they can be read back with `pyarrow.dataset`, pandas, Polars or DuckDB.
+
+    Args:
+        client: The ESPNClient to fetch with.
+        league: The league (e.g., 'nba').
+        path: The root output directory.
+        season: Optional season year (e.g. '2024'). Defaults to the current season.
+        season_type: Optional ESPN season type ID (1=Preseason, 2=Regular Season, 3=Postseason).
+        sport: Automatically inferred if not provided.
+        event_ids: Optional explicit list of event IDs to export instead of walking the season.
+        batch_size: How many games to buffer before flushing a part file. Defaults to 250.
+        file_format: 'parquet' (default) or 'arrow' (Arrow IPC / Feather v2).
+
+    Returns:
+        A dictionary with the number of games and rows written and the list of files per table.
+    """
+    if file_format not in ("parquet", "arrow"):
+        raise ValueError(f"Unsupported file_format '{file_format}'. Use 'parquet' or 'arrow'.")
+    _require_pyarrow()
+
+    resolved_sport = client._resolve_sport(league, sport)
+    if event_ids is None:
+        calendar = await client.get_season_calendar(league, season=season, sport=resolved_sport)
+        season = season or calendar.get("seasonYear")
+        raw_games = await client.get_season_scoreboard(league, season=season, sport=resolved_sport, season_type=season_type, raw=True)
+        # Only completed games have a boxscore worth exporting
+        event_ids = [
+            event["id"] for event in raw_games.get("events", [])
+            if any(c.get("status", {}).get("type", {}).get("completed") for c in event.get("competitions", []))
+        ]
+
+    partition = os.path.join(f"league={league}", f"season={season or 'current'}")
+    players = _PartitionBuffer(PLAYER_GAME_SCHEMA, os.path.join(path, "player_game", partition), file_format)
+    teams = _PartitionBuffer(TEAM_GAME_SCHEMA, os.path.join(path, "team_game", partition), file_format)
+
+    errors: Dict[str, Exception] = {}
+    games = 0
+    async for summary in client.get_game_summaries(league, event_ids, sport=resolved_sport, errors=errors):
+        _append_boxscore(summary.get("boxscore", {}), players, teams, resolved_sport)
+        games += 1
+        if games % batch_size == 0:
+            players.flush()
+            teams.flush()
+    players.flush()
+    teams.flush()
+
+    return {
+        "games": games,
+        "failedEvents": list(errors),
+        "playerRows": players.rows_written,
+        "teamRows": teams.rows_written,
+        "files": {"player_game": players.files, "team_game": teams.files},
+    }
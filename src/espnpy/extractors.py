@@ -0,0 +1,658 @@
+"""Declarative extractor specs for the standardized shapes.
+
+Every standardized output (athletes, teams, games, standings, plays, news, odds, leaderboards and the
+boxscore entries) is described once as a `Spec`: an ordered mapping of output field -> path expression
+into the raw ESPN JSON. A spec is compiled into a single plain Python row function the first time a
+given set of fields is asked for, and that function is cached and reused on every call. So:
+
+* Hot-path extraction has exactly one place to optimize (`Spec.compile`).
+* `fields=[...]` projection is free: the compiled function only contains the requested fields, and
+  derived values (like a game's home/away sides) are only computed when a requested field needs them.
+
+Expressions:
+    P("a.b.0.c")            nested lookup (dict keys, or list indexes for numeric segments). Missing or
+                            null intermediate values fall through to the default instead of raising.
+    P(("a", "vs. Div."))    the same, with the segments spelled out (for keys that contain dots)
+    P("a.b", default="0")   default for the final key (same semantics as dict.get(key, default))
+    P("")                   the source object itself
+    P("$sides.0")           a derived value (see below); purely numeric paths into it index it directly
+    First(e1, e2, ...)      the first truthy expression (`e1 or e2 or ...`), optionally with a default
+    Const(value)            a constant
+    Fn(func, *args)         `func(*args)`, where each argument is an expression (plain strings are paths)
+
+A spec's `derived` expressions are computed once per row, before the fields, and only when a selected
+field (or another needed derived value) references them through a `$name` path.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+_EMPTY: Dict[str, Any] = {}  # Shared, never mutated: the fallback for missing intermediate objects
+_MISSING = object()  # "Not computed yet" marker for the lazy views' memo
+
+
+def _at(seq: Any, index: int) -> Any:
+    """Safe list indexing for JSON values: None instead of IndexError/TypeError."""
+    try:
+        return seq[index]
+    except (IndexError, KeyError, TypeError):
+        return None
+
+
+class P:
+    """A (dotted) path into the source object."""
+
+    __slots__ = ("segments", "default")
+
+    def __init__(self, path: Union[str, Sequence[str]], default: Any = None):
+        self.segments: Tuple[str, ...] = tuple(s for s in path.split(".") if s) if isinstance(path, str) else tuple(path)
+        self.default = default
+
+
+class First:
+    """The first truthy of several expressions (`a or b or ...`), falling back to `default`."""
+
+    __slots__ = ("exprs", "default")
+
+    def __init__(self, *exprs: Any, default: Any = None):
+        self.exprs = tuple(_expr(e) for e in exprs)
+        self.default = default
+
+
+class Const:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class Fn:
+    """A computed value: `func(*args)` with each argument itself an expression."""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self.func = func
+        self.args = tuple(_expr(a) for a in args)
+
+
+def _expr(value: Any) -> Any:
+    return P(value) if isinstance(value, (str, tuple)) else value
+
+
+class _Codegen:
+    """Turns expressions into Python source, collecting the constants/functions they reference.
+
+    Every intermediate object on a path (e.g. `competition.status`) is looked up once per row and kept
+    in a local variable, so fields that share a prefix never re-walk the nested dicts.
+    """
+
+    def __init__(self):
+        self.namespace: Dict[str, Any] = {"_E": _EMPTY, "_M": _MISSING, "_at": _at}
+        self.lines: List[str] = []
+        self._locals: Dict[Tuple[str, ...], str] = {}
+
+    def constant(self, value: Any) -> str:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return repr(value)
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, expr: Any) -> str:
+        if isinstance(expr, P):
+            return self._path(expr)
+        if isinstance(expr, First):
+            parts = [self.emit(e) for e in expr.exprs]
+            if expr.default is not None:
+                parts.append(self.constant(expr.default))
+            return "(" + " or ".join(parts) + ")"
+        if isinstance(expr, Const):
+            return self.constant(expr.value)
+        if isinstance(expr, Fn):
+            func = f"_f{len(self.namespace)}"
+            self.namespace[func] = expr.func
+            return f"{func}({', '.join(self.emit(a) for a in expr.args)})"
+        raise TypeError(f"Not an extractor expression: {expr!r}")
+
+    def _intermediate(self, key: Tuple[str, ...], code: str) -> str:
+        """Bind an intermediate object to a local variable (once) and return the variable's name."""
+        name = self._locals.get(key)
+        if name is None:
+            name = self._locals[key] = f"v{len(self._locals)}"
+            self.lines.append(f"    {name} = {code}")
+        return name
+
+    def _path(self, expr: P) -> str:
+        segments = expr.segments
+        code = "src"
+        if segments and segments[0].startswith("$"):
+            code, segments = f"d_{segments[0][1:]}", segments[1:]
+            if all(segment.isdigit() for segment in segments):
+                # Positions in a derived tuple come from our own functions, so they're indexed directly
+                return code + "".join(f"[{segment}]" for segment in segments)
+
+        key: Tuple[str, ...] = (code,)
+        for i, segment in enumerate(segments):
+            last = i == len(segments) - 1
+            if segment.isdigit():
+                lookup = f"_at({code}, {segment})"
+            elif last:
+                default = "" if expr.default is None else f", {self.constant(expr.default)}"
+                lookup = f"{code}.get({segment!r}{default})"
+            else:
+                lookup = f"{code}.get({segment!r})"
+
+            if last:
+                code = lookup
+            else:
+                key += (segment,)
+                code = self._intermediate(key, f"{lookup} or _E")
+        if not segments and expr.default is not None:
+            code = f"({code} if {code} is not None else {self.constant(expr.default)})"
+        return code
+
+
+def _references(expr: Any) -> Iterable[str]:
+    """The names of the derived values an expression depends on."""
+    if isinstance(expr, P):
+        if expr.segments and expr.segments[0].startswith("$"):
+            yield expr.segments[0][1:]
+    elif isinstance(expr, First):
+        for e in expr.exprs:
+            yield from _references(e)
+    elif isinstance(expr, Fn):
+        for e in expr.args:
+            yield from _references(e)
+
+
+class Spec:
+    """An output shape: ordered field expressions plus shared derived values, compiled per projection."""
+
+    def __init__(self, name: str, fields: Dict[str, Any], derived: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.fields = {k: _expr(v) for k, v in fields.items()}
+        self.derived = {k: _expr(v) for k, v in (derived or {}).items()}
+        self.names: Tuple[str, ...] = tuple(self.fields)
+        self._compiled: Dict[Tuple[str, ...], Callable[[Any], tuple]] = {}
+        self._getters: Dict[str, Callable[[Any, Dict[str, Any]], Any]] = {}
+        self._getter_tables: Dict[Tuple[str, ...], Dict[str, Callable[[Any, Dict[str, Any]], Any]]] = {}
+
+    def source(self, names: Optional[Sequence[str]] = None) -> str:
+        """The generated Python source of the row function for these fields (handy for debugging)."""
+        return self._generate(tuple(names) if names is not None else self.names)[0]
+
+    def compile(self, names: Optional[Sequence[str]] = None) -> Callable[[Any], tuple]:
+        """Return the (cached) row function that extracts `names` (default: every field) as a tuple."""
+        key = tuple(names) if names is not None else self.names
+        row = self._compiled.get(key)
+        if row is None:
+            source, namespace = self._generate(key)
+            exec(compile(source, f"<espnpy spec {self.name}>", "exec"), namespace)
+            row = self._compiled[key] = namespace["row"]
+        return row
+
+    def getter(self, name: str) -> Callable[[Any, Dict[str, Any]], Any]:
+        """Return the (cached) single-field function `field(src, memo)` used by the lazy views.
+
+        Derived values are looked up in (and stored into) `memo`, so fields that share one, like a
+        game's home and away team, only compute it once per source.
+        """
+        field = self._getters.get(name)
+        if field is None:
+            source, namespace = self._generate((name,), lazy=True)
+            exec(compile(source, f"<espnpy spec {self.name}.{name}>", "exec"), namespace)
+            field = self._getters[name] = namespace["field"]
+        return field
+
+    def getters(self, names: Optional[Sequence[str]] = None) -> Dict[str, Callable[[Any, Dict[str, Any]], Any]]:
+        """Return the (cached) ordered `{field: getter}` table for these fields (default: every field)."""
+        key = tuple(names) if names is not None else self.names
+        table = self._getter_tables.get(key)
+        if table is None:
+            table = self._getter_tables[key] = {name: self.getter(name) for name in key}
+        return table
+
+    def _generate(self, names: Tuple[str, ...], lazy: bool = False) -> Tuple[str, Dict[str, Any]]:
+        unknown = [n for n in names if n not in self.fields]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available fields: {', '.join(self.names)}.")
+
+        # Work out which derived values are needed (derived values may build on earlier ones)
+        needed = set()
+        pending = [ref for n in names for ref in _references(self.fields[n])]
+        while pending:
+            ref = pending.pop()
+            if ref not in needed:
+                needed.add(ref)
+                pending.extend(_references(self.derived[ref]))
+
+        gen = _Codegen()
+        for name, expr in self.derived.items():
+            if name in needed:
+                if lazy:
+                    gen.lines.append(f"    d_{name} = memo.get({name!r}, _M)")
+                    gen.lines.append(f"    if d_{name} is _M:")
+                    # Intermediate locals bound while emitting the derived value belong inside the branch
+                    start = len(gen.lines)
+                    value = gen.emit(expr)
+                    gen.lines[start:] = ["    " + line for line in gen.lines[start:]]
+                    gen._locals.clear()
+                    gen.lines.append(f"        d_{name} = memo[{name!r}] = {value}")
+                else:
+                    value = gen.emit(expr)
+                    gen.lines.append(f"    d_{name} = {value}")
+        if lazy:
+            value = gen.emit(self.fields[names[0]])
+            lines = ["def field(src, memo):", *gen.lines, f"    return {value}"]
+            return "\n".join(lines) + "\n", gen.namespace
+        values = ", ".join(gen.emit(self.fields[n]) for n in names)
+        lines = ["def row(src):", *gen.lines, f"    return ({values}{',' if len(names) == 1 else ''})"]
+        return "\n".join(lines) + "\n", gen.namespace
+
+    def rows(self, sources: Iterable[Any], names: Optional[Sequence[str]] = None) -> Iterable[tuple]:
+        """Extract every source into a value tuple."""
+        return map(self.compile(names), sources)
+
+    def dicts(self, sources: Iterable[Any], names: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Extract every source into a dictionary."""
+        keys = tuple(names) if names is not None else self.names
+        return [dict(zip(keys, row)) for row in self.rows(sources, keys)]
+
+
+def team_id_from_ref(ref_url: Optional[str]) -> Optional[str]:
+    """Extract a team ID from a team $ref URL (e.g., '.../teams/12?lang=en')."""
+    if not ref_url:
+        return None
+    # Split by '/teams/' and grab the next part, then remove any query parameters
+    try:
+        parts = ref_url.split("/teams/")
+        if len(parts) > 1:
+            return parts[1].split("?")[0]
+    except Exception:
+        pass
+    return None
+
+
+# --- Athletes & Teams (raw CORE objects) ---
+
+ATHLETE_SPEC = Spec("athlete", {
+    "id": "id",
+    # The team ID, if they are currently linked to a team
+    "teamId": Fn(team_id_from_ref, "team.$ref"),
+    "slug": "slug",
+    "firstName": "firstName",
+    "lastName": "lastName",
+    "fullName": "fullName",
+    "displayName": "displayName",
+    "shortName": "shortName",
+    "weight": "weight",
+    "displayWeight": "displayWeight",
+    "height": "height",
+    "displayHeight": "displayHeight",
+    "age": "age",
+    "dateOfBirth": "dateOfBirth",
+    "jersey": "jersey",
+    "position": First("position.displayName", "position.name"),
+    "positionAbbreviation": "position.abbreviation",
+    "active": P("active", default=False),
+    "headshot": "headshot.href",
+})
+
+TEAM_SPEC = Spec("team", {
+    "id": "id",
+    "slug": "slug",
+    "location": "location",
+    "name": "name",
+    "nickname": "nickname",  # Note: Some sports omit nickname
+    "abbreviation": "abbreviation",
+    "displayName": "displayName",
+    "shortDisplayName": "shortDisplayName",
+    "color": "color",
+    "alternateColor": "alternateColor",
+    "isActive": P("isActive", default=True),
+    "logo": "logos.0.href",
+})
+
+
+# --- Scoreboard games (source: {"event": ..., "competition": ...}) ---
+
+_NO_SIDE = (None, None, None, None, [])
+
+
+def iter_game_sources(raw_data: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Yield a source for every competition (game, match or race) on a scoreboard."""
+    for event in raw_data.get("events", []):
+        # Team sports and Racing use "competitions" directly on the event
+        if "competitions" in event:
+            competitions = event.get("competitions", [])
+        # Tennis uses "groupings" which contain the "competitions" (matches)
+        elif "groupings" in event:
+            competitions = []
+            for grouping in event.get("groupings", []):
+                competitions.extend(grouping.get("competitions", []))
+        else:
+            competitions = []
+
+        for competition in competitions:
+            yield {"event": event, "competition": competition}
+
+
+def _competitor_sides(competition: Dict[str, Any], status: Optional[str]) -> Tuple[tuple, tuple]:
+    """Find the (home, away) sides of a competition, each as (name, id, score, logo, linescores)."""
+    home, away = _NO_SIDE, _NO_SIDE
+    for idx, comp in enumerate(competition.get("competitors", [])):
+        # Competitor can be a team or an athlete
+        team_info = comp.get("team") or comp.get("athlete") or {}
+        t_name = team_info.get("displayName")
+        t_id = team_info.get("id")
+        t_logo = team_info.get("logo") or team_info.get("headshot", {}).get("href") if isinstance(team_info.get("headshot"), dict) else team_info.get("flag", {}).get("href")
+
+        # Set Scores / Linescores (e.g., [6.0, 6.0])
+        linescores = comp.get("linescores", [])
+        ls_values = [str(int(ls.get("value", 0))) for ls in linescores] if linescores else []
+
+        # Main Score (Overall wins or sets won)
+        # In Tennis, comp.get("score") is usually null, so we sum the 'winner: true' linescores
+        score_raw = comp.get("score")
+        if score_raw is None and linescores:
+            score_raw = sum(1 for ls in linescores if ls.get("winner"))
+            if not score_raw and status == "Final": # fallback if winner boolean isn't set perfectly
+                score_raw = ls_values[-1] if ls_values else "0"
+
+        if isinstance(score_raw, dict):
+            score = score_raw.get("displayValue")
+        else:
+            score = str(score_raw) if score_raw is not None else None
+
+        side = (t_name, t_id, score, t_logo, ls_values)
+        # For Team sports
+        if comp.get("homeAway") == "home":
+            home = side
+        elif comp.get("homeAway") == "away":
+            away = side
+        # For Individual sports (Tennis/Racing) where home/away is null
+        elif idx == 0:
+            home = side
+        elif idx == 1:
+            away = side
+    return home, away
+
+
+def _set_scores(sides: Tuple[tuple, tuple]) -> str:
+    # Format linescores into a readable string (e.g., "6-3, 6-4")
+    home_linescores, away_linescores = sides[0][4], sides[1][4]
+    if home_linescores and away_linescores and len(home_linescores) == len(away_linescores):
+        return ", ".join([f"{h}-{a}" for h, a in zip(home_linescores, away_linescores)])
+    return ""
+
+
+def _broadcasts(broadcasts: Optional[List[Dict[str, Any]]]) -> List[str]:
+    return [b.get("names", [])[0] for b in broadcasts or () if b.get("names")]
+
+
+GAME_SPEC = Spec("game", {
+    # Basic Info. Fallback to event name if competition doesn't have one (Tennis)
+    "id": First("competition.id", "event.id"),
+    "date": First("competition.date", "event.date"),
+    "name": First("competition.name", "event.name"),
+    "tournamentName": "event.name",  # Usually the overall event/tournament
+    "shortName": First("competition.shortName", "event.shortName"),
+    "seasonYear": "event.season.year",
+    "seasonType": "event.season.type",
+    "seasonSlug": "event.season.slug",
+    # Status (e.g., "Scheduled", "Final", "3rd Quarter")
+    "status": "competition.status.type.description",
+    "clock": "competition.status.displayClock",
+    "period": "competition.status.period",
+    # Venue and TV Networks
+    "venue": "competition.venue.fullName",
+    "broadcasts": Fn(_broadcasts, "competition.broadcasts"),
+    # Teams and Scores
+    "homeTeam": "$sides.0.0",
+    "homeTeamId": "$sides.0.1",
+    "homeScore": "$sides.0.2",
+    "homeLogo": "$sides.0.3",
+    "awayTeam": "$sides.1.0",
+    "awayTeamId": "$sides.1.1",
+    "awayScore": "$sides.1.2",
+    "awayLogo": "$sides.1.3",
+    "setScores": Fn(_set_scores, "$sides"),  # Specifically added for Tennis/Volleyball
+}, derived={
+    "sides": Fn(_competitor_sides, "competition", "competition.status.type.description"),
+})
+
+
+# --- Standings (source: {"group": ..., "entry": ...}) ---
+
+def iter_standing_sources(raw_data: Dict[str, Any]) -> Iterable[Tuple[Spec, Dict[str, Any]]]:
+    """Yield (spec, source) pairs for every entry of a raw standings or rankings payload."""
+    # If we pulled Rankings (Tennis/Golf/MMA)
+    if "rankings" in raw_data:
+        for group in raw_data.get("rankings", []):
+            group_name = group.get("name", "Overall")
+            for rank_entry in group.get("ranks", []):
+                yield RANKING_SPEC, {"group": group_name, "entry": rank_entry}
+    else:
+        # Standings are usually grouped by conference/league (e.g., AFC, NFC or Eastern, Western)
+        for group in raw_data.get("children", []):
+            group_name = group.get("name", "Overall")
+            for entry in group.get("standings", {}).get("entries", []):
+                yield STANDING_SPEC, {"group": group_name, "entry": entry}
+
+
+def _stats_by_name(stats: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    # ESPN provides a list of stats (wins, losses, ties, pct). We flatten this into a dict.
+    return {s.get("name"): s.get("displayValue") for s in stats or () if "name" in s and "displayValue" in s}
+
+
+def _logo_or_flag(logos: Optional[List[Dict[str, Any]]], flag: Any) -> Any:
+    # A team's first logo (even one without an href), or the flag of an entity with no logos (e.g. a driver's country)
+    if logos:
+        return logos[0].get("href") if isinstance(logos[0], dict) else None
+    return flag
+
+
+STANDING_SPEC = Spec("standing", {
+    "id": P("$entity.id", default=""),
+    "name": P("$entity.displayName", default=""),
+    "abbreviation": P("$entity.abbreviation", default=""),
+    "logo": Fn(_logo_or_flag, "$entity.logos", "$entity.flag.href"),
+    "group": "group",
+    "wins": P("$stats.wins", default="0"),
+    "losses": P("$stats.losses", default="0"),
+    "ties": P("$stats.ties", default="0"),
+    "winPercent": P("$stats.winPercent", default="0"),
+    "gamesBehind": P("$stats.gamesBehind", default="-"),
+    "points": First("$stats.championshipPts", "$stats.points", default="0"),  # For Racing/Tennis
+    "rank": First("$stats.rank", default="-"),  # For Racing/Tennis
+    "streak": P("$stats.streak", default="-"),
+    "pointsFor": P("$stats.pointsFor", default="0"),
+    "pointsAgainst": P("$stats.pointsAgainst", default="0"),
+    "differential": P("$stats.differential", default="0"),
+    "homeRecord": P("$stats.Home", default="-"),
+    "awayRecord": P("$stats.Road", default="-"),
+    "divisionRecord": P(("$stats", "vs. Div."), default="-"),
+    "conferenceRecord": P(("$stats", "vs. Conf."), default="-"),
+    "lastTenRecord": P("$stats.Last Ten Games", default="-"),
+    "playoffSeed": P("$stats.playoffSeed", default="-"),
+}, derived={
+    # Team sports use "team", Racing/Tennis use "athlete" or "constructor"
+    "entity": First("entry.team", "entry.athlete", "entry.constructor", default=_EMPTY),
+    "stats": Fn(_stats_by_name, "entry.stats"),
+})
+
+RANKING_SPEC = Spec("ranking", {
+    "id": P("entry.athlete.id", default=""),
+    "name": P("entry.athlete.displayName", default=""),
+    "abbreviation": P("entry.athlete.shortname", default=""),
+    "logo": First(P("entry.athlete.headshot", default=""), P("entry.athlete.flag", default="")),
+    "group": "group",
+    "wins": Const("0"),
+    "losses": Const("0"),
+    "ties": Const("0"),
+    "winPercent": Const("0"),
+    "gamesBehind": Const("-"),
+    "points": Fn(str, P("entry.points", default=0)),
+    "rank": Fn(str, P("entry.current", default=0)),
+    "streak": P("entry.trend", default="-"),
+    "pointsFor": Const("0"),
+    "pointsAgainst": Const("0"),
+    "differential": Const("0"),
+    "homeRecord": Const("-"),
+    "awayRecord": Const("-"),
+    "divisionRecord": Const("-"),
+    "conferenceRecord": Const("-"),
+    "lastTenRecord": Const("-"),
+    "playoffSeed": Const("-"),
+})
+
+_SORT_FIELDS = ("rank", "points", "winPercent")
+
+
+def standing_sort_value(spec: Spec, source: Dict[str, Any]) -> float:
+    """Sort key for standings: the best team gets the highest number (sorted with reverse=True)."""
+    rank, points, pct_str = spec.compile(_SORT_FIELDS)(source)
+    try:
+        # If there is a rank, we want the lowest rank, so Rank 1 = 9999, Rank 2 = 9998.
+        if rank and rank != "-":
+            return 10000 - float(rank)
+
+        # If there are points (like F1), sort by points
+        if points and points != "0" and points != "-":
+            return float(points)
+
+        # Fallback to standard win percentage
+        if not pct_str or pct_str == "-":
+            return 0.0
+        return float(pct_str)
+    except ValueError:
+        return 0.0
+
+
+# --- Game summary pieces ---
+
+SUMMARY_FIELDS: Tuple[str, ...] = (
+    "id", "gameInfo", "boxscore", "odds", "plays", "scoringPlays", "keyEvents", "rosters", "videos", "articles",
+)
+
+PLAY_SPEC = Spec("play", {
+    "id": "id",
+    "text": "text",
+    "clock": "clock.displayValue",
+    "period": "period.number",
+    "scoringPlay": P("scoringPlay", default=False),
+    "scoreValue": "scoreValue",
+})
+
+# The consensus line on the game summary (source: the first `pickcenter` entry)
+SUMMARY_ODDS_SPEC = Spec("summary_odds", {
+    "provider": P("provider.name", default="Unknown"),
+    "details": "details",
+    "overUnder": "overUnder",
+    "spread": "spread",
+})
+
+# Boxscore team and player identity fields (the stats are assembled separately)
+BOX_TEAM_SPEC = Spec("box_team", {
+    "id": "team.id",
+    "name": "team.displayName",
+    "abbreviation": "team.abbreviation",
+    "logo": "team.logo",
+})
+
+BOX_PLAYER_SPEC = Spec("box_player", {
+    "id": "athlete.id",
+    "name": "athlete.displayName",
+    "shortName": "athlete.shortName",
+    "starter": P("starter", default=False),
+    "jersey": "athlete.jersey",
+    "position": First("athlete.position.abbreviation", "athlete.position.name"),
+    "headshot": "athlete.headshot.href",
+})
+
+
+# --- News ---
+
+NEWS_SPEC = Spec("news", {
+    "id": P("id", default=""),
+    "headline": P("headline", default=""),
+    "description": P("description", default=""),
+    "published": P("published", default=""),
+    "lastModified": P("lastModified", default=""),
+    "author": P("byline", default=""),
+    "premium": P("premium", default=False),  # Is it an ESPN+ exclusive article?
+    # Grab the first image and the first web link
+    "image": "images.0.url",
+    "url": First("links.web.href", "links.web.short.href"),
+})
+
+
+# --- Sportsbook odds (source: one CORE odds item) ---
+
+def _to_float(value: Any, fallback: Any) -> Any:
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return fallback
+
+
+def _odds_lines(item: Dict[str, Any]) -> Tuple[Any, Any, Any, Any, Any]:
+    """(details, overUnder, spread, awayMoneyLine, homeMoneyLine) for one sportsbook."""
+    # Extract generic details (NBA / MLB structure)
+    details = item.get("details")
+    over_under = item.get("overUnder")
+    spread = item.get("spread")
+    moneyline_away = item.get("awayTeamOdds", {}).get("moneyLine")
+    moneyline_home = item.get("homeTeamOdds", {}).get("moneyLine")
+
+    # Fallback for complex nesting (NFL / Soccer structure)
+    if not details and "bettingOdds" in item:
+        team_odds = item["bettingOdds"].get("teamOdds", {})
+        spread = _to_float(team_odds.get("preMatchSpreadHandicapHome", {}).get("value"), spread)
+        over_under = _to_float(team_odds.get("preMatchTotalHandicap", {}).get("value"), over_under)
+        moneyline_away = team_odds.get("preMatchMoneyLineAway", {}).get("value") or moneyline_away
+        moneyline_home = team_odds.get("preMatchMoneyLineHome", {}).get("value") or moneyline_home
+
+    return details or (f"Home {spread}" if spread else None), over_under, spread, moneyline_away, moneyline_home
+
+
+ODDS_SPEC = Spec("odds", {
+    "provider": P("provider.name", default="Unknown"),
+    "details": "$lines.0",
+    "overUnder": "$lines.1",
+    "spread": "$lines.2",
+    "awayMoneyLine": "$lines.3",
+    "homeMoneyLine": "$lines.4",
+}, derived={
+    "lines": Fn(_odds_lines, ""),
+})
+
+
+# --- Golf leaderboards (source: {"event": ..., "competition": ..., "golfer": ..., "rank": n}) ---
+
+def _rounds(linescores: Optional[List[Dict[str, Any]]]) -> List[str]:
+    # Round scores
+    return [str(int(r.get("value"))) for r in linescores or () if r.get("value")]
+
+
+def _total_strokes(statistics: Optional[List[Dict[str, Any]]], rounds: List[str]) -> Any:
+    if statistics:
+        return statistics[0].get("displayValue")
+    return sum([int(r) for r in rounds]) if rounds else 0
+
+
+LEADERBOARD_SPEC = Spec("leaderboard", {
+    "tournamentName": "event.name",
+    "status": "event.status.type.description",
+    "venue": "competition.venue.fullName",
+    "id": "golfer.athlete.id",
+    "name": "golfer.athlete.displayName",
+    "flag": "golfer.athlete.flag.href",
+    "rank": Fn(str, "rank"),
+    "scoreToPar": First("golfer.score", default="E"),
+    "rounds": "$rounds",
+    "totalStrokes": Fn(_total_strokes, "golfer.statistics", "$rounds"),
+}, derived={
+    "rounds": Fn(_rounds, "golfer.linescores"),
+})
@@ -0,0 +1,84 @@
+"""Hedged requests: cut tail latency by racing a second attempt against a slow first one.
+
+When hedging is enabled (`ESPNClient(hedge=True)` or `hedge=HedgePolicy(...)`), an idempotent SITE API call
+that hasn't answered within the recent p90 latency gets a second, identical request. Whichever answers first
+wins and the other is cancelled. A token budget caps the extra load: every request earns `budget` tokens and
+every hedge spends one, so with the default `budget=0.15` hedges are at most ~15% of the traffic (in steady
+state, only the ~10% of requests slower than p90 are hedged).
+
+The budget has to stay above the share of requests past the percentile. Otherwise the tokens go to requests
+just past it, and the real stragglers find the budget empty. The percentile also has to sit below the
+stragglers: they are part of the latency window, so at p95 a few percent of stalls (or a cluster of them early
+on, while the window is small) pull the hedge delay up to the stall itself.
+"""
+import bisect
+from collections import deque
+from typing import Deque, List
+
+
+class HedgePolicy:
+    """Decides when (and whether) to hedge, from a sliding window of observed latencies.
+
+    Args:
+        percentile: The latency percentile (0-100) after which a hedge is sent. Defaults to 90.
+        budget: Extra load allowed, as a fraction of requests (0.15 = at most ~15% hedged). Defaults to 0.15.
+        min_delay: Never hedge sooner than this many seconds. Defaults to 0.02.
+        initial_delay: The delay used until `min_samples` latencies have been seen. Defaults to 1.0.
+        window: How many recent latencies to keep. Defaults to 1000.
+        min_samples: How many latencies are needed before the percentile is trusted. Defaults to 20.
+        max_tokens: The most hedges that can be saved up for a burst of slow responses. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 90.0,
+        budget: float = 0.15,
+        min_delay: float = 0.02,
+        initial_delay: float = 1.0,
+        window: int = 1000,
+        min_samples: int = 20,
+        max_tokens: float = 10.0,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100.")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_tokens = max_tokens
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._sorted: List[float] = []
+        self._tokens = 0.0
+        # Counters, handy for checking what hedging actually did
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, latency: float) -> None:
+        """Record the latency (in seconds) of a completed request."""
+        if len(self._latencies) == self._latencies.maxlen:
+            # Keep the sorted copy in step with the window instead of re-sorting on every request
+            del self._sorted[bisect.bisect_left(self._sorted, self._latencies[0])]
+        self._latencies.append(latency)
+        bisect.insort(self._sorted, latency)
+
+    def delay(self) -> float:
+        """How long to wait for the first attempt before hedging."""
+        if len(self._sorted) < self.min_samples:
+            return max(self.initial_delay, self.min_delay)
+        index = min(len(self._sorted) - 1, int(len(self._sorted) * self.percentile / 100))
+        return max(self._sorted[index], self.min_delay)
+
+    def start(self) -> None:
+        """Count a new request, which earns a fraction of a hedge token."""
+        self.requests += 1
+        self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+    def try_hedge(self) -> bool:
+        """Spend a token on a hedge, if the budget allows one."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.hedges += 1
+        return True
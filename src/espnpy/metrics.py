@@ -0,0 +1,162 @@
+"""A small, dependency-free metrics registry for the requests a client makes.
+
+With `ESPNClient(metrics=True)` (or `metrics=MetricsRegistry()`, e.g. to share one registry between clients),
+every request is recorded under its endpoint family:
+
+    core, scoreboard, summary, standings, news, search, splits, odds (and 'other' for the rest)
+
+Per family, the registry keeps the request count, a latency histogram, the response bytes, the status codes
+('error' for requests that got no response), retries, cache hits/misses (season calendars, and stale responses
+served by an open circuit breaker) and the time spent waiting on the rate limiter. Export it with
+`to_dict()`, or with `to_prometheus()` for a Prometheus scrape endpoint.
+"""
+import bisect
+from typing import Any, Dict, List, Tuple
+
+FAMILIES = ("core", "scoreboard", "summary", "standings", "news", "search", "splits", "odds", "other")
+
+# Latency histogram bucket bounds, in seconds (Prometheus' defaults)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path markers checked in order, so e.g. a CORE odds URL counts as 'odds' rather than 'core'
+_PATH_FAMILIES = (
+    ("/apis/search/", "search"),
+    ("/splits", "splits"),
+    ("/odds", "odds"),
+    ("/summary", "summary"),
+    ("/scoreboard", "scoreboard"),
+    ("/standings", "standings"),
+    ("/news", "news"),
+)
+
+
+def endpoint_family(url: str) -> str:
+    """Classify a request URL into one of `FAMILIES`."""
+    path = url.split("?", 1)[0]
+    for marker, family in _PATH_FAMILIES:
+        if marker in path:
+            return family
+    if path.startswith("https://sports.core.api.espn.com/"):
+        return "core"
+    return "other"
+
+
+class _Family:
+    """The counters of one endpoint family."""
+
+    __slots__ = ("requests", "buckets", "latency_sum", "bytes", "status", "retries", "cache_hits", "cache_misses", "limiter_wait")
+
+    def __init__(self):
+        self.requests = 0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # The last one is +Inf
+        self.latency_sum = 0.0
+        self.bytes = 0
+        self.status: Dict[str, int] = {}
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.limiter_wait = 0.0
+
+
+class MetricsRegistry:
+    """Counters and latency histograms per endpoint family."""
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+
+    def _family(self, family: str) -> _Family:
+        entry = self._families.get(family)
+        if entry is None:
+            entry = self._families[family] = _Family()
+        return entry
+
+    def record_request(self, family: str, latency: float, status: str, nbytes: int = 0) -> None:
+        """Record one completed request (`status` is the HTTP status code, or 'error' if there was no response)."""
+        entry = self._family(family)
+        entry.requests += 1
+        entry.buckets[bisect.bisect_left(BUCKETS, latency)] += 1
+        entry.latency_sum += latency
+        entry.bytes += nbytes
+        entry.status[status] = entry.status.get(status, 0) + 1
+
+    def record_retry(self, family: str) -> None:
+        self._family(family).retries += 1
+
+    def record_cache(self, family: str, hit: bool) -> None:
+        entry = self._family(family)
+        if hit:
+            entry.cache_hits += 1
+        else:
+            entry.cache_misses += 1
+
+    def record_limiter_wait(self, family: str, seconds: float) -> None:
+        self._family(family).limiter_wait += seconds
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self._families.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Every family's counters, e.g. `{"core": {"requests": 120, "latency": {...}, "bytes": ..., ...}}`.
+
+        `latency["buckets"]` maps each bucket's upper bound (as a string, with '+Inf' last) to the number of
+        requests that took at most that long, like a Prometheus histogram.
+        """
+        result = {}
+        for family, entry in self._families.items():
+            cumulative, buckets = 0, {}
+            for bound, count in zip(_bucket_labels(), entry.buckets):
+                cumulative += count
+                buckets[bound] = cumulative
+            result[family] = {
+                "requests": entry.requests,
+                "latency": {"buckets": buckets, "sum": entry.latency_sum, "count": entry.requests},
+                "bytes": entry.bytes,
+                "status": dict(entry.status),
+                "retries": entry.retries,
+                "cache_hits": entry.cache_hits,
+                "cache_misses": entry.cache_misses,
+                "limiter_wait": entry.limiter_wait,
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "espnpy") -> str:
+        """The metrics in the Prometheus text exposition format."""
+        families = sorted(self._families.items())
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[Tuple[str, Any]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(f"{prefix}_{suffix} {value}" for suffix, value in samples)
+
+        metric("requests_total", "counter", "HTTP requests sent, by endpoint family.",
+               [(f'requests_total{{family="{f}"}}', e.requests) for f, e in families])
+
+        histogram = []
+        for f, e in families:
+            cumulative = 0
+            for bound, count in zip(_bucket_labels(), e.buckets):
+                cumulative += count
+                histogram.append((f'request_duration_seconds_bucket{{family="{f}",le="{bound}"}}', cumulative))
+            histogram.append((f'request_duration_seconds_sum{{family="{f}"}}', e.latency_sum))
+            histogram.append((f'request_duration_seconds_count{{family="{f}"}}', e.requests))
+        metric("request_duration_seconds", "histogram", "HTTP request latency, by endpoint family.", histogram)
+
+        metric("response_bytes_total", "counter", "Response body bytes received, by endpoint family.",
+               [(f'response_bytes_total{{family="{f}"}}', e.bytes) for f, e in families])
+        metric("responses_total", "counter", "Responses by endpoint family and status code ('error' when there was none).",
+               [(f'responses_total{{family="{f}",status="{s}"}}', n) for f, e in families for s, n in sorted(e.status.items())])
+        metric("retries_total", "counter", "Retried requests, by endpoint family.",
+               [(f'retries_total{{family="{f}"}}', e.retries) for f, e in families])
+        metric("cache_hits_total", "counter", "Requests answered from a cache, by endpoint family.",
+               [(f'cache_hits_total{{family="{f}"}}', e.cache_hits) for f, e in families])
+        metric("cache_misses_total", "counter", "Cache lookups that had to make a request, by endpoint family.",
+               [(f'cache_misses_total{{family="{f}"}}', e.cache_misses) for f, e in families])
+        metric("limiter_wait_seconds_total", "counter", "Time spent waiting on the rate limiter, by endpoint family.",
+               [(f'limiter_wait_seconds_total{{family="{f}"}}', e.limiter_wait) for f, e in families])
+        return "\n".join(lines) + "\n"
+
+
+def _bucket_labels() -> List[str]:
+    return [f"{bound:g}" for bound in BUCKETS] + ["+Inf"]
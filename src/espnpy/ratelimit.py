@@ -0,0 +1,379 @@
+"""Client-side rate limiting: a token bucket per ESPN host.
+
+The client's `max_concurrency` caps how many requests are in flight, not how many are sent per second, and a
+full-league crawl of fast responses can easily get throttled. With a limiter
+(`ESPNClient(rate_limit=10)` or `rate_limit=RateLimiter(...)`), every request first takes a token from its
+host's bucket. A bucket holds up to `burst` tokens and refills at `rate` tokens per second, so short bursts go
+out at once while the sustained rate stays at `rate`. A request that finds the bucket empty waits for its
+token, and that wait is recorded so crawls can see how hard they're pushing. The client only asks for a token
+once the request has its local concurrency slot, so requests queued inside one process neither hold shared
+in-flight slots nor spend tokens they can't use yet.
+
+By default the buckets live in the process. Workers that should share one budget point their limiters at a
+shared backend instead: `SQLiteBackend` coordinates the processes of one machine through a small database
+file, and `RedisBackend` coordinates several machines through a Redis-compatible server. Either one can also
+cap the requests in flight across all of them (`max_in_flight`).
+
+A backend is any object with these (synchronous) methods:
+
+* `reserve(key, rate, burst) -> float`: take a token from the bucket `key` and return how many seconds to
+  wait before using it. Tokens may go negative, so concurrent callers queue up in order.
+* `refund(key, burst)`: give back a token that was reserved but never used.
+* `try_lease(limit) -> lease or None`: take one of `limit` shared in-flight slots, if one is free.
+* `release(lease)`: give a slot back.
+
+Calls to a backend are run in a worker thread (`asyncio.to_thread`), so a busy database or a slow round trip
+to Redis never stalls the event loop. Backends that never block (like `MemoryBackend`) set `blocking = False`
+to be called directly instead.
+"""
+import asyncio
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+
+class MemoryBackend:
+    """Buckets kept in this process (the default)."""
+
+    blocking = False
+
+    def __init__(self):
+        self._buckets: Dict[str, List[float]] = {}  # key -> [tokens, updated]
+        self._leases = 0
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [burst, now]
+        tokens = min(burst, bucket[0] + (now - bucket[1]) * rate) - 1
+        bucket[0], bucket[1] = tokens, now
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    def refund(self, key: str, burst: float) -> None:
+        bucket = self._buckets[key]
+        bucket[0] = min(burst, bucket[0] + 1)
+
+    def try_lease(self, limit: int) -> Optional[bool]:
+        if self._leases >= limit:
+            return None
+        self._leases += 1
+        return True
+
+    def release(self, lease: Any) -> None:
+        self._leases -= 1
+
+
+class SQLiteBackend:
+    """Buckets shared by every process on this machine that uses the same database file.
+
+    Each reservation is one short `BEGIN IMMEDIATE` transaction, which SQLite serializes across processes.
+    In-flight slots are recorded with their owner's PID, so the slots of a crashed worker are reclaimed.
+
+    Args:
+        path: The database file (created if missing), e.g. '/tmp/espnpy-limits.db'.
+        timeout: Seconds to wait for another process's transaction before giving up. Defaults to 5.0.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared with forked children, so every process opens its own
+        if self._db is None or self._pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+            db.execute("CREATE TABLE IF NOT EXISTS leases (id INTEGER PRIMARY KEY AUTOINCREMENT, pid INTEGER)")
+            self._db, self._pid = db, os.getpid()
+        return self._db
+
+    def _transaction(self, work: Any) -> Any:
+        with self._lock:
+            db = self._connection()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(db)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+            return result
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        def work(db: sqlite3.Connection) -> float:
+            now = time.time()
+            row = db.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row is not None else (burst, now)
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate) - 1
+            db.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (key, tokens, now))
+            return 0.0 if tokens >= 0 else -tokens / rate
+        return self._transaction(work)
+
+    def refund(self, key: str, burst: float) -> None:
+        self._transaction(lambda db: db.execute("UPDATE buckets SET tokens = MIN(?, tokens + 1) WHERE key = ?", (burst, key)))
+
+    def try_lease(self, limit: int) -> Optional[int]:
+        def work(db: sqlite3.Connection) -> Optional[int]:
+            pids = [pid for (pid,) in db.execute("SELECT DISTINCT pid FROM leases")]
+            dead = [pid for pid in pids if not _alive(pid)]
+            if dead:
+                db.executemany("DELETE FROM leases WHERE pid = ?", [(pid,) for pid in dead])
+            (in_flight,) = db.execute("SELECT COUNT(*) FROM leases").fetchone()
+            if in_flight >= limit:
+                return None
+            return db.execute("INSERT INTO leases (pid) VALUES (?)", (os.getpid(),)).lastrowid
+        return self._transaction(work)
+
+    def release(self, lease: int) -> None:
+        self._transaction(lambda db: db.execute("DELETE FROM leases WHERE id = ?", (lease,)))
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # It exists, it just isn't ours
+    return True
+
+
+# The bucket update runs on the server (with the server's clock), so every client sees the same state
+_RESERVE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local rate, burst = tonumber(ARGV[1]), tonumber(ARGV[2])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 60)
+if tokens >= 0 then return '0' end
+return tostring(-tokens / rate)
+"""
+
+_REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then redis.call('HSET', KEYS[1], 'tokens', tostring(math.min(tonumber(ARGV[1]), tokens + 1))) end
+"""
+
+_LEASE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[1]) then return 0 end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[3])
+return 1
+"""
+
+
+class RedisBackend:
+    """Buckets shared through a Redis-compatible server (Redis, Valkey, KeyDB...), e.g. across machines.
+
+    Every operation is one atomic script round trip, so this is best used with a server close by.
+    Requires the optional `redis` package unless a client object is passed in.
+
+    Args:
+        client: A `redis.Redis` client, or a URL like 'redis://localhost:6379/0' to create one.
+        prefix: Prefix for every key this backend uses. Defaults to 'espnpy:'.
+        lease_ttl: Seconds after which an in-flight slot that was never released (e.g. its worker crashed)
+                   expires. Should be longer than any request. Defaults to 60.0.
+    """
+
+    blocking = True
+
+    def __init__(self, client: Any, prefix: str = "espnpy:", lease_ttl: float = 60.0):
+        if isinstance(client, str):
+            client = _require_redis().Redis.from_url(client)
+        self.client = client
+        self.prefix = prefix
+        self.lease_ttl = lease_ttl
+        self._ids = itertools.count()
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        return float(self.client.eval(_RESERVE_SCRIPT, 1, self.prefix + "bucket:" + key, rate, burst))
+
+    def refund(self, key: str, burst: float) -> None:
+        self.client.eval(_REFUND_SCRIPT, 1, self.prefix + "bucket:" + key, burst)
+
+    def try_lease(self, limit: int) -> Optional[str]:
+        lease = f"{os.getpid()}:{threading.get_ident()}:{next(self._ids)}"
+        if not self.client.eval(_LEASE_SCRIPT, 1, self.prefix + "leases", limit, self.lease_ttl, lease):
+            return None
+        return lease
+
+    def release(self, lease: str) -> None:
+        self.client.zrem(self.prefix + "leases", lease)
+
+
+def _require_redis() -> Any:
+    try:
+        import redis
+    except ImportError as e:
+        raise ImportError("RedisBackend requires the optional 'redis' package. Install it with: pip install redis") from e
+    return redis
+
+
+class _Host:
+    """The rate (and wait counters) of one host."""
+
+    __slots__ = ("rate", "burst", "requests", "waited", "wait_time")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.requests = 0
+        self.waited = 0
+        self.wait_time = 0.0
+
+
+class RateLimiter:
+    """Per-host token buckets, plus the time requests spent waiting on them.
+
+    Args:
+        rate: Sustained requests per second allowed to each host. Defaults to 10.
+        burst: How many requests a host can take at once after being idle. Defaults to `rate` (one second's worth).
+        hosts: Optional per-host `(rate, burst)` overrides, e.g. `{"site.api.espn.com": (20, 40)}`.
+        backend: Where the buckets live. Defaults to this process (`MemoryBackend`); pass a `SQLiteBackend` or
+                 `RedisBackend` to share the rate between every limiter that uses the same file or server.
+        max_in_flight: Optional cap on requests in flight across everything sharing the backend (on top of each
+                       client's own `max_concurrency`). Defaults to None (no shared cap).
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        hosts: Optional[Dict[str, Tuple[float, float]]] = None,
+        backend: Any = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.hosts = dict(hosts or {})
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.max_in_flight = max_in_flight
+        self._blocking = getattr(self.backend, "blocking", True)
+        self._hosts: Dict[str, _Host] = {}
+
+    def _host(self, host: str) -> _Host:
+        entry = self._hosts.get(host)
+        if entry is None:
+            rate, burst = self.hosts.get(host, (self.rate, self.burst))
+            entry = self._hosts[host] = _Host(rate, max(1.0, burst))
+        return entry
+
+    def reserve(self, host: str) -> float:
+        """Take a token from the host's bucket and return how long to wait before using it (0 if available now).
+
+        Tokens can go negative: each waiting request reserves the next token to be refilled, so concurrent
+        callers queue up in order instead of all waking up and racing for the same one.
+        """
+        entry = self._host(host)
+        entry.requests += 1
+        return self.backend.reserve(host, entry.rate, entry.burst)
+
+    def refund(self, host: str) -> None:
+        """Give back a reserved token that was never used (e.g. the request was cancelled while waiting)."""
+        entry = self._host(host)
+        entry.requests -= 1
+        self.backend.refund(host, entry.burst)
+
+    async def _call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Run a backend method: directly if it never blocks, otherwise in a worker thread.
+
+        A thread can't be interrupted, so a started call always runs to the end even if the caller is cancelled.
+        """
+        if not self._blocking:
+            return method(*args)
+        return await asyncio.shield(asyncio.to_thread(method, *args))
+
+    async def _take(self, method: Callable[..., Any], give_back: Callable[[Any], Any], *args: Any) -> Any:
+        """Like `_call`, for methods that take a token or a slot: if the caller is cancelled while the call is
+        still running, whatever it took is given back once it finishes."""
+        if not self._blocking:
+            return method(*args)
+        loop = asyncio.get_running_loop()
+        call = asyncio.ensure_future(asyncio.to_thread(method, *args))
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            def undo(done: "asyncio.Future[Any]") -> None:
+                if not done.cancelled() and done.exception() is None:
+                    loop.run_in_executor(None, give_back, done.result())
+            call.add_done_callback(undo)
+            raise
+
+    async def acquire(self, host: str) -> float:
+        """Wait for a token for `host`, and return the seconds spent waiting."""
+        entry = self._host(host)
+        entry.requests += 1
+        try:
+            wait = await self._take(self.backend.reserve, lambda _: self.backend.refund(host, entry.burst), host, entry.rate, entry.burst)
+        except asyncio.CancelledError:
+            entry.requests -= 1
+            raise
+        if wait <= 0:
+            return 0.0
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            entry.requests -= 1
+            await self._call(self.backend.refund, host, entry.burst)
+            raise
+        entry.waited += 1
+        entry.wait_time += wait
+        return wait
+
+    async def _lease(self) -> Any:
+        release = self.backend.release
+        return await self._take(self.backend.try_lease, lambda lease: lease is None or release(lease), self.max_in_flight)
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Hold a token for `host` (and a shared in-flight slot, with `max_in_flight`) for one request."""
+        await self.acquire(host)
+        if self.max_in_flight is None:
+            yield
+            return
+
+        lease = await self._lease()
+        if lease is None:
+            # Other processes can't wake us up when they release a slot, so poll (backing off up to 50ms)
+            start = time.monotonic()
+            delay = 0.005
+            while lease is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+                lease = await self._lease()
+            self._hosts[host].wait_time += time.monotonic() - start
+        try:
+            yield
+        finally:
+            await self._call(self.backend.release, lease)
+
+    @property
+    def wait_time(self) -> float:
+        """Total seconds requests have spent waiting for a token (or a shared slot), across every host."""
+        return sum(entry.wait_time for entry in self._hosts.values())
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-host counters: requests sent, how many of them had to wait, and the total wait in seconds."""
+        return {
+            host: {"requests": entry.requests, "waited": entry.waited, "wait_time": entry.wait_time}
+            for host, entry in self._hosts.items()
+        }
@@ -0,0 +1,132 @@
+"""Compact record types for the standardized entities (`output="record"`).
+
+Each record is a slotted dataclass with exactly the same field names (and order) as the matching
+standardized dictionary, so a record takes a fraction of the memory of a dict while still reading
+naturally (`game.homeTeam`). Call `.to_dict()` whenever a plain dictionary is needed.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+class _Record:
+    """Shared helpers for the slotted record types."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as the same dictionary the default `output="dict"` produces."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class Athlete(_Record):
+    id: Optional[str]
+    teamId: Optional[str]
+    slug: Optional[str]
+    firstName: Optional[str]
+    lastName: Optional[str]
+    fullName: Optional[str]
+    displayName: Optional[str]
+    shortName: Optional[str]
+    weight: Optional[float]
+    displayWeight: Optional[str]
+    height: Optional[float]
+    displayHeight: Optional[str]
+    age: Optional[int]
+    dateOfBirth: Optional[str]
+    jersey: Optional[str]
+    position: Optional[str]
+    positionAbbreviation: Optional[str]
+    active: bool
+    headshot: Optional[str]
+
+
+@dataclass(slots=True)
+class Team(_Record):
+    id: Optional[str]
+    slug: Optional[str]
+    location: Optional[str]
+    name: Optional[str]
+    nickname: Optional[str]
+    abbreviation: Optional[str]
+    displayName: Optional[str]
+    shortDisplayName: Optional[str]
+    color: Optional[str]
+    alternateColor: Optional[str]
+    isActive: bool
+    logo: Optional[str]
+
+
+@dataclass(slots=True)
+class Game(_Record):
+    id: Optional[str]
+    date: Optional[str]
+    name: Optional[str]
+    tournamentName: Optional[str]
+    shortName: Optional[str]
+    seasonYear: Optional[int]
+    seasonType: Optional[int]
+    seasonSlug: Optional[str]
+    status: Optional[str]
+    clock: Optional[str]
+    period: Optional[int]
+    venue: Optional[str]
+    broadcasts: List[str]
+    homeTeam: Optional[str]
+    homeTeamId: Optional[str]
+    homeScore: Optional[str]
+    homeLogo: Optional[str]
+    awayTeam: Optional[str]
+    awayTeamId: Optional[str]
+    awayScore: Optional[str]
+    awayLogo: Optional[str]
+    setScores: str
+
+
+@dataclass(slots=True)
+class StandingEntry(_Record):
+    id: str
+    name: str
+    abbreviation: str
+    logo: Optional[str]
+    group: str
+    wins: str
+    losses: str
+    ties: str
+    winPercent: str
+    gamesBehind: str
+    points: str
+    rank: str
+    streak: str
+    pointsFor: str
+    pointsAgainst: str
+    differential: str
+    homeRecord: str
+    awayRecord: str
+    divisionRecord: str
+    conferenceRecord: str
+    lastTenRecord: str
+    playoffSeed: str
+
+
+@dataclass(slots=True)
+class Play(_Record):
+    id: Optional[str]
+    text: Optional[str]
+    clock: Optional[str]
+    period: Optional[int]
+    scoringPlay: bool
+    scoreValue: Optional[int]
+
+
+@dataclass(slots=True)
+class NewsArticle(_Record):
+    id: Any
+    headline: str
+    description: str
+    published: str
+    lastModified: str
+    author: str
+    premium: bool
+    image: Optional[str]
+    url: Optional[str]
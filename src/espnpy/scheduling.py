@@ -0,0 +1,120 @@
+"""Request priorities, so user-facing calls don't queue behind a bulk crawl on the same client.
+
+Every request has a priority: 'interactive' (the default) or 'bulk'. The client's concurrency slots
+(`max_concurrency`) are handed out interactive-first, and a share of them (`interactive_reserve`) is only
+ever given to interactive requests, so a crawl that keeps thousands of `$ref` fetches queued can never
+occupy the whole pool:
+
+    with priority("bulk"):
+        athletes = await client.nba.athletes()  # Every request of the crawl is bulk
+
+    scores = await client.nba.scoreboard()  # Meanwhile, this one goes first
+
+The priority lives in a context variable, so it follows the call into every task it spawns. `_get` and
+`get_url` also take it directly (`client.get_url(ref, priority="bulk")`).
+"""
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Deque, Dict, Iterator, Optional
+
+INTERACTIVE, BULK = "interactive", "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+_PRIORITY: ContextVar[str] = ContextVar("espnpy_priority", default=INTERACTIVE)
+
+
+def check_priority(name: str) -> str:
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown priority '{name}'. Use one of: {', '.join(PRIORITIES)}.")
+    return name
+
+
+def current_priority() -> str:
+    """The priority requests made here get unless they ask for one explicitly."""
+    return _PRIORITY.get()
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Give every request made inside the block (including in tasks it spawns) the priority `name`."""
+    token = _PRIORITY.set(check_priority(name))
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+class PriorityScheduler:
+    """The concurrency slots of one event loop, handed out interactive-first.
+
+    Interactive requests may use all `limit` slots; bulk requests only `limit - reserved` of them, and only
+    while no interactive request is waiting. Within a priority, requests are served in arrival order.
+    """
+
+    def __init__(self, limit: int, reserved: int = 0):
+        self.limit = limit
+        self.bulk_limit = max(1, limit - reserved)
+        self.in_flight = 0
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {INTERACTIVE: deque(), BULK: deque()}
+
+    def _free(self, priority: str) -> bool:
+        if priority == INTERACTIVE:
+            return self.in_flight < self.limit
+        return self.in_flight < self.bulk_limit and not self._waiters[INTERACTIVE]
+
+    async def acquire(self, priority: str) -> None:
+        waiters = self._waiters[priority]
+        if not waiters and self._free(priority):
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled: pass it on
+                self.release()
+            else:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                # A cancelled interactive waiter may have been the only thing holding bulk requests back
+                self._wake()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        # Slots are handed straight to the waiters (interactive first), so nobody can barge in between
+        for priority in PRIORITIES:
+            waiters = self._waiters[priority]
+            while waiters and self._free(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue  # Cancelled, and its task hasn't cleaned up yet
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def slot(self, priority: str) -> "_Slot":
+        """An `async with` block holding one slot."""
+        return _Slot(self, priority)
+
+
+class _Slot:
+    __slots__ = ("scheduler", "priority")
+
+    def __init__(self, scheduler: PriorityScheduler, priority: str):
+        self.scheduler = scheduler
+        self.priority = priority
+
+    async def __aenter__(self) -> None:
+        await self.scheduler.acquire(self.priority)
+
+    async def __aexit__(self, *exc_info: object) -> Optional[bool]:
+        self.scheduler.release()
+        return None
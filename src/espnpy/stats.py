@@ -0,0 +1,269 @@
+"""Typed numeric parsing for ESPN stat display strings.
+
+ESPN returns every boxscore and split stat as a display string ("5-12", "38:21", "45.5", "1,024", "--").
+This module maps stat labels to parsers through a per-sport schema registry and parses whole label
+columns at once, so the parser for a label is resolved a single time per table rather than per value.
+
+Parsers:
+    number:  "1,024" -> 1024, "45.5" -> 45.5, "45.5%" -> 45.5, "+7" -> 7
+    pair:    "5-12" or "5/12" -> two columns (made, attempted), e.g. FG -> FGM and FGA
+    clock:   "38:21" -> 38.35 (decimal minutes)
+    innings: "6.2" -> 6.667 (baseball thirds of an inning)
+
+Blank values ("--", "-", "", None) always parse to None.
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BLANKS = frozenset(("", "-", "--", "---", "N/A", "NA"))
+
+_PAIR_RE = re.compile(r"^\s*-?\d+(?:\.\d+)?\s*[-/]\s*-?\d+(?:\.\d+)?\s*$")
+_CLOCK_RE = re.compile(r"^\s*\d+:\d{2}(?::\d{2})?\s*$")
+# Splits on the separator that follows the first number, so negative values like '-3--5' still parse
+_PAIR_SPLIT_RE = re.compile(r"^\s*(-?[\d.,]+)\s*[-/]\s*(-?[\d.,]+)\s*$")
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """Parse a plain numeric display string, returning an int when the value is integral."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip()
+    if text in BLANKS:
+        return None
+    text = text.replace(",", "").rstrip("%").lstrip("+")
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() and "." not in text else number
+
+
+def parse_pair(value: Any) -> Tuple[Optional[float], Optional[float]]:
+    """Parse a made/attempted (or yards/attempts) pair like '5-12' or '20/33' into two numbers."""
+    if value is None:
+        return None, None
+    text = str(value).strip()
+    if text in BLANKS:
+        return None, None
+    match = _PAIR_SPLIT_RE.match(text)
+    if not match:
+        return None, None
+    return parse_number(match.group(1)), parse_number(match.group(2))
+
+
+def parse_clock(value: Any) -> Optional[float]:
+    """Parse an 'MM:SS' (or 'H:MM:SS') clock into decimal minutes. Plain numbers are treated as minutes."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if text in BLANKS:
+        return None
+    if ":" not in text:
+        return parse_number(text)
+    try:
+        parts = [int(p) for p in text.split(":")]
+    except ValueError:
+        return None
+    if len(parts) == 3:
+        return round(parts[0] * 60 + parts[1] + parts[2] / 60, 4)
+    return round(parts[0] + parts[1] / 60, 4)
+
+
+def parse_innings(value: Any) -> Optional[float]:
+    """Parse baseball innings pitched, where '6.2' means 6 and 2/3 innings."""
+    number = parse_number(value)
+    if number is None:
+        return None
+    whole = int(number)
+    outs = round((number - whole) * 10)
+    return round(whole + outs / 3, 4)
+
+
+class StatParser:
+    """Describes how to parse one stat label: the parser kind and (for pairs) the two output names."""
+
+    __slots__ = ("kind", "names")
+
+    def __init__(self, kind: str, names: Optional[Tuple[str, str]] = None):
+        if kind not in _SCALAR_PARSERS and kind != "pair":
+            raise ValueError(f"Unknown stat parser kind '{kind}'.")
+        self.kind = kind
+        self.names = names
+
+    def output_names(self, label: str) -> Tuple[str, ...]:
+        if self.kind != "pair":
+            return (label,)
+        return self.names or pair_names(label)
+
+    def parse_column(self, values: Sequence[Any]) -> List[List[Any]]:
+        """Parse a whole column of display values, returning one output column per output name."""
+        if self.kind == "pair":
+            pairs = [parse_pair(v) for v in values]
+            return [[p[0] for p in pairs], [p[1] for p in pairs]]
+        parser = _SCALAR_PARSERS[self.kind]
+        return [[parser(v) for v in values]]
+
+    def __repr__(self) -> str:
+        return f"StatParser({self.kind!r}, names={self.names!r})"
+
+
+_SCALAR_PARSERS = {
+    "number": parse_number,
+    "clock": parse_clock,
+    "innings": parse_innings,
+}
+
+NUMBER = StatParser("number")
+CLOCK = StatParser("clock")
+INNINGS = StatParser("innings")
+
+
+def pair(made: str, attempted: str) -> StatParser:
+    """Build a pair parser that splits a value into the two given stat names."""
+    return StatParser("pair", (made, attempted))
+
+
+def pair_names(label: str) -> Tuple[str, str]:
+    """Derive the two output names for a pair label: 'CMP/ATT' -> ('CMP', 'ATT'), 'FG' -> ('FGM', 'FGA')."""
+    for separator in ("/", "-"):
+        parts = [p.strip() for p in label.split(separator)]
+        if len(parts) == 2 and all(parts):
+            return parts[0], parts[1]
+    if len(label) <= 4 and label.upper() == label:
+        return f"{label}M", f"{label}A"
+    return f"{label} Made", f"{label} Attempted"
+
+
+# Per-sport label -> parser registry. Labels not listed here are detected from the shape of their values.
+STAT_SCHEMAS: Dict[str, Dict[str, StatParser]] = {
+    "basketball": {
+        "MIN": CLOCK,
+        "FG": pair("FGM", "FGA"),
+        "3PT": pair("3PM", "3PA"),
+        "FT": pair("FTM", "FTA"),
+        "+/-": NUMBER,
+        "Field Goals": pair("FGM", "FGA"),
+        "3PT Field Goals": pair("3PM", "3PA"),
+        "FG3": pair("3PM", "3PA"),
+        "Free Throws": pair("FTM", "FTA"),
+    },
+    "football": {
+        "C/ATT": pair("CMP", "ATT"),
+        "CMP/ATT": pair("CMP", "ATT"),
+        "SACKS": pair("SACKS", "SACKYDS"),
+        "FG": pair("FGM", "FGA"),
+        "XP": pair("XPM", "XPA"),
+        "Comp/Att": pair("CMP", "ATT"),
+        "Completions/Attempts": pair("CMP", "ATT"),
+        "Sacks-Yards Lost": pair("SACKS", "SACKYDS"),
+        "3rd down efficiency": pair("3rdDownConv", "3rdDownAtt"),
+        "4th down efficiency": pair("4thDownConv", "4thDownAtt"),
+        "Red Zone (Made-Att)": pair("RedZoneMade", "RedZoneAtt"),
+        "Penalties": pair("Penalties", "PenaltyYards"),
+        "Possession": CLOCK,
+    },
+    "hockey": {
+        "TOI": CLOCK,
+        "PPTOI": CLOCK,
+        "SHTOI": CLOCK,
+        "ESTOI": CLOCK,
+        "+/-": NUMBER,
+        "FW-FL": pair("FW", "FL"),
+    },
+    "baseball": {
+        "IP": INNINGS,
+        "H-AB": pair("H", "AB"),
+    },
+    "soccer": {
+        "Possession": NUMBER,
+    },
+}
+
+_AUTO_PAIR = StatParser("pair")
+
+
+def _first_value(values: Sequence[Any]) -> Optional[str]:
+    for value in values:
+        if value is None:
+            continue
+        text = str(value).strip()
+        if text not in BLANKS:
+            return text
+    return None
+
+
+def resolve_parser(label: str, values: Sequence[Any] = (), sport: Optional[str] = None) -> StatParser:
+    """Find the parser for a label: the sport's schema first, then detection from the first non-blank value.
+
+    Schemas are keyed by label alone, and a label can mean different things in different stat categories
+    (football's passing SACKS is '2-14', its defensive SACKS is '1.5'). So a schema pair whose values aren't
+    pairs falls back to a plain number.
+    """
+    first = _first_value(values)
+    parser = STAT_SCHEMAS.get(sport or "", {}).get(label)
+    if parser is not None:
+        if parser.kind == "pair" and first is not None and not _PAIR_RE.match(first):
+            return NUMBER
+        return parser
+
+    if first is None:
+        return NUMBER
+    if _CLOCK_RE.match(first):
+        return CLOCK
+    if _PAIR_RE.match(first):
+        return _AUTO_PAIR
+    return NUMBER
+
+
+def parse_columns(labels: Sequence[str], rows: Sequence[Sequence[Any]], sport: Optional[str] = None) -> List[Tuple[str, Tuple[str, ...], List[List[Any]]]]:
+    """Parse a table column by column like `parse_table`, keeping each label's outputs together.
+
+    Returns:
+        One (label, output names, parsed output columns) tuple per label, in label order.
+    """
+    width = len(labels)
+    # Pad ragged rows so that every label always has a column to parse
+    padded = [list(row[:width]) + [None] * (width - len(row)) for row in rows]
+    columns = list(zip(*padded)) if padded else [() for _ in labels]
+
+    parsed = []
+    for label, column in zip(labels, columns):
+        parser = resolve_parser(label, column, sport)
+        parsed.append((label, parser.output_names(label), parser.parse_column(column)))
+    return parsed
+
+
+def parse_table(labels: Sequence[str], rows: Sequence[Sequence[Any]], sport: Optional[str] = None) -> Tuple[List[str], List[List[Any]]]:
+    """Parse a table of display strings (one row per athlete/split, one column per label) column by column.
+
+    Args:
+        labels: The stat labels, one per column (e.g. ['MIN', 'FG', '3PT', 'PTS']).
+        rows: The rows of display values, each aligned with `labels`.
+        sport: Optional sport used to pick the stat schema (e.g. 'basketball').
+
+    Returns:
+        A tuple of (output names, parsed rows). Pair labels expand into two output names/values.
+    """
+    names: List[str] = []
+    parsed_columns: List[List[Any]] = []
+    for _, output_names, columns in parse_columns(labels, rows, sport):
+        names.extend(output_names)
+        parsed_columns.extend(columns)
+
+    parsed_rows = [list(row) for row in zip(*parsed_columns)] if parsed_columns else [[] for _ in rows]
+    return names, parsed_rows
+
+
+def parse_stats(stats: Dict[str, Any], sport: Optional[str] = None) -> Dict[str, Any]:
+    """Parse a single {label: display value} dictionary into {name: number}."""
+    labels = list(stats)
+    names, rows = parse_table(labels, [list(stats.values())], sport)
+    return dict(zip(names, rows[0])) if rows else {}
+
+
+def expand_stat(label: str, value: Any, sport: Optional[str] = None) -> List[Tuple[str, Any]]:
+    """Parse one labelled display value into its (name, number) outputs (two for pair stats)."""
+    parser = resolve_parser(label, (value,), sport)
+    return [(name, column[0]) for name, column in zip(parser.output_names(label), parser.parse_column((value,)))]
@@ -0,0 +1,156 @@
+"""A synchronous facade over `ESPNClient` for code without an event loop (Django views, notebooks, scripts).
+
+`SyncESPNClient` starts one background thread running a long-lived event loop with a single `ESPNClient`
+on it. Every call is dispatched to that loop with `asyncio.run_coroutine_threadsafe` and the caller blocks
+for the result, so the HTTP/2 connection pool survives between calls instead of being torn down by an
+`asyncio.run()` per call.
+
+Example:
+    with SyncESPNClient() as espn:
+        teams = espn.nba.teams()
+        # Several calls at once, run concurrently on the background loop
+        boards = espn.many([espn.aio.nba.scoreboard(date=d) for d in ("20240101", "20240102")])
+"""
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional
+
+from .client import ESPNClient, LeagueProxy
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    # run_coroutine_threadsafe only accepts real coroutines (not e.g. an async generator's __anext__())
+    return await awaitable
+
+
+class SyncESPNClient:
+    """A blocking ESPN client backed by a persistent background event loop.
+
+    Every `ESPNClient` method and league proxy is available with the same arguments, but returns the result
+    directly (`espn.nba.teams()`, `espn.get_scoreboard("nba")`). Async iterators such as
+    `game_summaries()` become regular iterators.
+
+    Args:
+        timeout: The maximum time in seconds to wait for any single call (None waits forever).
+        **client_kwargs: Passed straight to `ESPNClient` (e.g. `max_concurrency=20`).
+    """
+
+    def __init__(self, timeout: Optional[float] = None, **client_kwargs: Any):
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="espnpy-sync-loop", daemon=True)
+        self._thread.start()
+        self._client = ESPNClient(**client_kwargs)
+
+    @property
+    def aio(self) -> ESPNClient:
+        """The underlying async client. Its coroutines can be passed to `many()` to run them concurrently."""
+        return self._client
+
+    def run(self, awaitable: Awaitable[Any]) -> Any:
+        """Run an awaitable on the background loop and block until its result is available.
+
+        If `timeout` passes first, the call is cancelled on the loop (releasing its connections and slots)
+        and `TimeoutError` is raised.
+        """
+        if self._loop.is_closed():
+            raise RuntimeError("This SyncESPNClient has been closed.")
+        if threading.current_thread() is self._thread:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()  # It will never run, so don't let it warn about never being awaited
+            raise RuntimeError(
+                "SyncESPNClient methods can't be called from its own event loop (e.g. from a sink or callback): "
+                "blocking there would deadlock. Await the async client (`espn.aio`) instead."
+            )
+        future = asyncio.run_coroutine_threadsafe(_await(awaitable), self._loop)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def many(self, calls: Iterable[Awaitable[Any]], return_exceptions: bool = False) -> List[Any]:
+        """Run several calls concurrently on the background loop and return their results in order.
+
+        Example:
+            teams = espn.many([espn.aio.nba.teams(), espn.aio.nfl.teams(), espn.aio.nhl.teams()])
+
+        Args:
+            calls: Awaitables from the async client (`espn.aio`), e.g. `espn.aio.nba.scoreboard()`.
+            return_exceptions: If True, failed calls return their exception instead of raising the first one.
+        """
+        calls = list(calls)
+
+        async def gather() -> List[Any]:
+            return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+        return self.run(gather())
+
+    def _iterate(self, iterator: Any) -> Iterator[Any]:
+        """Drive an async iterator from the calling thread, one item at a time."""
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if hasattr(iterator, "aclose") and not self._loop.is_closed():
+                self.run(iterator.aclose())
+
+    def _resolve(self, result: Any) -> Any:
+        if inspect.isawaitable(result):
+            return self.run(result)
+        if hasattr(result, "__anext__"):
+            return self._iterate(result)
+        return result
+
+    def _wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._resolve(func(*args, **kwargs))
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if isinstance(attr, LeagueProxy):
+            attr = _SyncLeagueProxy(self, attr)
+        elif callable(attr) and not name.startswith("_"):
+            attr = self._wrap(attr)
+        else:
+            return attr
+        # Cache the wrapper, so hot loops (`espn.nba.scoreboard()`) only build it once
+        self.__dict__[name] = attr
+        return attr
+
+    def close(self) -> None:
+        """Close the HTTP session and stop the background loop. Safe to call more than once."""
+        if self._loop.is_closed():
+            return
+        self.run(self._client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncESPNClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class _SyncLeagueProxy:
+    """The blocking counterpart of `LeagueProxy` (`espn.nba.teams()`)."""
+
+    def __init__(self, sync_client: SyncESPNClient, proxy: LeagueProxy):
+        self._sync_client = sync_client
+        self._proxy = proxy
+        self.league = proxy.league
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._proxy, name)
+        if callable(attr) and not name.startswith("_"):
+            attr = self.__dict__[name] = self._sync_client._wrap(attr)
+        return attr
@@ -0,0 +1,282 @@
+"""Request-tree tracing: see every request a composite call makes, and where its time went.
+
+`get_teams` is one list request, P page requests and one `$ref` request per team; `get_team_roster` adds a
+league lookup in front. Tracing records that as a tree of spans (the call, its stages, and every HTTP request
+with its timing, bytes, status and cache status), so the critical path and any wasted requests are visible:
+
+    client = ESPNClient(tracer=True)
+    await client.nfl.teams()
+    print(client.tracer.last.explain())
+
+    # Or trace any block of code, with or without a client-wide tracer
+    with trace("nightly job") as root:
+        await client.nfl.teams()
+        await client.nfl.roster("12")
+    print(root.explain())
+
+Spans live in a context variable, so requests made by spawned tasks land under the span that spawned them.
+When nothing is being traced, the hooks cost a context variable lookup.
+"""
+import asyncio
+import functools
+import inspect
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+_SPAN: ContextVar[Optional["Span"]] = ContextVar("espnpy_span", default=None)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class Span:
+    """One node of a request tree: a call ('call'), a stage of it ('stage'), or an HTTP request ('request')."""
+
+    __slots__ = ("name", "kind", "attrs", "start", "end", "children", "status", "bytes", "cache", "error")
+
+    def __init__(self, name: str, kind: str = "stage", attrs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.attrs = attrs or {}
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.children: List["Span"] = []
+        self.status: Optional[str] = None  # Requests: the HTTP status code, or 'error'
+        self.bytes = 0
+        self.cache: Optional[str] = None  # 'hit' when answered without a request
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (or until now, if still running)."""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def walk(self) -> Iterator["Span"]:
+        """This span and every span below it, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def requests(self) -> List["Span"]:
+        """Every HTTP request (and cache hit) in the tree."""
+        return [span for span in self.walk() if span.kind == "request"]
+
+    def critical_path(self) -> List["Span"]:
+        """The chain of spans that finished last at every level, i.e. what the call actually waited on."""
+        path, span = [self], self
+        while span.children:
+            span = max(span.children, key=lambda child: child.end or 0.0)
+            path.append(span)
+        return path
+
+    def wasted(self) -> Dict[str, int]:
+        """Requests that didn't contribute: repeated URLs, failures, and cancelled ones (e.g. hedge losers)."""
+        sent = [span for span in self.requests() if span.cache != "hit"]
+        repeats = sum(count - 1 for count in Counter(span.attrs.get("url") for span in sent).values() if count > 1)
+        return {
+            "duplicates": repeats,
+            "failed": sum(1 for span in sent if span.status == "error" or (span.status or "").isdigit() and int(span.status) >= 400),
+            "cancelled": sum(1 for span in sent if span.error == "cancelled"),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The tree as plain dictionaries (e.g. for JSON), with times in seconds relative to this span's start."""
+        return self._to_dict(self.start)
+
+    def _to_dict(self, origin: float) -> Dict[str, Any]:
+        node: Dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start - origin,
+            "duration": self.duration,
+        }
+        if self.attrs:
+            node["attrs"] = dict(self.attrs)
+        if self.kind == "request":
+            node.update(status=self.status, bytes=self.bytes, cache=self.cache, error=self.error)
+        if self.children:
+            node["children"] = [child._to_dict(origin) for child in self.children]
+        return node
+
+    def explain(self, max_children: int = 8) -> str:
+        """A readable summary: the tree (long runs of requests collapsed), the critical path and any waste."""
+        requests = self.requests()
+        sent = [span for span in requests if span.cache != "hit"]
+        lines = [
+            f"{self._label()}  {_ms(self.duration)}  {len(sent)} requests  {_size(sum(span.bytes for span in sent))}"
+            + (f"  {len(requests) - len(sent)} cache hits" if len(requests) > len(sent) else "")
+        ]
+        self._explain_children(lines, "", max_children)
+
+        path = self.critical_path()
+        if len(path) > 1:
+            lines.append("")
+            lines.append("Critical path: " + " -> ".join(span._label(short=True) for span in path))
+        wasted = {name: count for name, count in self.wasted().items() if count}
+        if wasted:
+            lines.append("Wasted: " + ", ".join(f"{count} {name}" for name, count in wasted.items()))
+        return "\n".join(lines)
+
+    def _explain_children(self, lines: List[str], indent: str, max_children: int) -> None:
+        children = self.children
+        shown = children if len(children) <= max_children else children[:max_children - 1]
+        for i, child in enumerate(shown):
+            last = i == len(children) - 1
+            lines.append(f"{indent}{'└─ ' if last else '├─ '}{child._line()}")
+            child._explain_children(lines, indent + ("   " if last else "│  "), max_children)
+        hidden = children[len(shown):]
+        if hidden:
+            durations = sorted(span.duration for span in hidden)
+            lines.append(
+                f"{indent}└─ ... {len(hidden)} more  (median {_ms(durations[len(durations) // 2])}, "
+                f"max {_ms(durations[-1])}, {_size(sum(span.bytes for span in hidden))})"
+            )
+
+    def _label(self, short: bool = False) -> str:
+        if self.kind == "request":
+            url = self.attrs.get("url", "")
+            return f"GET {url.split('://', 1)[-1].split('/', 1)[-1] if short else url}"
+        if self.attrs and not short:
+            return f"{self.name}({', '.join(f'{key}={value!r}' for key, value in self.attrs.items())})"
+        return self.name
+
+    def _line(self) -> str:
+        if self.kind != "request":
+            return f"{self._label()}  {_ms(self.duration)}"
+        if self.cache == "hit":
+            return f"{self._label()}  cache hit"
+        status = self.error or self.status
+        return f"{self._label()}  {status}  {_ms(self.duration)}  {_size(self.bytes)}"
+
+    def __repr__(self) -> str:
+        return f"<Span {self._label()} {_ms(self.duration)} children={len(self.children)}>"
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
+
+
+def _size(nbytes: int) -> str:
+    if nbytes < 1024:
+        return f"{nbytes} B"
+    if nbytes < 1024 * 1024:
+        return f"{nbytes / 1024:.1f} kB"
+    return f"{nbytes / (1024 * 1024):.1f} MB"
+
+
+class InMemoryExporter:
+    """Keeps the most recent finished root spans in memory.
+
+    Args:
+        max_spans: How many root spans to keep. Defaults to 100.
+    """
+
+    def __init__(self, max_spans: int = 100):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class Tracer:
+    """Traces every traced client call made outside an existing trace, and hands the finished trees to an exporter.
+
+    Args:
+        exporter: Any object with an `export(span)` method. Defaults to an `InMemoryExporter`.
+    """
+
+    def __init__(self, exporter: Any = None):
+        self.exporter = exporter if exporter is not None else InMemoryExporter()
+
+    @property
+    def last(self) -> Optional[Span]:
+        """The most recently finished call (with the default in-memory exporter)."""
+        spans = getattr(self.exporter, "spans", None)
+        return spans[-1] if spans else None
+
+
+def current_span() -> Optional[Span]:
+    """The span new requests would be recorded under, or None when nothing is being traced."""
+    return _SPAN.get()
+
+
+@contextmanager
+def trace(name: str, **attrs: Any) -> Iterator[Span]:
+    """Trace the block as a root span (or as a child, inside another trace), and return that span."""
+    with _open(name, "call", attrs) as root:
+        yield root
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """Group the requests made inside the block (e.g. 'pages' or 'refs') under a stage span, when tracing."""
+    if _SPAN.get() is None:
+        yield None
+        return
+    with _open(name, "stage", attrs) as stage:
+        yield stage
+
+
+@contextmanager
+def _open(name: str, kind: str, attrs: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+    new = Span(name, kind, attrs)
+    parent = _SPAN.get()
+    if parent is not None:
+        parent.children.append(new)
+    token = _SPAN.set(new)
+    try:
+        yield new
+    except BaseException as e:
+        new.error = "cancelled" if isinstance(e, asyncio.CancelledError) else type(e).__name__
+        raise
+    finally:
+        new.end = time.perf_counter()
+        _SPAN.reset(token)
+
+
+def record_request(url: str, start: float, status: Optional[str], nbytes: int = 0, error: Optional[str] = None, cache: Optional[str] = None, **attrs: Any) -> None:
+    """Add a finished request (or a cache hit, with cache='hit') under the current span."""
+    parent = _SPAN.get()
+    if parent is None:
+        return
+    request = Span("GET", "request", {"url": url, **attrs})
+    request.start = start
+    request.end = time.perf_counter()
+    request.status = status
+    request.bytes = nbytes
+    request.error = error
+    request.cache = cache
+    parent.children.append(request)
+
+
+def traced(method: F) -> F:
+    """Record a client method as a 'call' span: a new root if the client has a tracer, or a child in a trace."""
+    name = method.__name__
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        parent = _SPAN.get()
+        tracer = self.tracer
+        if parent is None and tracer is None:
+            return await method(self, *args, **kwargs)
+        if parent is not None and parent.kind == "call" and parent.name == name:
+            # A method re-entering itself (e.g. after applying its timeout budget) stays one span
+            return await method(self, *args, **kwargs)
+        # The arguments that were actually passed (so the span reads like the call)
+        arguments = signature.bind_partial(self, *args, **kwargs).arguments
+        attrs = {key: value for key, value in list(arguments.items())[1:] if value is not None}
+        with _open(name, "call", attrs) as call:
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                if parent is None:
+                    tracer.exporter.export(call)
+
+    return wrapper  # type: ignore[return-value]
+
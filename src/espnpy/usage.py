@@ -0,0 +1,142 @@
+"""Usage reports: what a single call (or block of calls) cost in requests, bytes and time.
+
+    with usage() as report:
+        athletes = await client.get_athletes("nfl")
+    print(report)  # Usage(requests=17121, bytes=61.2 MB, cache_hits=0, retries=0, wall=48.3s, ...)
+
+    # Or get the result and its report together
+    athletes, report = await client.report(client.nfl.athletes())
+
+Every request made inside the block (including by the tasks it spawns) is counted. Reports nest, so a
+request counts towards every report that is open around it. Handy for budgeting jobs, and for catching an
+accidental fan-out explosion in CI with e.g. `assert report.requests < 50`.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Tuple
+
+_REPORTS: ContextVar[Tuple["Usage", ...]] = ContextVar("espnpy_usage", default=())
+
+
+class Usage:
+    """The cost of everything done inside a `usage()` block.
+
+    Attributes:
+        requests: HTTP requests sent (including failed, retried and hedged ones).
+        bytes: Response body bytes received.
+        cache_hits: Responses served without a request (season calendars, stale circuit breaker copies).
+        retries: Requests retried after a transient failure.
+        errors: Requests that failed (an error status, or no response at all).
+        wall_time: Seconds from the start to the end of the block.
+        parse_time: CPU seconds the event loop's thread spent inside the block (decoding JSON, standardizing
+                    and the HTTP client's own work). Includes any unrelated work running on the same loop.
+        json_time: The part of `parse_time` spent decoding JSON responses.
+        queue_time: Seconds requests spent queued for the rate limiter or a concurrency slot (summed).
+        network_time: Seconds requests spent waiting on ESPN once sent (summed).
+        peak_concurrency: The most requests of this block in flight at once.
+    """
+
+    __slots__ = (
+        "requests", "bytes", "cache_hits", "retries", "errors", "wall_time", "parse_time", "json_time",
+        "queue_time", "network_time", "peak_concurrency", "_in_flight", "_started", "_cpu_started",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.errors = 0
+        self.wall_time = 0.0
+        self.parse_time = 0.0
+        self.json_time = 0.0
+        self.queue_time = 0.0
+        self.network_time = 0.0
+        self.peak_concurrency = 0
+        self._in_flight = 0
+        self._started = time.perf_counter()
+        self._cpu_started = time.thread_time()
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds of the block not spent on the CPU: waiting on the network, the rate limiter or the scheduler."""
+        return max(0.0, self.wall_time - self.parse_time)
+
+    def _finish(self) -> None:
+        self.wall_time = time.perf_counter() - self._started
+        self.parse_time = time.thread_time() - self._cpu_started
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "errors": self.errors,
+            "wall_time": self.wall_time,
+            "parse_time": self.parse_time,
+            "wait_time": self.wait_time,
+            "json_time": self.json_time,
+            "queue_time": self.queue_time,
+            "network_time": self.network_time,
+            "peak_concurrency": self.peak_concurrency,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Usage(requests={self.requests}, bytes={self.bytes / 1e6:.1f} MB, cache_hits={self.cache_hits}, "
+            f"retries={self.retries}, errors={self.errors}, wall={self.wall_time:.2f}s, parse={self.parse_time:.2f}s, "
+            f"wait={self.wait_time:.2f}s, peak_concurrency={self.peak_concurrency})"
+        )
+
+
+@contextmanager
+def usage() -> Iterator[Usage]:
+    """Measure everything the client does inside the block. The report is complete once the block exits."""
+    report = Usage()
+    token = _REPORTS.set(_REPORTS.get() + (report,))
+    try:
+        yield report
+    finally:
+        _REPORTS.reset(token)
+        report._finish()
+
+
+def active_reports() -> Tuple[Usage, ...]:
+    """The reports open around the current code (usually none)."""
+    return _REPORTS.get()
+
+
+def record_sent(reports: Tuple[Usage, ...]) -> None:
+    """Count a request going out (for the peak concurrency)."""
+    for report in reports:
+        report.requests += 1
+        report._in_flight += 1
+        if report._in_flight > report.peak_concurrency:
+            report.peak_concurrency = report._in_flight
+
+
+def record_done(reports: Tuple[Usage, ...], queue_time: float, network_time: float, nbytes: int = 0, error: bool = False) -> None:
+    """Count a request coming back (or failing)."""
+    for report in reports:
+        report._in_flight -= 1
+        report.queue_time += queue_time
+        report.network_time += network_time
+        report.bytes += nbytes
+        report.errors += error
+
+
+def record_cache_hit() -> None:
+    for report in _REPORTS.get():
+        report.cache_hits += 1
+
+
+def record_retry() -> None:
+    for report in _REPORTS.get():
+        report.retries += 1
+
+
+def record_json(seconds: float) -> None:
+    for report in _REPORTS.get():
+        report.json_time += seconds
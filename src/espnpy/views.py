@@ -0,0 +1,97 @@
+"""Lazy, read-only views over the raw ESPN JSON (`lazy=True`).
+
+A `LazyView` looks and behaves like the standardized dictionary (same keys, same order, same values),
+but it keeps a reference to the raw JSON instead of flattening it up front. Each field is extracted the
+first time it is read and then memoized, so a poller that only looks at `game["status"]` and the two
+scores never pays for the rest of the game.
+
+Views are read-only. Call `materialize()` for a plain dictionary (e.g. before serializing to JSON).
+"""
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+from .extractors import Spec
+
+Getter = Callable[[Any, Dict[str, Any]], Any]
+
+
+class LazyView(Mapping):
+    """A read-only mapping whose values are computed from `source` on first access.
+
+    Args:
+        source: The raw object the fields are extracted from.
+        getters: Ordered `{field: getter(source, memo)}`. `memo` is a per-view scratch dictionary that
+                 getters use to share intermediate values (like a game's home/away sides).
+        values: Optional fields that are already known (they are returned as-is).
+    """
+
+    __slots__ = ("_source", "_getters", "_values", "_memo")
+
+    def __init__(self, source: Any, getters: Dict[str, Getter], values: Optional[Dict[str, Any]] = None):
+        self._source = source
+        self._getters = getters
+        self._values: Dict[str, Any] = dict(values) if values else {}
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    def from_spec(cls, spec: Spec, source: Any, names: Optional[Sequence[str]] = None, values: Optional[Dict[str, Any]] = None) -> "LazyView":
+        """Build a view over one source object using a spec's fields (default: all of them)."""
+        return cls(source, spec.getters(names), values)
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        # KeyError for fields that aren't part of the view, just like a dictionary
+        value = self._values[name] = self._getters[name](self._source, self._memo)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._getters)
+
+    def __len__(self) -> int:
+        return len(self._getters)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._getters
+
+    def materialize(self) -> Dict[str, Any]:
+        """Extract every remaining field and return the view as a plain dictionary.
+
+        Nested views (e.g. a lazy summary's plays) are materialized as well.
+        """
+        return {name: _materialize(self[name]) for name in self._getters}
+
+    def __repr__(self) -> str:
+        loaded = ", ".join(f"{name!r}: {self._values[name]!r}" for name in self._getters if name in self._values)
+        return f"LazyView({{{loaded}}}, {len(self._values)}/{len(self._getters)} fields loaded)"
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, LazyView):
+        return value.materialize()
+    if isinstance(value, list) and value and isinstance(value[0], LazyView):
+        return [v.materialize() for v in value]
+    return value
+
+
+def lazy_views(spec: Spec, sources: Any, names: Optional[Sequence[str]] = None, tolerant: bool = False) -> list:
+    """One `LazyView` per source object (every view shares the spec's cached getter table).
+
+    With `tolerant=True`, a field that can't be extracted from a malformed source reads as None instead of
+    raising in the caller's code, long after the request returned.
+    """
+    getters = spec.getters(names)
+    if tolerant:
+        getters = {name: _tolerant(getter) for name, getter in getters.items()}
+    return [LazyView(source, getters) for source in sources]
+
+
+def _tolerant(getter: Getter) -> Getter:
+    def field(source: Any, memo: Dict[str, Any]) -> Any:
+        try:
+            return getter(source, memo)
+        except Exception:
+            return None
+    return field
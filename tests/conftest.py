@@ -0,0 +1,15 @@
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_session():
+    """Install a `httpx.MockTransport` handler as every HTTP session `client` opens (on any event loop).
+
+    Returns the client, so a test can write `client = mock_session(ESPNClient(...), handler)`.
+    """
+    def install(client, handler):
+        client._new_session = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return install
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.circuit import CircuitBreaker
+from espnpy.exceptions import CircuitOpenError
+
+SICK = "site.web.api.espn.com"
+
+
+def _client(mock_session, breaker, sick_status=503):
+    client = ESPNClient(circuit_breaker=breaker)
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        if request.url.host == SICK and client.sick:
+            return httpx.Response(sick_status, json={})
+        return httpx.Response(200, json={"host": request.url.host})
+
+    client.sick = True
+    mock_session(client, handler)
+    return client, calls
+
+
+def test_sick_host_fails_fast_without_affecting_healthy_hosts(mock_session):
+    breaker = CircuitBreaker(window=4, min_requests=4, reset_timeout=0.05)
+    client, calls = _client(mock_session, breaker)
+
+    async def main():
+        for _ in range(4):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_url(f"https://{SICK}/apis/common/v3/splits")
+        assert breaker.state(SICK) == "open"
+
+        # Open: no request is sent, and the other hosts are untouched
+        with pytest.raises(CircuitOpenError) as error:
+            await client.get_url(f"https://{SICK}/apis/common/v3/splits")
+        assert error.value.host == SICK
+        assert len(calls) == 4
+        assert await client.get_url("https://site.api.espn.com/apis/site/v2/x") == {"host": "site.api.espn.com"}
+
+        # Half-open: a single probe goes out, and its success closes the circuit
+        await asyncio.sleep(0.06)
+        client.sick = False
+        assert await client.get_url(f"https://{SICK}/apis/common/v3/splits") == {"host": SICK}
+        assert breaker.state(SICK) == "closed"
+
+    asyncio.run(main())
+
+
+def test_half_open_allows_one_probe_and_a_failed_probe_reopens():
+    breaker = CircuitBreaker(consecutive_timeouts=2, reset_timeout=0.01)
+    for _ in range(2):
+        ticket = breaker.allow("a")
+        assert ticket
+        breaker.record("a", failure=True, timeout=True, ticket=ticket)
+    assert breaker.state("a") == "open"
+    assert not breaker.allow("a")
+
+    time.sleep(0.02)
+    probe = breaker.allow("a")
+    assert probe                     # the probe
+    assert not breaker.allow("a")    # everyone else still fails fast
+    breaker.record("a", failure=True, ticket=probe)
+    assert breaker.state("a") == "open"
+
+
+def test_stale_completions_do_not_decide_the_half_open_verdict():
+    breaker = CircuitBreaker(consecutive_timeouts=2, reset_timeout=0.01)
+    stale = breaker.allow("a")  # In flight since before the circuit opens
+    for _ in range(2):
+        breaker.record("a", failure=True, timeout=True, ticket=breaker.allow("a"))
+    assert breaker.state("a") == "open"
+
+    time.sleep(0.02)
+    probe = breaker.allow("a")
+    assert probe
+    # The old request finally succeeds: it neither closes the circuit nor frees the probe slot
+    breaker.record("a", failure=False, ticket=stale)
+    assert breaker.state("a") == "half-open"
+    assert not breaker.allow("a")
+    breaker.release("a", stale)
+    assert not breaker.allow("a")
+
+    # Only the probe decides, and after it closes the circuit the old request still has no say
+    breaker.record("a", failure=False, ticket=probe)
+    assert breaker.state("a") == "closed"
+    breaker.record("a", failure=True, timeout=True, ticket=stale)
+    breaker.record("a", failure=True, timeout=True, ticket=stale)
+    assert breaker.state("a") == "closed"
+
+
+def test_client_errors_count_as_healthy_and_stale_responses_are_served(mock_session):
+    breaker = CircuitBreaker(window=2, min_requests=2, stale_size=8)
+    client, calls = _client(mock_session, breaker, sick_status=404)
+
+    async def main():
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_url(f"https://{SICK}/missing")
+        assert breaker.state(SICK) == "closed"
+
+        client.sick = False
+        good = await client.get_url(f"https://{SICK}/splits")
+        breaker._open(breaker._circuit(SICK))
+        assert await client.get_url(f"https://{SICK}/splits") == good
+        with pytest.raises(CircuitOpenError):
+            await client.get_url(f"https://{SICK}/other")
+
+    asyncio.run(main())
+
+
+def test_stale_copies_are_not_shared_with_callers():
+    breaker = CircuitBreaker(stale_size=8)
+    page = {"items": [1]}
+    breaker.remember("https://a/teams", {"page": 1}, page)
+    page["items"].append(2)
+
+    stale = breaker.stale("https://a/teams", {"page": 1})
+    stale["items"].append(3)
+    assert breaker.stale("https://a/teams", {"page": 1}) == {"items": [1]}
@@ -0,0 +1,90 @@
+import pytest
+from espnpy import ESPNClient
+
+SCOREBOARD = {
+    "events": [
+        {
+            "id": str(400 + n),
+            "name": f"Away {n} at Home {n}",
+            "season": {"year": 2024, "type": 2, "slug": "regular-season"},
+            "competitions": [{
+                "id": str(400 + n),
+                "date": "2024-01-01T00:00Z",
+                "status": {"type": {"description": "Final"}, "displayClock": "0:00", "period": 4},
+                "broadcasts": [{"names": ["ESPN"]}],
+                "competitors": [
+                    {"homeAway": "home", "score": "110", "team": {"id": "1", "displayName": f"Home {n}"}},
+                    {"homeAway": "away", "score": "99", "team": {"id": "2", "displayName": f"Away {n}"}},
+                ],
+            }],
+        }
+        for n in range(3)
+    ]
+}
+
+STANDINGS = {
+    "children": [{
+        "name": "East",
+        "standings": {"entries": [
+            {"team": {"id": "1", "displayName": "Worse"}, "stats": [{"name": "winPercent", "displayValue": ".250"}]},
+            {"team": {"id": "2", "displayName": "Better"}, "stats": [{"name": "winPercent", "displayValue": ".750"}]},
+        ]},
+    }]
+}
+
+
+class _Response:
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_outputs_share_one_schema():
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return SCOREBOARD
+
+        client._get = fake_get
+        games = await client.nba.scoreboard()
+        assert [g["homeTeam"] for g in games] == ["Home 0", "Home 1", "Home 2"]
+        assert games[0]["broadcasts"] == ["ESPN"]
+
+        np = pytest.importorskip("numpy")
+        arrays = await client.nba.scoreboard(output="numpy")
+        assert list(arrays) == list(games[0])
+        assert arrays["seasonYear"].dtype == np.int64
+        assert list(arrays["id"]) == [g["id"] for g in games]
+
+        pytest.importorskip("pyarrow")
+        table = await client.nba.scoreboard(output="arrow")
+        assert table.num_rows == 3
+        assert table.column_names == list(games[0])
+        assert table.to_pylist() == games
+
+
+@pytest.mark.asyncio
+async def test_standings_columnar_keeps_sort_order():
+    async with ESPNClient() as client:
+        async def fake_session_get(url, params=None):
+            return _Response(STANDINGS)
+
+        client._session.get = fake_session_get
+        standings = await client.get_standings("nba")
+        assert [s["name"] for s in standings] == ["Better", "Worse"]
+
+        pytest.importorskip("numpy")
+        arrays = await client.get_standings("nba", output="numpy")
+        assert list(arrays["name"]) == ["Better", "Worse"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_output_raises():
+    async with ESPNClient() as client:
+        with pytest.raises(ValueError):
+            await client.get_scoreboard("nba", output="csv")
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.deadlines import deadline, remaining
+from espnpy.exceptions import DeadlineExceeded
+
+
+def _client(mock_session, detail_delay):
+    """A client whose league list answers at once, but whose league details take `detail_delay` seconds."""
+    client = ESPNClient()
+    calls = {"started": 0, "finished": 0}
+
+    async def handler(request):
+        if request.url.path.endswith("/leagues"):
+            refs = [{"$ref": f"https://sports.core.api.espn.com/v2/sports/football/leagues/{i}"} for i in range(5)]
+            return httpx.Response(200, json={"items": refs})
+        calls["started"] += 1
+        await asyncio.sleep(detail_delay)
+        calls["finished"] += 1
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[1]})
+
+    mock_session(client, handler)
+    return client, calls
+
+
+def test_budget_cancels_outstanding_requests(mock_session):
+    client, calls = _client(mock_session, detail_delay=5.0)
+
+    async def main():
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded) as error:
+            await client.get_leagues("football", timeout_budget=0.1)
+        assert time.monotonic() - start < 1.0
+        assert error.value.budget == 0.1
+        # Every detail request went out, and none of them was left running
+        await asyncio.sleep(0)
+        assert calls == {"started": 5, "finished": 0}
+
+    asyncio.run(main())
+
+
+def test_call_within_budget_succeeds(mock_session):
+    client, _ = _client(mock_session, detail_delay=0.01)
+
+    async def main():
+        leagues = await client.get_leagues("football", timeout_budget=2.0)
+        assert sorted(league["id"] for league in leagues) == ["0", "1", "2", "3", "4"]
+
+    asyncio.run(main())
+
+
+def test_nested_deadlines_only_shorten():
+    async def main():
+        assert remaining() is None
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            async with deadline(0.05):
+                async with deadline(10.0):
+                    assert remaining() <= 0.05
+                    await asyncio.sleep(1)
+        assert time.monotonic() - start < 0.5
+        assert remaining() is None
+
+    asyncio.run(main())
+
+
+def test_inner_deadline_is_reported_by_the_inner_block():
+    async def main():
+        async with deadline(10.0):
+            with pytest.raises(DeadlineExceeded) as error:
+                async with deadline(0.01):
+                    await asyncio.sleep(1)
+            assert error.value.budget == 0.01
+            assert 9 < remaining() <= 10
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+import espnpy
+from espnpy import ESPNClient, LeagueProxy
+
+
+def test_import_does_not_create_the_default_client():
+    # Checked in a fresh interpreter, since other tests may already have used the default client
+    code = "import espnpy; assert espnpy._client is None; espnpy.nfl; assert espnpy._client is not None"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_module_level_leagues_resolve_through_the_default_client():
+    assert isinstance(espnpy._default_client, ESPNClient)
+    assert isinstance(espnpy.nba, LeagueProxy)
+    assert espnpy.nba._client is espnpy._default_client
+    assert espnpy.eng_1.league == "eng.1"
+    assert espnpy.college_softball.league == "college-softball"
+    assert set(espnpy.__all__) >= {"nfl", "nba", "eng_1"}
+
+
+def test_unknown_module_attributes_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        espnpy.not_a_league
+    assert not hasattr(espnpy, "__wrapped__")
+    # Only leagues are forwarded: the client's own attributes aren't reachable from the package
+    assert not hasattr(espnpy, "get_url")
+    assert not hasattr(espnpy, "_loop_states")
+
+
+def test_attribute_probes_do_not_create_the_default_client():
+    code = "import espnpy; hasattr(espnpy, 'nbaa'); hasattr(espnpy, 'get_teams'); assert espnpy._client is None"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_league_proxies_are_cached_per_client():
+    client = ESPNClient()
+    assert client.nba is client.nba  # explicit property
+    assert client.eng_1 is client.eng_1  # dynamic fallback
+    assert client.eng_1.league == "eng.1"
+    assert client.college_softball.league == "college-softball"
+    assert ESPNClient().nba is not client.nba
+    with pytest.raises(AttributeError):
+        client.not_a_league
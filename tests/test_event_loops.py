@@ -0,0 +1,168 @@
+import asyncio
+
+import httpx
+from espnpy import ESPNClient
+from espnpy.ratelimit import RateLimiter
+
+
+def _mock_client(mock_session, requests):
+    client = ESPNClient()
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    mock_session(client, handler)
+    return client
+
+
+def test_client_survives_repeated_asyncio_run(mock_session):
+    requests = []
+    client = _mock_client(mock_session, requests)
+    sessions = []
+
+    async def poll():
+        assert await client.get_url("https://example.com/a") == {"ok": True}
+        assert await client.get_url("https://example.com/b") == {"ok": True}
+        sessions.append(client._session)
+
+    asyncio.run(poll())
+    asyncio.run(poll())
+
+    assert len(requests) == 4
+    # One session per loop (reused within it), and each is closed when its loop shuts down
+    assert sessions[0] is not sessions[1]
+    assert all(session.is_closed for session in sessions)
+
+
+def test_close_only_resets_the_running_loop(mock_session):
+    client = _mock_client(mock_session, [])
+
+    async def main():
+        first = client._session
+        assert client._session is first
+        await client.close()
+        assert first.is_closed
+        second = client._session
+        assert second is not first and not second.is_closed
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_pool_settings_and_connections_per_host():
+    client = ESPNClient(timeout=8, connect_timeout=2, max_connections=10, max_keepalive_connections=5, keepalive_expiry=30, connections_per_host=3)
+    assert client._timeout == httpx.Timeout(8, connect=2)
+    assert client._limits == httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30)
+
+    used = []
+
+    def session(n):
+        return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: used.append(n) or httpx.Response(200, json={})))
+
+    sessions = iter(range(3))
+    client._new_session = lambda: session(next(sessions))
+
+    async def main():
+        await asyncio.gather(*(client.get_url(f"https://example.com/{i}") for i in range(6)))
+
+    asyncio.run(main())
+    # Requests are spread evenly across the three pools
+    assert sorted(used) == [0, 0, 1, 1, 2, 2]
+
+
+def test_warmup_opens_every_host_on_every_pool(mock_session):
+    requests = []
+    client = ESPNClient(connections_per_host=2)
+
+    def handler(request):
+        requests.append((request.method, request.url.host))
+        if request.url.host == "site.web.api.espn.com":
+            raise httpx.ConnectError("unreachable")
+        return httpx.Response(404)
+
+    mock_session(client, handler)
+
+    async def main():
+        return await client.warmup()
+
+    assert asyncio.run(main()) == {"sports.core.api.espn.com": True, "site.api.espn.com": True, "site.web.api.espn.com": False}
+    assert sorted(requests) == sorted(("HEAD", host) for host in ESPNClient.WARMUP_HOSTS for _ in range(2))
+
+
+def test_warm_flag_warms_before_the_context_manager_returns(mock_session):
+    requests = []
+    client = ESPNClient(warm=True)
+    mock_session(client, lambda r: requests.append(r.url.host) or httpx.Response(200, json={}))
+
+    async def main():
+        async with client:
+            assert sorted(requests) == sorted(ESPNClient.WARMUP_HOSTS)
+
+    asyncio.run(main())
+
+
+def test_dead_loops_are_not_kept_alive(mock_session):
+    client = _mock_client(mock_session, [])
+
+    async def poll():
+        await client.get_url("https://example.com/a")
+
+    for _ in range(5):
+        asyncio.run(poll())
+    assert len(client._loop_states) == 0
+
+    async def close_then_poll():
+        await poll()
+        await client.close()
+        await poll()  # A fresh state for the same loop, which the first closer must not remove
+        assert len(client._loop_states) == 1
+
+    asyncio.run(close_then_poll())
+    assert len(client._loop_states) == 0
+
+
+def test_warmup_goes_through_the_limits_and_warms_hosts_in_use(mock_session):
+    requests = []
+    client = ESPNClient(max_concurrency=1, interactive_reserve=0, rate_limit=RateLimiter(rate=1000))
+
+    def handler(request):
+        requests.append((request.method, request.url.host, client._scheduler.in_flight))
+        return httpx.Response(200, json={})
+
+    mock_session(client, handler)
+
+    async def main():
+        await client.warmup()
+        # Every HEAD held the only concurrency slot, and took a token from its host's bucket
+        assert [in_flight for _, _, in_flight in requests] == [1, 1, 1]
+        assert sorted(client.rate_limiter.stats()) == sorted(ESPNClient.WARMUP_HOSTS)
+
+        await client.get_url("https://site.api.espn.com/apis/site/v2/x")
+        requests.clear()
+        assert await client.warmup() == {"site.api.espn.com": True}
+        assert requests == [("HEAD", "site.api.espn.com", 1)]
+
+    asyncio.run(main())
+
+
+def test_close_cancels_warmups_and_calendar_downloads(mock_session):
+    client = ESPNClient(warm=True)
+
+    async def hang(request):
+        await asyncio.Event().wait()
+
+    mock_session(client, hang)
+
+    async def main():
+        state = client._loop_state()
+        lookup = asyncio.ensure_future(client.get_season_calendar("nba", season="2024"))
+        await asyncio.sleep(0.01)
+        background = [state.warming, *state.calendars.values()]
+        assert len(background) == 2
+
+        await client.close()
+        assert all(task.cancelled() for task in background)
+        lookup.cancel()
+
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+from espnpy import ESPNClient
+from espnpy.export import PLAYER_GAME_SCHEMA, TEAM_GAME_SCHEMA, _PartitionBuffer, _append_boxscore
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+
+def _fake_summary(event_id: str) -> dict:
+    return {
+        "boxscore": {
+            "teams": [{
+                "team": {"id": "1", "displayName": "Atlanta Hawks", "abbreviation": "ATL"},
+                "statistics": [{"label": "FG", "displayValue": "40-88"}, {"label": "Field Goal %", "displayValue": "45.5"}],
+            }],
+            "players": [{
+                "team": {"id": "1"},
+                "statistics": [{
+                    "labels": ["MIN", "PTS", "FG"],
+                    "athletes": [
+                        {"athlete": {"id": "10", "displayName": "Trae Young", "position": {"abbreviation": "PG"}}, "starter": True, "stats": ["36", "30", "10-21"]},
+                        {"athlete": {"id": "11", "displayName": "Bench Player", "position": {"abbreviation": "F"}}, "stats": ["--", "0", "0-0"]},
+                    ],
+                }],
+            }],
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_export_boxscores_writes_partitioned_batches(tmp_path):
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return _fake_summary(params["event"])
+
+        client._get = fake_get
+        result = await client.export_boxscores(
+            "nba", str(tmp_path), season="2024", event_ids=[str(n) for n in range(5)], batch_size=2
+        )
+
+    assert result["games"] == 5
+    # MIN, PTS and FG (split into FGM and FGA) for 2 players in each of the 5 games
+    assert result["playerRows"] == 5 * 2 * 4
+    # 5 games in batches of 2 -> 3 part files per table
+    assert len(result["files"]["player_game"]) == 3
+    assert all("league=nba" in f and "season=2024" in f for f in result["files"]["team_game"])
+
+    players = pq.read_table(result["files"]["player_game"][0])
+    assert players.schema.field("value").type == pa.float64()
+    rows = players.to_pylist()
+    trae_points = next(r for r in rows if r["athleteId"] == "10" and r["stat"] == "PTS")
+    assert trae_points["value"] == 30.0
+    assert trae_points["starter"] is True
+    trae_attempts = next(r for r in rows if r["athleteId"] == "10" and r["stat"] == "FGA")
+    assert trae_attempts["value"] == 21.0
+    assert trae_attempts["displayValue"] == "10-21"
+    bench_minutes = next(r for r in rows if r["athleteId"] == "11" and r["stat"] == "MIN")
+    assert bench_minutes["value"] is None
+    assert bench_minutes["displayValue"] == "--"
+
+
+@pytest.mark.asyncio
+async def test_export_boxscores_rejects_unknown_format(tmp_path):
+    async with ESPNClient() as client:
+        with pytest.raises(ValueError, match="Unsupported file_format"):
+            await client.export_boxscores("nba", str(tmp_path), event_ids=[], file_format="csv")
+
+
+def test_boxscore_labels_are_parsed_as_columns(tmp_path):
+    players = _PartitionBuffer(PLAYER_GAME_SCHEMA, str(tmp_path), "parquet")
+    teams = _PartitionBuffer(TEAM_GAME_SCHEMA, str(tmp_path), "parquet")
+    boxscore = {"players": [
+        {"id": "1", "stats": {"receiving": {"REC": "--", "YDS": "0"}}},
+        {"id": "2", "stats": {"receiving": {"REC": "3-4", "YDS": "41"}}},
+        {"id": "3", "stats": {"rushing": {"YDS": "12"}}},
+    ]}
+    _append_boxscore(boxscore, players, teams, sport="football")
+
+    # The blank REC doesn't make the first player's REC a plain number: the whole column is pairs
+    rows = list(zip(players.columns[2], players.columns[7], players.columns[8]))
+    assert rows == [
+        ("1", "RECM", None), ("1", "RECA", None), ("2", "RECM", 3), ("2", "RECA", 4),
+        ("1", "YDS", 0), ("2", "YDS", 41),
+        ("3", "YDS", 12),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_boxscores_replaces_earlier_part_files(tmp_path):
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return _fake_summary(params["event"])
+
+        client._get = fake_get
+        await client.export_boxscores("nba", str(tmp_path), season="2024", event_ids=[str(n) for n in range(5)], batch_size=2)
+        result = await client.export_boxscores("nba", str(tmp_path), season="2024", event_ids=["0"], batch_size=2)
+
+    directory = os.path.dirname(result["files"]["player_game"][0])
+    assert sorted(os.listdir(directory)) == ["part-00000.parquet"]
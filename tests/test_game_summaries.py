@@ -0,0 +1,101 @@
+import asyncio
+import httpx
+import pytest
+from espnpy import ESPNClient
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+@pytest.mark.asyncio
+async def test_game_summaries_retries_and_collects_errors():
+    async with ESPNClient(max_concurrency=4) as client:
+        attempts = {}
+
+        async def fake_get(endpoint, params=None, base_url=None):
+            event_id = params["event"]
+            attempts[event_id] = attempts.get(event_id, 0) + 1
+            if event_id == "flaky" and attempts[event_id] < 3:
+                raise _status_error(503)
+            if event_id == "missing":
+                raise _status_error(404)
+            return {"plays": [{"id": "1", "text": f"Tip-off in {event_id}"}]}
+
+        client._get = fake_get
+        written = []
+        errors = {}
+        event_ids = [str(n) for n in range(20)] + ["flaky", "missing"]
+
+        summaries = [
+            s async for s in client.get_game_summaries("nba", event_ids, backoff=0.0, sink=written.append, errors=errors)
+        ]
+
+        assert {s["id"] for s in summaries} == set(event_ids) - {"missing"}
+        assert written == summaries
+        assert attempts["flaky"] == 3
+        assert list(errors) == ["missing"]
+        assert attempts["missing"] == 1  # 404s are not retried
+
+
+@pytest.mark.asyncio
+async def test_game_summaries_bounds_in_flight_requests():
+    async with ESPNClient(max_concurrency=3) as client:
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(endpoint, params=None, base_url=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return {}
+
+        client._get = fake_get
+        summaries = [s async for s in client.nba.game_summaries(str(n) for n in range(50))]
+
+        assert len(summaries) == 50
+        assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_waits_for_cancelled_requests():
+    async with ESPNClient(max_concurrency=4) as client:
+        cancelled = []
+
+        async def fake_get(endpoint, params=None, base_url=None):
+            if params["event"] != "0":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(params["event"])
+                    raise
+            return {}
+
+        client._get = fake_get
+        summaries = client.get_game_summaries("nba", [str(n) for n in range(10)])
+        async for summary in summaries:
+            assert summary["id"] == "0"
+            break
+        await summaries.aclose()
+
+        # By the time the generator has closed, every other request in the window has been cancelled and finished
+        assert sorted(cancelled) == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_a_none_event_id_does_not_end_the_batch():
+    async with ESPNClient(max_concurrency=2) as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            if params["event"] == "None":
+                raise _status_error(404)
+            return {}
+
+        client._get = fake_get
+        errors = {}
+        summaries = [s async for s in client.get_game_summaries("nba", ["1", None, "2", "3"], retries=0, errors=errors)]
+
+        assert sorted(s["id"] for s in summaries) == ["1", "2", "3"]
+        assert list(errors) == ["None"]
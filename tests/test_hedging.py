@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.hedging import HedgePolicy
+
+
+def _client(mock_session, policy, delays):
+    client = ESPNClient(hedge=policy)
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(delays[len(calls) - 1] if len(calls) <= len(delays) else 0)
+        return httpx.Response(200, json={"attempt": len(calls)})
+
+    mock_session(client, handler)
+    return client, calls
+
+
+def test_slow_first_attempt_is_hedged_and_cancelled(mock_session):
+    policy = HedgePolicy(initial_delay=0.05, budget=1.0)
+    client, calls = _client(mock_session, policy, [5.0, 0.0])
+
+    async def main():
+        return await client._get("sports/basketball/nba/scoreboard", base_url=ESPNClient.SITE_BASE_URL)
+
+    assert asyncio.run(asyncio.wait_for(main(), 2)) == {"attempt": 2}
+    assert len(calls) == 2
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+
+
+def test_hedges_respect_the_budget_and_only_cover_site_calls(mock_session):
+    policy = HedgePolicy(initial_delay=0.01, budget=0.5)
+    client, calls = _client(mock_session, policy, [0.05] * 10)
+
+    async def main():
+        # The first request only earns half a token, so it can't be hedged
+        await client._get("sports/basketball/nba/scoreboard", base_url=ESPNClient.SITE_BASE_URL)
+        # Core API calls are never hedged
+        await client._get("sports/basketball/leagues/nba")
+
+    asyncio.run(main())
+    assert len(calls) == 2 and policy.hedges == 0
+
+
+def test_hedge_delay_follows_the_latency_percentile():
+    policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0.001, window=100)
+    assert policy.delay() == policy.initial_delay
+    for latency in range(1, 101):
+        policy.record(latency / 1000)
+    assert policy.delay() == pytest.approx(0.091)
+    for _ in range(100):
+        policy.record(0.002)  # The window slides, old latencies are forgotten
+    assert policy.delay() == pytest.approx(0.002)
@@ -0,0 +1,101 @@
+import copy
+
+import pytest
+from espnpy import ESPNClient, extractors
+from espnpy.views import LazyView
+
+from .test_columnar import SCOREBOARD
+
+SUMMARY = {
+    "plays": [
+        {"id": "1", "text": "Jump ball", "clock": {"displayValue": "12:00"}, "period": {"number": 1}, "scoringPlay": False},
+        {"id": "2", "text": "Dunk", "clock": {"displayValue": "11:40"}, "period": {"number": 1}, "scoringPlay": True, "scoreValue": 2},
+    ],
+    "boxscore": {"teams": [{"team": {"id": "1", "displayName": "Home"}, "statistics": [{"label": "FG", "displayValue": "40-80"}]}]},
+}
+
+
+@pytest.mark.asyncio
+async def test_lazy_scoreboard_matches_dicts():
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return SCOREBOARD
+
+        client._get = fake_get
+        games = await client.nba.scoreboard()
+        views = await client.nba.scoreboard(lazy=True)
+
+        assert all(isinstance(v, LazyView) for v in views)
+        assert views[1]["homeTeam"] == "Home 1"
+        assert list(views[0]) == list(games[0])
+        assert views == games  # Mapping equality compares item by item
+        assert [v.materialize() for v in views] == games
+
+        ticker = await client.nba.scoreboard(lazy=True, fields=["id", "homeScore"])
+        assert dict(ticker[2]) == {"id": "402", "homeScore": "110"}
+        with pytest.raises(KeyError):
+            ticker[2]["awayScore"]
+
+        with pytest.raises(ValueError):
+            await client.nba.scoreboard(lazy=True, output="arrow")
+
+
+def test_lazy_view_memoizes_fields_and_shared_derived_values():
+    calls = []
+
+    def sides(competition, status):
+        calls.append(competition)
+        return original(competition, status)
+
+    original = extractors._competitor_sides
+    spec = extractors.Spec("game", {**extractors.GAME_SPEC.fields}, derived={
+        "sides": extractors.Fn(sides, "competition", "competition.status.type.description"),
+    })
+    source = next(iter(extractors.iter_game_sources(SCOREBOARD)))
+    view = LazyView.from_spec(spec, source)
+
+    assert calls == []  # Nothing is extracted until a field is read
+    assert (view["homeTeam"], view["awayTeam"], view["homeScore"]) == ("Home 0", "Away 0", "110")
+    assert len(calls) == 1  # The home/away sides are computed once and shared
+    assert "LazyView" in repr(view) and "'homeTeam': 'Home 0'" in repr(view)
+
+
+@pytest.mark.asyncio
+async def test_lazy_summary_builds_sections_on_access(monkeypatch):
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return SUMMARY
+
+        client._get = fake_get
+        summary = await client.nba.game_summary("400", lazy=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the boxscore should not be standardized")
+
+        monkeypatch.setattr(client, "_standardize_boxscore", fail)
+        assert summary["id"] == "400"
+        assert summary["plays"][1]["scoreValue"] == 2
+        assert summary["plays"][0]["clock"] == "12:00"
+        monkeypatch.undo()
+
+        eager = await client.nba.game_summary("400")
+        assert summary.materialize() == eager
+
+
+@pytest.mark.asyncio
+async def test_malformed_games_do_not_raise_in_lazy_views():
+    broken = copy.deepcopy(SCOREBOARD)
+    broken["events"][1]["competitions"][0]["status"] = "Final"  # Not an object
+    broken["events"].append({"id": "403", "competitions": [None]})
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return broken
+
+        client._get = fake_get
+        games = await client.nba.scoreboard()
+        views = await client.nba.scoreboard(lazy=True)
+
+        assert [game["id"] for game in games] == ["400", "402"]  # The eager path skips the malformed game
+        assert [view["id"] for view in views] == ["400", "401", "402"]
+        assert views[1]["status"] is None and views[1]["broadcasts"] == ["ESPN"]
+        assert views[1].materialize()["clock"] is None
@@ -0,0 +1,86 @@
+import asyncio
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.metrics import MetricsRegistry, endpoint_family
+from espnpy.ratelimit import RateLimiter
+
+
+def test_endpoint_families():
+    assert endpoint_family("https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams") == "core"
+    assert endpoint_family("https://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/events/1/competitions/1/odds") == "odds"
+    assert endpoint_family("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard") == "scoreboard"
+    assert endpoint_family("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event=1") == "summary"
+    assert endpoint_family("https://site.api.espn.com/apis/v2/sports/basketball/nba/standings") == "standings"
+    assert endpoint_family("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/news") == "news"
+    assert endpoint_family("https://site.api.espn.com/apis/search/v2?query=curry") == "search"
+    assert endpoint_family("https://site.web.api.espn.com/apis/common/v3/sports/basketball/nba/athletes/1/splits") == "splits"
+    assert endpoint_family("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/1") == "other"
+
+
+def test_requests_are_recorded_per_family(mock_session):
+    client = ESPNClient(metrics=True, rate_limit=RateLimiter(rate=1000, burst=1))
+
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    mock_session(client, handler)
+
+    async def main():
+        await client.get_url("https://sports.core.api.espn.com/v2/sports")
+        await client.get_url("https://sports.core.api.espn.com/v2/sports/football")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_url("https://sports.core.api.espn.com/v2/missing")
+        await client.get_url("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/news")
+
+    asyncio.run(main())
+    metrics = client.metrics.to_dict()
+    assert set(metrics) == {"core", "news"}
+    core = metrics["core"]
+    assert core["requests"] == 3
+    assert core["status"] == {"200": 2, "404": 1}
+    assert core["bytes"] > 0
+    assert core["latency"]["count"] == 3 and core["latency"]["buckets"]["+Inf"] == 3
+    # The burst of 1 means the later requests waited on the limiter
+    assert core["limiter_wait"] > 0
+
+
+def test_retries_and_calendar_cache_hits():
+    client = ESPNClient(metrics=True)
+    client._calendar_cache["nba"] = {("20231001", "20240630"): {"seasonYear": 2024, "startDate": "20231001", "endDate": "20240630"}}
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("down")
+        return "ok"
+
+    async def main():
+        assert await client._with_retries(flaky, retries=2, backoff=0, family="summary") == "ok"
+        await client.get_season_calendar("nba", season="2024")
+
+    asyncio.run(main())
+    metrics = client.metrics.to_dict()
+    assert metrics["summary"]["retries"] == 2
+    assert metrics["scoreboard"]["cache_hits"] == 1
+
+
+def test_prometheus_export():
+    registry = MetricsRegistry()
+    registry.record_request("core", 0.03, "200", 512)
+    registry.record_request("core", 2.0, "error")
+    registry.record_cache("scoreboard", hit=False)
+    text = registry.to_prometheus()
+    assert "# TYPE espnpy_request_duration_seconds histogram" in text
+    assert 'espnpy_request_duration_seconds_bucket{family="core",le="0.05"} 1' in text
+    assert 'espnpy_request_duration_seconds_bucket{family="core",le="+Inf"} 2' in text
+    assert 'espnpy_requests_total{family="core"} 2' in text
+    assert 'espnpy_responses_total{family="core",status="error"} 1' in text
+    assert 'espnpy_response_bytes_total{family="core"} 512' in text
+    assert 'espnpy_cache_misses_total{family="scoreboard"} 1' in text
+    registry.reset()
+    assert registry.to_dict() == {}
@@ -0,0 +1,100 @@
+import pytest
+from espnpy import ESPNClient
+from espnpy import extractors
+from espnpy.columnar import ATHLETE_SCHEMA, GAME_SCHEMA, STANDING_SCHEMA, TEAM_SCHEMA, field_names
+
+from .test_columnar import SCOREBOARD, STANDINGS, _Response
+
+
+def test_specs_follow_schemas():
+    assert extractors.ATHLETE_SPEC.names == field_names(ATHLETE_SCHEMA)
+    assert extractors.TEAM_SPEC.names == field_names(TEAM_SCHEMA)
+    assert extractors.GAME_SPEC.names == field_names(GAME_SCHEMA)
+    assert extractors.STANDING_SPEC.names == field_names(STANDING_SCHEMA)
+    assert extractors.RANKING_SPEC.names == field_names(STANDING_SCHEMA)
+
+
+def test_standing_logo_falls_back_to_the_flag_only_without_logos():
+    sources = [
+        {"entry": {"team": {"logos": [{"href": "logo.png"}], "flag": {"href": "flag.png"}}}},
+        {"entry": {"team": {"logos": [{"href": None}], "flag": {"href": "flag.png"}}}},
+        {"entry": {"athlete": {"flag": {"href": "flag.png"}}}},
+    ]
+    assert [row["logo"] for row in extractors.STANDING_SPEC.dicts(sources, ["logo"])] == ["logo.png", None, "flag.png"]
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_projection_skips_unrequested_extraction():
+    # Projections that don't touch the home/away sides never walk the competitors
+    assert "d_sides" not in extractors.GAME_SPEC.source(["id", "status", "clock"])
+    assert "d_sides" in extractors.GAME_SPEC.source(["id", "homeScore"])
+
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return SCOREBOARD
+
+        client._get = fake_get
+        ticker = await client.nba.scoreboard(fields=["id", "status", "clock"])
+        assert ticker[0] == {"id": "400", "status": "Final", "clock": "0:00"}
+
+        scores = await client.nba.scoreboard(fields=["id", "homeScore", "awayScore", "homeTeam"])
+        assert scores[1] == {"id": "401", "homeScore": "110", "awayScore": "99", "homeTeam": "Home 1"}
+
+        full = await client.nba.scoreboard()
+        assert [{k: g[k] for k in ("id", "homeScore")} for g in full] == [{k: g[k] for k in ("id", "homeScore")} for g in scores]
+
+        with pytest.raises(ValueError):
+            await client.nba.scoreboard(fields=["id", "nope"])
+        with pytest.raises(ValueError):
+            await client.nba.scoreboard(fields=["id"], output="record")
+
+
+@pytest.mark.asyncio
+async def test_standings_projection_still_sorts_by_rank():
+    async with ESPNClient() as client:
+        async def fake_session_get(url, params=None):
+            return _Response(STANDINGS)
+
+        client._session.get = fake_session_get
+        standings = await client.nba.standings(fields=["name"])
+        assert standings == [{"name": "Better"}, {"name": "Worse"}]
+
+
+@pytest.mark.asyncio
+async def test_summary_projection_skips_sections():
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return {"pickcenter": [{"provider": {"name": "consensus"}, "spread": -3.5}], "boxscore": {"players": "malformed"}}
+
+        client._get = fake_get
+        summary = await client.nba.game_summary("401", fields=["id", "odds"])
+        assert summary == {"id": "401", "odds": {"provider": "consensus", "details": None, "overUnder": None, "spread": -3.5}}
+
+
+def test_spec_compiles_paths_defaults_and_derived_values():
+    calls = []
+
+    def total(values):
+        calls.append(values)
+        return sum(values or ())
+
+    spec = extractors.Spec("example", {
+        "name": "team.name",
+        "logo": "team.logos.0.href",
+        "wins": extractors.P(("record", "w.l"), default="0"),
+        "label": extractors.First("team.nickname", "team.name", default="?"),
+        "total": "$total",
+        "kind": extractors.Const("team"),
+    }, derived={"total": extractors.Fn(total, "points")})
+
+    row = spec.compile()
+    assert row({"team": {"name": "A", "logos": [{"href": "l"}]}, "points": [1, 2]}) == ("A", "l", "0", "A", 3, "team")
+    assert row({"team": None, "record": {"w.l": "5"}}) == (None, None, "5", "?", 0, "team")
+    assert spec.compile(["name"]) is spec.compile(["name"])
+
+    calls.clear()
+    assert spec.dicts([{"team": {"name": "B"}}], ["name"]) == [{"name": "B"}]
+    assert calls == []  # The derived total is only computed when a selected field needs it
+
+    with pytest.raises(ValueError):
+        spec.compile(["nope"])
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.ratelimit import RateLimiter
+
+
+def _client(mock_session, rate_limit):
+    client = ESPNClient(rate_limit=rate_limit)
+    sent = []
+
+    def handler(request):
+        sent.append((request.url.host, time.monotonic()))
+        return httpx.Response(200, json={})
+
+    mock_session(client, handler)
+    return client, sent
+
+
+def test_burst_then_sustained_rate_per_host(mock_session):
+    client, sent = _client(mock_session, RateLimiter(rate=50, burst=2))
+
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(*[client.get_url("https://site.api.espn.com/apis/site/v2/x") for _ in range(6)])
+        # The burst goes out at once, the other 4 are spaced 20ms apart
+        assert time.monotonic() - start >= 0.07
+        times = sorted(t for _, t in sent)
+        assert times[1] - times[0] < 0.01
+
+        # Another host has its own bucket, so it isn't held back
+        start = time.monotonic()
+        await client.get_url("https://sports.core.api.espn.com/v2/sports")
+        assert time.monotonic() - start < 0.01
+
+    asyncio.run(main())
+    stats = client.rate_limiter.stats()
+    assert stats["site.api.espn.com"]["requests"] == 6
+    assert stats["site.api.espn.com"]["waited"] == 4
+    assert stats["site.api.espn.com"]["wait_time"] == pytest.approx(0.2, abs=0.01)
+    assert stats["sports.core.api.espn.com"] == {"requests": 1, "waited": 0, "wait_time": 0.0}
+    assert client.rate_limiter.wait_time == stats["site.api.espn.com"]["wait_time"]
+
+
+def test_rate_limit_shorthands_and_host_overrides():
+    assert ESPNClient().rate_limiter is None
+    assert ESPNClient(rate_limit=True).rate_limiter.rate == 10
+    limiter = ESPNClient(rate_limit=5).rate_limiter
+    assert (limiter.rate, limiter.burst) == (5, 5)
+
+    limiter = RateLimiter(rate=1, burst=1, hosts={"fast": (100, 3)})
+    assert [limiter.reserve("fast") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve("fast") == pytest.approx(0.01, abs=0.001)
+    assert limiter.reserve("slow") == 0.0
+    assert limiter.reserve("slow") == pytest.approx(1.0, abs=0.01)
+
+
+def test_cancelled_waiter_gives_its_token_back():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    async def main():
+        await limiter.acquire("a")
+        waiter = asyncio.ensure_future(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # Only the first request's token is spent, so the next one waits ~100ms rather than ~200ms
+        assert limiter.reserve("a") == pytest.approx(0.1, abs=0.01)
+
+    asyncio.run(main())
+
+
+def test_requests_queued_locally_take_no_token_or_shared_slot(mock_session):
+    limiter = RateLimiter(rate=1000, max_in_flight=10)
+    client = ESPNClient(rate_limit=limiter, max_concurrency=1, interactive_reserve=0)
+    seen = []
+
+    def handler(request):
+        # Only the request being sent holds a token and a shared slot; the two queued behind it hold neither
+        seen.append((limiter.stats()["site.api.espn.com"]["requests"], limiter.backend._leases))
+        return httpx.Response(200, json={})
+
+    mock_session(client, handler)
+
+    async def main():
+        await asyncio.gather(*[client.get_url("https://site.api.espn.com/apis/site/v2/x") for _ in range(3)])
+
+    asyncio.run(main())
+    assert seen == [(1, 1), (2, 1), (3, 1)]
@@ -0,0 +1,29 @@
+import pytest
+from espnpy import ESPNClient
+from espnpy.columnar import RECORD_TYPES, field_names
+from espnpy.records import Game
+
+from .test_columnar import SCOREBOARD
+
+
+def test_record_fields_match_schemas():
+    for schema, record in RECORD_TYPES.items():
+        assert record.__slots__ == field_names(schema)
+        instance = record(*range(len(schema)))
+        assert not hasattr(instance, "__dict__")
+        assert list(instance.to_dict()) == list(field_names(schema))
+
+
+@pytest.mark.asyncio
+async def test_record_output_round_trips_to_dicts():
+    async with ESPNClient() as client:
+        async def fake_get(endpoint, params=None, base_url=None):
+            return SCOREBOARD
+
+        client._get = fake_get
+        games = await client.nba.scoreboard()
+        records = await client.nba.scoreboard(output="record")
+
+        assert all(isinstance(g, Game) for g in records)
+        assert records[0].homeTeam == "Home 0"
+        assert [g.to_dict() for g in records] == games
@@ -0,0 +1,86 @@
+import asyncio
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.scheduling import PriorityScheduler, current_priority, priority
+
+
+def test_interactive_requests_overtake_a_bulk_crawl(mock_session):
+    client = ESPNClient(max_concurrency=4, interactive_reserve=0.5)
+    in_flight = []
+    release = None
+
+    async def handler(request):
+        in_flight.append(request.url.path)
+        if "bulk" in request.url.path:
+            await release.wait()
+        in_flight.remove(request.url.path)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    mock_session(client, handler)
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        with priority("bulk"):
+            crawl = asyncio.gather(*[client.get_url(f"https://sports.core.api.espn.com/bulk/{i}") for i in range(20)])
+        await asyncio.sleep(0.01)
+        # The crawl only gets the unreserved half of the pool...
+        assert len(in_flight) == 2
+        # ...so interactive requests go straight out instead of queueing behind 18 bulk ones
+        assert await asyncio.wait_for(client.get_url("https://sports.core.api.espn.com/live"), 0.5) == {"path": "/live"}
+        release.set()
+        assert len(await crawl) == 20
+
+    asyncio.run(main())
+
+
+def test_waiting_interactive_requests_are_dispatched_before_bulk():
+    scheduler = PriorityScheduler(limit=1)
+    order = []
+
+    async def request(name, lane):
+        async with scheduler.slot(lane):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def main():
+        await scheduler.acquire("bulk")
+        waiting = [asyncio.ensure_future(request(name, lane)) for name, lane in [("b1", "bulk"), ("b2", "bulk"), ("i1", "interactive")]]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*waiting)
+
+    asyncio.run(main())
+    assert order == ["i1", "b1", "b2"]
+    assert scheduler.in_flight == 0
+
+
+def test_cancelled_waiters_release_their_place():
+    scheduler = PriorityScheduler(limit=1)
+
+    async def main():
+        await scheduler.acquire("interactive")
+        interactive = asyncio.ensure_future(scheduler.acquire("interactive"))
+        bulk = asyncio.ensure_future(scheduler.acquire("bulk"))
+        await asyncio.sleep(0)
+        interactive.cancel()
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.wait_for(bulk, 0.5)
+        assert scheduler.in_flight == 1
+
+    asyncio.run(main())
+
+
+def test_priority_context_and_validation():
+    assert current_priority() == "interactive"
+    with priority("bulk"):
+        assert current_priority() == "bulk"
+    assert current_priority() == "interactive"
+    with pytest.raises(ValueError):
+        with priority("urgent"):
+            pass
+    with pytest.raises(ValueError):
+        ESPNClient(interactive_reserve=1)
@@ -0,0 +1,146 @@
+import asyncio
+import pytest
+from datetime import date, timedelta
+from espnpy import ESPNClient
+
+
+def _fake_scoreboard(games_per_day: int, calls: list):
+    """Build a fake `_get` that serves `games_per_day` games for every date in the requested range."""
+    async def fake_get(endpoint, params=None, base_url=None):
+        calls.append(params["dates"])
+        if "-" in params["dates"]:
+            first, last = params["dates"].split("-")
+        else:
+            first = last = params["dates"]
+        start = date(int(first[:4]), int(first[4:6]), int(first[6:]))
+        end = date(int(last[:4]), int(last[4:6]), int(last[6:]))
+
+        events = []
+        day = start
+        while day <= end:
+            for n in range(games_per_day):
+                events.append({"id": f"{day:%Y%m%d}{n}", "date": f"{day:%Y-%m-%d}T19:00Z", "competitions": [{}]})
+            day += timedelta(days=1)
+        return {"leagues": [{"slug": "nba"}], "events": events[:params["limit"]]}
+    return fake_get
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_range_chunks_requests():
+    async with ESPNClient() as client:
+        calls = []
+        client._get = _fake_scoreboard(games_per_day=8, calls=calls)
+        games = await client.get_scoreboard_range("nba", "20231024", "20240414", skip_empty=False)
+
+        # 174 days split into 7-day chunks is 25 requests, not 174
+        assert len(calls) == 25
+        assert len(games) == 174 * 8
+        assert len({g["id"] for g in games}) == len(games)
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_range_splits_truncated_chunks():
+    async with ESPNClient() as client:
+        calls = []
+        client._get = _fake_scoreboard(games_per_day=3, calls=calls)
+        games = await client.get_scoreboard_range("nba", "20240101", "20240107", limit=10, skip_empty=False)
+
+        # The full week (21 games) hits the limit of 10, so it is bisected until every chunk fits
+        assert calls[0] == "20240101-20240107"
+        assert len(games) == 21
+        assert [g["id"] for g in games] == sorted(g["id"] for g in games)
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_range_rejects_inverted_dates():
+    async with ESPNClient() as client:
+        with pytest.raises(ValueError, match="must not be before"):
+            await client.get_scoreboard_range("nba", "20240201", "20240101")
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_range_uses_cached_calendar():
+    async with ESPNClient() as client:
+        calls = []
+        game_days = ["2024-01-02T08:00Z", "2024-01-05T08:00Z", "2024-01-20T08:00Z"]
+
+        async def fake_get(endpoint, params=None, base_url=None):
+            calls.append(params["dates"])
+            if params["limit"] == 1:
+                return {"leagues": [{
+                    "calendarType": "day",
+                    "calendarIsWhitelist": True,
+                    "calendarStartDate": "2023-10-01T07:00Z",
+                    "calendarEndDate": "2024-06-30T06:59Z",
+                    "season": {"year": 2024},
+                    "calendar": game_days,
+                }], "events": []}
+            return {"events": [{"id": params["dates"], "competitions": [{}]}]}
+
+        client._get = fake_get
+        await client.get_scoreboard_range("nba", "20240101", "20240131", chunk_days=2)
+        await client.get_scoreboard_range("nba", "20240101", "20240131", chunk_days=2)
+
+        # The calendar is fetched once; each call then only covers the 3 game days in 2 requests
+        assert calls == [
+            "20240101",
+            "20240102-20240105", "20240120",
+            "20240102-20240105", "20240120",
+        ]
+        calendar = await client.get_season_calendar("nba", season="2024")
+        assert calendar["dates"] == ["20240102", "20240105", "20240120"]
+        assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calendar_lookups_share_one_download():
+    async with ESPNClient() as client:
+        calls = []
+
+        async def fake_get(endpoint, params=None, base_url=None):
+            calls.append(endpoint)
+            await asyncio.sleep(0.01)
+            if "seasons" in endpoint:
+                return {"startDate": "2023-10-01T07:00Z"}
+            return {"leagues": [{
+                "calendarType": "day",
+                "calendarStartDate": "2023-10-01T07:00Z",
+                "calendarEndDate": "2024-06-30T06:59Z",
+                "season": {"year": 2024},
+                "calendar": ["2024-01-02T08:00Z"],
+            }]}
+
+        client._get = fake_get
+        first, second = await asyncio.gather(
+            client.get_season_calendar("nba", season="2024"),
+            client.get_season_calendar("nba", season="2024"),
+        )
+
+        assert first == second and first is not second
+        assert calls == ["/sports/basketball/leagues/nba/seasons/2024", "sports/basketball/nba/scoreboard"]
+
+
+@pytest.mark.asyncio
+async def test_calendar_cache_keeps_one_copy_per_season():
+    async with ESPNClient() as client:
+        calls = []
+
+        async def fake_get(endpoint, params=None, base_url=None):
+            calls.append(params["dates"])
+            return {"leagues": [{
+                "calendarType": "day",
+                "calendarStartDate": "2023-10-01T07:00Z",
+                "calendarEndDate": "2024-06-30T06:59Z",
+                "season": {"year": 2024},
+                "calendar": ["2024-01-02T08:00Z"],
+            }]}
+
+        client._get = fake_get
+        # A date outside the season's range can't be served from the cache, but re-fetching it doesn't add a copy
+        for _ in range(3):
+            calendar = await client.get_season_calendar("nba", date="20230901")
+        assert len(calls) == 3
+        assert len(client._calendar_cache["nba"]) == 1
+
+        calendar["dates"].clear()
+        assert (await client.get_season_calendar("nba", date="20240102"))["dates"] == ["20240102"]
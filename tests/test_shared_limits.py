@@ -0,0 +1,119 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+from espnpy.ratelimit import MemoryBackend, RateLimiter, SQLiteBackend
+
+# Each worker process takes 5 tokens from the shared bucket and prints how many went out without waiting
+WORKER = """
+import sys
+import time
+from espnpy.ratelimit import MemoryBackend, RateLimiter, SQLiteBackend
+limiter = RateLimiter(rate=0.01, burst=5, backend=SQLiteBackend(sys.argv[1]))
+print(sum(limiter.reserve("site.api.espn.com") == 0 for _ in range(5)))
+"""
+
+
+def test_processes_share_one_bucket(tmp_path):
+    path = str(tmp_path / "limits.db")
+    workers = [subprocess.Popen([sys.executable, "-c", WORKER, path], stdout=subprocess.PIPE, text=True) for _ in range(4)]
+    immediate = [int(worker.communicate()[0]) for worker in workers]
+    # With per-process buckets this would be 20; shared, only the burst of 5 goes out at once
+    assert sum(immediate) == 5
+
+
+def test_limiters_on_the_same_file_share_rate_but_not_counters(tmp_path):
+    path = str(tmp_path / "limits.db")
+    first = RateLimiter(rate=10, burst=2, backend=SQLiteBackend(path))
+    second = RateLimiter(rate=10, burst=2, backend=SQLiteBackend(path))
+    assert first.reserve("a") == 0 and first.reserve("a") == 0
+    assert second.reserve("a") == pytest.approx(0.1, abs=0.01)
+    assert second.reserve("b") == 0  # Hosts still have separate buckets
+    second.refund("a")
+    assert first.reserve("a") == pytest.approx(0.1, abs=0.01)
+    assert first.stats()["a"]["requests"] == 3
+    assert second.stats()["a"]["requests"] == 0
+
+
+def test_shared_in_flight_cap(tmp_path):
+    path = str(tmp_path / "limits.db")
+    first = RateLimiter(rate=1000, backend=SQLiteBackend(path), max_in_flight=1)
+    second = RateLimiter(rate=1000, backend=SQLiteBackend(path), max_in_flight=1)
+    order = []
+
+    async def request(limiter, name, hold, delay=0.0):
+        await asyncio.sleep(delay)  # Backend calls run in threads, so arrival order needs a head start
+        async with limiter.slot("a"):
+            order.append(f"{name} start")
+            await asyncio.sleep(hold)
+            order.append(f"{name} end")
+
+    async def main():
+        await asyncio.gather(request(first, "first", 0.05), request(second, "second", 0, delay=0.01))
+
+    asyncio.run(main())
+    assert order == ["first start", "first end", "second start", "second end"]
+    assert second.wait_time >= 0.03
+
+
+def test_slots_of_dead_processes_are_reclaimed(tmp_path):
+    path = str(tmp_path / "limits.db")
+    code = "import sys; from espnpy.ratelimit import SQLiteBackend; assert SQLiteBackend(sys.argv[1]).try_lease(1)"
+    subprocess.run([sys.executable, "-c", code, path], check=True)
+    # The worker exited while holding the only slot
+    assert SQLiteBackend(path).try_lease(1) is not None
+
+
+class SlowBackend(MemoryBackend):
+    """A backend whose calls block for a while, like a busy database or a far-away Redis."""
+
+    blocking = True
+
+    def reserve(self, key, rate, burst):
+        time.sleep(0.05)
+        return super().reserve(key, rate, burst)
+
+    def try_lease(self, limit):
+        time.sleep(0.05)
+        return super().try_lease(limit)
+
+
+def test_blocking_backends_run_off_the_event_loop():
+    limiter = RateLimiter(rate=1000, backend=SlowBackend(), max_in_flight=4)
+    ticks = []
+
+    async def ticker():
+        for _ in range(8):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def request():
+        async with limiter.slot("a"):
+            pass
+
+    async def main():
+        await asyncio.gather(ticker(), request())
+
+    asyncio.run(main())
+    # Had the backend run on the loop, the ticker would have stalled for 100ms
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.05
+    assert limiter.backend._leases == 0
+
+
+def test_cancelled_reservations_are_given_back():
+    backend = SlowBackend()
+    limiter = RateLimiter(rate=1000, burst=1, backend=backend, max_in_flight=1)
+
+    async def main():
+        task = asyncio.ensure_future(limiter.acquire("a"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.15)  # The reservation finishes in its thread, then is refunded
+
+    asyncio.run(main())
+    assert backend._buckets["a"][0] == pytest.approx(1, abs=0.01)
+    assert limiter.stats()["a"]["requests"] == 0
@@ -0,0 +1,64 @@
+from espnpy.stats import expand_stat, parse_clock, parse_innings, parse_number, parse_pair, parse_stats, parse_table
+
+
+def test_scalar_parsers():
+    assert parse_number("1,024") == 1024
+    assert parse_number("45.5%") == 45.5
+    assert parse_number("+7") == 7
+    assert parse_number("-3") == -3
+    assert parse_number("--") is None
+    assert parse_clock("38:21") == 38.35
+    assert parse_clock("36") == 36
+    assert parse_innings("6.2") == 6.6667
+    assert parse_pair("5-12") == (5, 12)
+    assert parse_pair("20/33") == (20, 33)
+    assert parse_pair("--") == (None, None)
+
+
+def test_parse_table_uses_sport_schema():
+    labels = ["MIN", "FG", "3PT", "+/-", "PTS"]
+    rows = [
+        ["38:21", "10-21", "4-9", "+12", "30"],
+        ["--", "0-0", "0-0", "-3", "0"],
+    ]
+    names, parsed = parse_table(labels, rows, sport="basketball")
+
+    assert names == ["MIN", "FGM", "FGA", "3PM", "3PA", "+/-", "PTS"]
+    assert parsed[0] == [38.35, 10, 21, 4, 9, 12, 30]
+    assert parsed[1] == [None, 0, 0, 0, 0, -3, 0]
+
+
+def test_unknown_labels_are_detected_from_values():
+    names, parsed = parse_table(["3rd down eff", "TOP", "YDS"], [["4-12", "32:10", "3,587"]])
+
+    assert names == ["3rd down eff Made", "3rd down eff Attempted", "TOP", "YDS"]
+    assert parsed == [[4, 12, 32.1667, 3587]]
+    assert expand_stat("C/ATT", "20/33", sport="football") == [("CMP", 20), ("ATT", 33)]
+
+
+def test_numeric_boxscore():
+    from espnpy import ESPNClient
+
+    box = {
+        "teams": [{"team": {"id": "1"}, "statistics": [{"label": "FG", "displayValue": "40-88"}, {"label": "Field Goal %", "displayValue": "45.5"}]}],
+        "players": [{
+            "team": {"id": "1"},
+            "statistics": [{
+                "labels": ["MIN", "FG", "PTS"],
+                "athletes": [{"athlete": {"id": "10"}, "stats": ["38:21", "10-21", "30"]}],
+            }],
+        }],
+    }
+    numeric = ESPNClient()._standardize_boxscore(box, "401", numeric=True, sport="basketball")
+
+    assert numeric["teams"][0]["stats"] == {"FGM": 40, "FGA": 88, "Field Goal %": 45.5}
+    assert numeric["players"][0]["stats"] == {"MIN": 38.35, "FGM": 10, "FGA": 21, "PTS": 30}
+
+
+def test_schema_pairs_fall_back_to_numbers_and_signed_pairs_are_detected():
+    # Passing SACKS is a sacks-yards pair, defensive SACKS a plain number
+    assert parse_stats({"SACKS": "2-14"}, sport="football") == {"SACKS": 2, "SACKYDS": 14}
+    assert parse_stats({"SACKS": "1.5"}, sport="football") == {"SACKS": 1.5}
+    assert parse_stats({"SACKS": "--"}, sport="football") == {"SACKS": None, "SACKYDS": None}
+
+    assert parse_table(["FG"], [["-3--5"]]) == (["FGM", "FGA"], [[-3, -5]])
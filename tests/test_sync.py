@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from espnpy import SyncESPNClient
+
+from .test_columnar import SCOREBOARD
+
+
+def _mock_sync_client(mock_session, requests):
+    espn = SyncESPNClient()
+
+    def handler(request):
+        requests.append(threading.current_thread().name)
+        return httpx.Response(200, json=SCOREBOARD)
+
+    mock_session(espn.aio, handler)
+    return espn
+
+
+def test_sync_calls_share_one_background_loop_and_session(mock_session):
+    requests = []
+    with _mock_sync_client(mock_session, requests) as espn:
+        games = espn.nba.scoreboard(fields=["id", "homeTeam"])
+        assert games[0] == {"id": "400", "homeTeam": "Home 0"}
+        assert espn.get_scoreboard("nba", fields=["id"]) == [{"id": "400"}, {"id": "401"}, {"id": "402"}]
+        assert espn.nba is espn.nba
+
+        sessions = {id(session) for session in espn.many([_session(espn) for _ in range(3)])}
+        assert len(sessions) == 1
+    assert requests == ["espnpy-sync-loop"] * 2
+    assert not espn._thread.is_alive()
+    espn.close()  # Closing twice is harmless
+
+
+def test_many_runs_calls_concurrently_and_can_collect_errors(mock_session):
+    requests = []
+    with _mock_sync_client(mock_session, requests) as espn:
+        boards = espn.many([espn.aio.nba.scoreboard(date=d, fields=["id"]) for d in ("20240101", "20240102", "20240103")])
+        assert len(boards) == 3 and boards[0][0] == {"id": "400"}
+
+        results = espn.many([espn.aio.nba.scoreboard(fields=["id"]), espn.aio.get_scoreboard("nba", output="csv")], return_exceptions=True)
+        assert results[0][0] == {"id": "400"}
+        assert isinstance(results[1], ValueError)
+
+        with pytest.raises(ValueError):
+            espn.nba.scoreboard(output="csv")
+
+
+async def _session(espn):
+    return espn.aio._session
+
+
+def test_timeouts_cancel_the_call_on_the_background_loop(mock_session):
+    events = []
+    espn = SyncESPNClient(timeout=0.05)
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        return httpx.Response(200, json={})
+
+    mock_session(espn.aio, handler)
+    with espn:
+        with pytest.raises(TimeoutError):
+            espn.get_url("https://site.api.espn.com/apis/site/v2/x")
+        time.sleep(0.05)
+        assert events == ["cancelled"]
+
+
+def test_calls_from_the_loop_thread_raise_instead_of_deadlocking(mock_session):
+    with _mock_sync_client(mock_session, []) as espn:
+        async def callback():
+            return espn.get_url("https://site.api.espn.com/apis/site/v2/x")
+
+        with pytest.raises(RuntimeError, match="own event loop"):
+            espn.run(callback())
@@ -0,0 +1,88 @@
+import asyncio
+
+import httpx
+from espnpy import ESPNClient
+from espnpy.tracing import InMemoryExporter, Tracer, trace
+
+TEAMS = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams"
+
+
+def _client(mock_session, **kwargs):
+    client = ESPNClient(**kwargs)
+
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/teams"):
+            page = int(request.url.params["page"])
+            refs = [{"$ref": f"{TEAMS}/{page * 10 + i}"} for i in range(3)]
+            return httpx.Response(200, json={"items": refs, "pageCount": 2})
+        if path.endswith("/broken"):
+            return httpx.Response(500, json={})
+        return httpx.Response(200, json={"id": path.rsplit("/", 1)[1], "displayName": "Team"})
+
+    mock_session(client, handler)
+    return client
+
+
+def test_composite_call_records_a_request_tree(mock_session):
+    client = _client(mock_session, tracer=True)
+    asyncio.run(client.get_teams("nfl", fields=["id"]))
+
+    root = client.tracer.last
+    assert root.name == "get_teams" and root.kind == "call"
+    assert root.attrs == {"league": "nfl", "fields": ["id"]}
+    pages, refs = root.children
+    assert (pages.name, refs.name) == ("pages", "refs")
+    assert [span.status for span in pages.children] == ["200", "200"]
+    assert len(refs.children) == 6
+    assert all(span.kind == "request" and span.bytes > 0 for span in refs.children)
+    assert len(root.requests()) == 8
+    assert root.critical_path()[:2] == [root, refs]
+    assert root.wasted() == {"duplicates": 0, "failed": 0, "cancelled": 0}
+
+    explained = root.explain(max_children=4)
+    assert explained.startswith("get_teams(league='nfl', fields=['id'])")
+    assert "8 requests" in explained
+    assert "... 3 more" in explained
+    assert "Critical path: get_teams -> refs -> GET" in explained
+    assert root.to_dict()["children"][1]["children"][0]["status"] == "200"
+
+
+def test_trace_block_nests_calls_and_reports_waste(mock_session):
+    client = _client(mock_session)
+    exporter = InMemoryExporter()
+    assert client.tracer is None
+
+    async def main():
+        with trace("job") as root:
+            await client.get_url(f"{TEAMS}/1")
+            await client.get_url(f"{TEAMS}/1")
+            try:
+                await client.get_url(f"{TEAMS}/broken")
+            except httpx.HTTPStatusError:
+                pass
+            await client.get_league("nfl")
+        return root
+
+    root = asyncio.run(main())
+    assert [child.name for child in root.children] == ["GET", "GET", "GET", "get_league"]
+    assert root.children[3].children[0].kind == "request"
+    assert root.wasted() == {"duplicates": 1, "failed": 1, "cancelled": 0}
+    assert "Wasted: 1 duplicates, 1 failed" in root.explain()
+    # Without a client tracer, nothing is exported on its own
+    assert not exporter.spans
+
+
+def test_custom_exporter_and_no_overhead_when_off(mock_session):
+    exporter = InMemoryExporter(max_spans=1)
+    client = _client(mock_session, tracer=Tracer(exporter))
+
+    async def main():
+        await client.get_league("nfl")
+        await client.get_league("nba")
+
+    asyncio.run(main())
+    assert len(exporter.spans) == 1 and exporter.spans[0].attrs == {"league": "nba"}
+
+    untraced = _client(mock_session)
+    assert asyncio.run(untraced.get_league("nfl"))["id"] == "nfl"
@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+import pytest
+from espnpy import ESPNClient
+from espnpy.usage import usage
+
+LEAGUES = "https://sports.core.api.espn.com/v2/sports/soccer/leagues"
+
+
+def _client(mock_session):
+    client = ESPNClient(max_concurrency=3)
+
+    async def handler(request):
+        if request.url.path.endswith("/leagues"):
+            return httpx.Response(200, json={"items": [{"$ref": f"{LEAGUES}/{i}"} for i in range(6)]})
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[1], "name": "League"})
+
+    mock_session(client, handler)
+    return client
+
+
+def test_report_returns_the_result_and_its_cost(mock_session):
+    client = _client(mock_session)
+    leagues, report = asyncio.run(client.report(client.get_leagues("soccer")))
+    assert len(leagues) == 6
+    assert report.requests == 7
+    assert report.bytes > 0
+    assert report.errors == 0 and report.retries == 0 and report.cache_hits == 0
+    # The 6 $ref fetches went out together, up to the concurrency limit
+    assert report.peak_concurrency == 3
+    assert report.queue_time > 0
+    assert report.network_time >= 0.06
+    assert report.wall_time >= 0.02
+    assert report.wall_time == pytest.approx(report.parse_time + report.wait_time)
+    assert 0 < report.json_time <= report.parse_time
+    assert set(report.to_dict()) >= {"requests", "bytes", "wall_time", "parse_time", "wait_time", "peak_concurrency"}
+
+
+def test_reports_nest_and_count_cache_hits(mock_session):
+    client = _client(mock_session)
+    client._calendar_cache["nba"] = {("20231001", "20240630"): {"seasonYear": 2024, "startDate": "20231001", "endDate": "20240630"}}
+
+    async def main():
+        with usage() as outer:
+            await client.get_url(f"{LEAGUES}/1")
+            with usage() as inner:
+                await client.get_season_calendar("nba", season="2024")
+                await client.get_url(f"{LEAGUES}/2")
+        return outer, inner
+
+    outer, inner = asyncio.run(main())
+    assert (outer.requests, inner.requests) == (2, 1)
+    assert (outer.cache_hits, inner.cache_hits) == (1, 1)
+    assert "requests=2" in repr(outer)